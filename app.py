@@ -1,6 +1,178 @@
+import heapq
+import time
+
 import streamlit as st
-import pandas as pd
-from compuzone import CompuzoneParser, Product
+from compuzone import SORT_ORDERS, SORT_PRICE_ASC, SORT_SALES, CompuzoneParser, Product, parse_price
+from excel_export import XLSX_MIME, products_to_xlsx_bytes
+from facets import FACET_FIELDS, FACET_LABELS, FacetIndex, format_facet_value
+from search_index import TokenIndex
+
+PAGE_SIZES = [20, 50, 100]
+LIVE_PREVIEW_ROWS = 10
+LIVE_REFRESH_SECONDS = 0.3
+SEARCH_RESULT_LIMIT = 200  # 결과 수 입력의 기본값 (카테고리별 최대 제품 수)
+MAX_SEARCH_RESULT_LIMIT = 2000
+SEARCH_PAGES = 3  # 페이지 수 입력의 기본값 (카테고리별로 읽을 검색 결과 페이지 수)
+MAX_SEARCH_PAGES = 20
+
+
+def _sort_price_asc(product):
+    price = parse_price(product.price)
+    # "가격 문의"/품절 등 변환 불가능한 경우 맨 뒤로 보낸다 ("원부터"는 시작 가격 기준)
+    return (price is None, price or 0)
+
+
+def _sort_price_desc(product):
+    price = parse_price(product.price)
+    return (price is None, -(price or 0))
+
+
+RESULT_SORTS = {
+    "가격 낮은순": _sort_price_asc,
+    "가격 높은순": _sort_price_desc,
+    "제품명순": lambda p: p.name,
+}
+
+
+def _reset_page():
+    st.session_state.results_page = 1
+
+
+def get_facet_index():
+    """현재 검색 결과의 패싯 인덱스 (결과가 바뀔 때만 새로 만든다)"""
+    if st.session_state.get('facet_index_version') != st.session_state.results_version:
+        st.session_state.facet_index = FacetIndex(st.session_state.products)
+        st.session_state.facet_index_version = st.session_state.results_version
+    return st.session_state.facet_index
+
+
+def get_token_index():
+    """현재 검색 결과의 결과 내 검색용 역색인 (결과가 바뀔 때만 새로 만든다)"""
+    if st.session_state.get('token_index_version') != st.session_state.results_version:
+        st.session_state.token_index = TokenIndex(st.session_state.products)
+        st.session_state.token_index_version = st.session_state.results_version
+    return st.session_state.token_index
+
+
+def facet_widget_key(field):
+    # 결과가 바뀌면 이전 선택값이 새 옵션에 없을 수 있으므로 위젯을 새로 만든다
+    return f"facet_{field}_{st.session_state.results_version}"
+
+
+def show_facet_filters(index):
+    """값이 두 개 이상인 속성만 다중 선택 필터로 보여주고 현재 선택을 반환합니다."""
+    selection = {field: st.session_state.get(facet_widget_key(field), []) for field in FACET_FIELDS}
+    counts = index.counts(selection)
+    fields = [field for field in FACET_FIELDS if len(index.values(field)) > 1]
+    if not fields:
+        return {}
+
+    with st.expander("상세 필터", expanded=any(selection.values())):
+        cols = st.columns(min(len(fields), 3))
+        for i, field in enumerate(fields):
+            with cols[i % len(cols)]:
+                field_counts = counts[field]
+                selection[field] = st.multiselect(
+                    FACET_LABELS[field],
+                    index.values(field),
+                    key=facet_widget_key(field),
+                    format_func=lambda value, field=field, field_counts=field_counts:
+                        f"{format_facet_value(field, value)} ({field_counts.get(value, 0)})",
+                    on_change=_reset_page
+                )
+    return {field: values for field, values in selection.items() if values}
+
+
+def get_result_view(sort_label, filter_text, facet_selection):
+    """캐시된 검색 결과에 서버 쪽 정렬/필터를 적용한 목록을 반환합니다 (조건이 같으면 재사용)."""
+    facet_key = tuple(sorted((field, tuple(values)) for field, values in facet_selection.items()))
+    view_key = (st.session_state.results_version, sort_label, filter_text, facet_key)
+    if st.session_state.get('result_view_key') != view_key:
+        products = get_facet_index().filter(facet_selection) if facet_selection else st.session_state.products
+        if filter_text:
+            # 결과 내 검색은 토큰 역색인으로 로컬에서 처리 (새 요청 없음)
+            matched = get_token_index().search(filter_text)
+            matched_ids = {id(p) for p in matched}
+            products = [p for p in products if id(p) in matched_ids]
+        st.session_state.result_view = sorted(products, key=RESULT_SORTS[sort_label])
+        st.session_state.result_view_key = view_key
+    return st.session_state.result_view
+
+
+def product_rows(products):
+    """표에 보낼 행 목록을 만듭니다."""
+    return [
+        {
+            "제품명": p.name,
+            "가격": p.price,
+            "주요 사양": p.specifications,
+            "구매링크": p.product_link or None
+        }
+        for p in products
+    ]
+
+
+def show_product_table(target, products):
+    # pandas는 결과 표를 처음 그릴 때 불러온다 (검색 폼만 보는 사용자는 비용 없음)
+    import pandas as pd
+
+    target.dataframe(
+        pd.DataFrame(product_rows(products)),
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "구매링크": st.column_config.LinkColumn("구매링크", display_text="구매"),
+        }
+    )
+
+
+def stream_products(keyword, maker_codes, sort_type=SORT_SALES, min_price=None, max_price=None,
+                    limit=SEARCH_RESULT_LIMIT, pages=SEARCH_PAGES):
+    """제품을 파싱되는 대로 받으면서 지금까지의 최저가 목록을 실시간으로 갱신합니다.
+
+    정렬 순서와 가격 범위는 검색 요청에 그대로 넘겨 서버에서 먼저 거른다.
+    """
+    status = st.empty()
+    table = st.empty()
+    last_render = 0.0
+
+    if sort_type == SORT_PRICE_ASC:
+        # 최저가 검색은 상위 K개만 유지하며 필요한 만큼만 읽는다. 페이지마다 바뀐 상위 K개로 미리보기를 갱신
+        def show_top(top):
+            nonlocal last_render
+            now = time.monotonic()
+            if now - last_render >= LIVE_REFRESH_SECONDS:
+                status.info(f"최저가 제품을 찾는 중입니다... (현재 상위 {len(top)}개, 최저가 순 미리보기)")
+                show_product_table(table, top[:LIVE_PREVIEW_ROWS])
+                last_render = now
+
+        status.info("최저가 제품을 찾는 중입니다...")
+        products = st.session_state.parser.cheapest(keyword, limit, maker_codes, min_price=min_price,
+                                                    max_price=max_price, pages=pages, on_update=show_top)
+        status.empty()
+        table.empty()
+        return products
+
+    products = []
+
+    status.info("제품 정보를 검색 중입니다...")
+    products_iter = st.session_state.parser.iter_unique_products(
+        keyword, maker_codes, limit=limit, sort_type=sort_type,
+        min_price=min_price, max_price=max_price, pages=pages
+    )
+    for product in products_iter:
+        products.append(product)
+        now = time.monotonic()
+        if now - last_render >= LIVE_REFRESH_SECONDS:
+            cheapest = heapq.nsmallest(LIVE_PREVIEW_ROWS, products, key=_sort_price_asc)
+            status.info(f"제품 정보를 검색 중입니다... ({len(products)}개 발견, 최저가 순 미리보기)")
+            show_product_table(table, cheapest)
+            last_render = now
+
+    status.empty()
+    table.empty()
+    return products
+
 
 st.set_page_config(page_title="컴퓨존 상품 검색", layout="wide")
 
@@ -17,6 +189,8 @@ if 'selected_manufacturers' not in st.session_state:
     st.session_state.selected_manufacturers = {}
 if 'products' not in st.session_state:
     st.session_state.products = []
+if 'results_version' not in st.session_state:
+    st.session_state.results_version = 0
 
 # --- 1. Keyword Input using a Form ---
 with st.form(key="search_form"):
@@ -76,6 +250,22 @@ if st.session_state.manufacturers:
                 # 각 체크박스에 고유한 key를 할당합니다. Streamlit이 이 key를 사용해 상태를 관리합니다.
                 st.checkbox(manufacturer['name'], key=f"mfr_{i}")
         
+        # 검색 기준, 가격 범위 (0원은 제한 없음), 최대 결과 수, 읽을 페이지 수
+        opt1, opt2, opt3, opt4, opt5 = st.columns(5)
+        with opt1:
+            search_sort = st.selectbox("검색 기준", list(SORT_ORDERS), format_func=SORT_ORDERS.get,
+                                       key="search_sort")
+        with opt2:
+            min_price = st.number_input("최저 가격(원)", min_value=0, step=10000, key="search_min_price")
+        with opt3:
+            max_price = st.number_input("최고 가격(원)", min_value=0, step=10000, key="search_max_price")
+        with opt4:
+            result_limit = st.number_input("최대 결과 수", min_value=1, max_value=MAX_SEARCH_RESULT_LIMIT,
+                                           value=SEARCH_RESULT_LIMIT, step=50, key="search_limit")
+        with opt5:
+            search_pages = st.number_input("검색 페이지 수", min_value=1, max_value=MAX_SEARCH_PAGES,
+                                           value=SEARCH_PAGES, step=1, key="search_pages")
+        
         # 제품 검색 버튼
         product_search_button = st.form_submit_button("선택한 제조사로 제품 검색")
 
@@ -88,18 +278,22 @@ if st.session_state.manufacturers:
         
         if not selected_codes:
             st.warning("하나 이상의 제조사를 선택해주세요.")
+        elif min_price and max_price and min_price > max_price:
+            st.warning("최저 가격이 최고 가격보다 높습니다.")
         else:
-            with st.spinner('제품 정보를 검색 중입니다...'):
-                # 컴퓨존 검색만 실행
-                compuzone_products = st.session_state.parser.get_unique_products(
-                    st.session_state.keyword, selected_codes
-                )
-                
-                st.session_state.products = compuzone_products
-                
-                if not st.session_state.products:
-                    st.info("선택된 제조사의 제품을 찾을 수 없습니다.")
-                # 검색이 완료되면 페이지를 새로고침하여 결과를 즉시 표시합니다.
+            # 컴퓨존 검색만 실행 (파싱되는 대로 미리보기 표시)
+            compuzone_products = stream_products(st.session_state.keyword, selected_codes, search_sort,
+                                                 int(min_price) or None, int(max_price) or None,
+                                                 int(result_limit), int(search_pages))
+            
+            st.session_state.products = compuzone_products
+            st.session_state.results_version += 1
+            st.session_state.results_page = 1
+            
+            if not st.session_state.products:
+                st.info("선택된 제조사의 제품을 찾을 수 없습니다.")
+            else:
+                # 검색이 완료되면 페이지를 새로고침하여 전체 결과를 표시합니다.
                 st.rerun()
     
 
@@ -107,123 +301,44 @@ if st.session_state.manufacturers:
 if st.session_state.products:
     st.subheader(f"'{st.session_state.keyword}'에 대한 검색 결과")
 
-    # 가격순으로 정렬하기 위한 헬퍼 함수
-    def extract_price(product):
-        try:
-            # "원"과 ","를 제거하고 숫자로 변환
-            price_str = product.price.replace('원', '').replace(',', '')
-            return int(price_str)
-        except (ValueError, AttributeError):
-            # "가격 문의" 등 변환 불가능한 경우, 맨 뒤로 보내기 위해 무한대 값 반환
-            return float('inf')
-
-    # 제품 목록을 가격 오름차순으로 정렬
-    sorted_products = sorted(st.session_state.products, key=extract_price)
-    
-    # 데이터프레임 생성
-    data = []
-    for i, p in enumerate(sorted_products):
-        data.append({
-            "제품명": p.name,
-            "가격": p.price,
-            "주요 사양": p.specifications,
-            "구매링크": p.product_link if p.product_link else ""
-        })
-    
-    df = pd.DataFrame(data)
-    
-    # 클릭 가능한 링크로 데이터프레임 수정
-    df_with_links = df.copy()
-    for i, product in enumerate(sorted_products):
-        if product.product_link:
-            df_with_links.at[i, "구매링크"] = f'<a href="{product.product_link}" target="_blank">구매{i+1}</a>'
-        else:
-            df_with_links.at[i, "구매링크"] = "링크없음"
-    
-    # 다크모드와 라이트모드 모두 지원하는 테이블 스타일
-    st.markdown("""
-    <style>
-    .adaptive-table {
-        width: 100%;
-        border-collapse: collapse;
-        font-family: "Source Sans Pro", sans-serif;
-        font-size: 14px;
-        background-color: var(--background-color);
-        color: var(--text-primary-color);
-    }
-    
-    /* 라이트 모드 기본값 */
-    .adaptive-table {
-        --background-color: white;
-        --text-primary-color: rgb(38, 39, 48);
-        --header-bg-color: rgb(240, 242, 246);
-        --border-color: rgb(230, 234, 241);
-        --hover-bg-color: rgb(245, 245, 245);
-        --link-color: rgb(255, 75, 75);
-    }
-    
-    /* 다크 모드 감지 및 적용 */
-    @media (prefers-color-scheme: dark) {
-        .adaptive-table {
-            --background-color: rgb(14, 17, 23);
-            --text-primary-color: rgb(250, 250, 250);
-            --header-bg-color: rgb(38, 39, 48);
-            --border-color: rgb(68, 70, 84);
-            --hover-bg-color: rgb(38, 39, 48);
-            --link-color: rgb(255, 115, 115);
-        }
-    }
-    
-    /* 스트림릿 다크 테마 클래스 감지 */
-    [data-theme="dark"] .adaptive-table {
-        --background-color: rgb(14, 17, 23);
-        --text-primary-color: rgb(250, 250, 250);
-        --header-bg-color: rgb(38, 39, 48);
-        --border-color: rgb(68, 70, 84);
-        --hover-bg-color: rgb(38, 39, 48);
-        --link-color: rgb(255, 115, 115);
-    }
-    
-    .adaptive-table th {
-        background-color: var(--header-bg-color);
-        color: var(--text-primary-color);
-        font-weight: 600;
-        padding: 0.5rem 0.75rem;
-        text-align: left;
-        border-bottom: 1px solid var(--border-color);
-    }
-    
-    .adaptive-table td {
-        padding: 0.5rem 0.75rem;
-        border-bottom: 1px solid var(--border-color);
-        color: var(--text-primary-color);
-        background-color: var(--background-color);
-    }
-    
-    .adaptive-table tr:hover td {
-        background-color: var(--hover-bg-color);
-    }
-    
-    .adaptive-table a {
-        color: var(--link-color);
-        text-decoration: none;
-        font-weight: 600;
-        padding: 2px 6px;
-        border-radius: 3px;
-        border: 1px solid var(--link-color);
-        background-color: transparent;
-        transition: all 0.2s ease;
-    }
-    
-    .adaptive-table a:hover {
-        background-color: var(--link-color);
-        color: var(--background-color);
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    html_table = df_with_links.to_html(escape=False, index=False, classes='adaptive-table')
-    st.markdown(html_table, unsafe_allow_html=True)
+    ctrl1, ctrl2, ctrl3 = st.columns([2, 1, 1])
+    with ctrl1:
+        filter_text = st.text_input("결과 내 검색", key="results_filter", on_change=_reset_page,
+                                    placeholder="예: 2TB, Gen4, 삼성")
+    with ctrl2:
+        sort_label = st.selectbox("정렬", list(RESULT_SORTS), key="results_sort", on_change=_reset_page)
+    with ctrl3:
+        page_size = st.selectbox("페이지당 표시", PAGE_SIZES, key="results_page_size", on_change=_reset_page)
+
+    facet_selection = show_facet_filters(get_facet_index())
+    view = get_result_view(sort_label, filter_text.strip(), facet_selection)
+    page_count = max(1, -(-len(view) // page_size))
+    if st.session_state.get('results_page', 1) > page_count:
+        st.session_state.results_page = 1
+
+    page = st.number_input(f"페이지 (전체 {page_count}페이지, {len(view)}개)",
+                           min_value=1, max_value=page_count, step=1, key="results_page")
+    start = (page - 1) * page_size
+    page_products = view[start:start + page_size]
+
+    # 현재 페이지의 행만 브라우저로 보낸다
+    show_product_table(st, page_products)
+
+    # Excel 다운로드: 버튼을 눌렀을 때만 현재 정렬/필터 전체 기준으로 만든다
+    # (결과 내 검색어를 입력하거나 정렬을 바꿀 때마다 파일을 다시 만들지 않음)
+    excel_key = st.session_state.result_view_key
+    if st.session_state.get('excel_key') == excel_key:
+        st.download_button(
+            "Excel 다운로드",
+            data=st.session_state.excel_bytes,
+            file_name=f"compuzone_{st.session_state.keyword}.xlsx",
+            mime=XLSX_MIME
+        )
+    elif st.button("Excel 파일 만들기"):
+        with st.spinner("Excel 파일을 만드는 중..."):
+            st.session_state.excel_bytes = products_to_xlsx_bytes(view)
+        st.session_state.excel_key = excel_key
+        st.rerun()
 
     # Reset button
     if st.button("새로 검색하기"):
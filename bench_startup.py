@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""콜드 스타트 벤치마크: 모듈별 import 시간과 파서 생성 시간을 측정합니다.
+
+각 모듈을 새 파이썬 프로세스에서 `-X importtime`으로 불러와
+모듈 자체의 누적 import 시간과 함께 끌려 들어온 무거운 의존성을 보고합니다.
+
+예시:
+    python bench_startup.py
+    python bench_startup.py --repeat 5 compuzone app_deps
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# 벤치마크 대상 (이름: 실행할 코드)
+TARGETS = {
+    "compuzone": "import compuzone",
+    "parser_init": "import compuzone; compuzone.CompuzoneParser()",
+    "first_parse": "import compuzone; compuzone.parse_html(b'<ul><li class=\"li-obj\"></li></ul>')",
+    "price_history": "import price_history",
+    "watchlist": "import watchlist",
+    "cli": "import cli",
+    "excel_export": "import excel_export",
+    "facets": "import facets",
+    "search_index": "import search_index",
+    "product_detail": "import product_detail",
+    "app_deps": "import streamlit",
+}
+
+# 콜드 스타트에 영향을 주는 무거운 의존성
+HEAVY_MODULES = ("requests", "bs4", "soupsieve", "lxml", "pandas", "openpyxl", "streamlit")
+
+_IMPORTTIME_PATTERN = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)')
+
+
+def measure(code: str) -> Tuple[float, Dict[str, int]]:
+    """새 프로세스에서 코드를 실행하고 (전체 import 누적 시간 ms, 무거운 의존성별 누적 us)를 반환합니다."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)), env=env
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "실패")
+
+    total_us = 0
+    heavy: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_PATTERN.match(line)
+        if not match:
+            continue
+        cumulative, indent, module = int(match.group(2)), len(match.group(3)), match.group(4)
+        # 최상위(들여쓰기 1칸) 항목의 누적 시간 합이 전체 import 시간
+        if indent == 1:
+            total_us += cumulative
+        if module in HEAVY_MODULES:
+            heavy[module] = max(heavy.get(module, 0), cumulative)
+
+    return total_us / 1000, heavy
+
+
+def main(argv: List[str] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="콜드 스타트 import 시간 측정")
+    arg_parser.add_argument("targets", nargs="*", help=f"측정 대상 (기본: 전체) {', '.join(TARGETS)}")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="대상별 반복 횟수 (중앙값 보고)")
+    args = arg_parser.parse_args(argv)
+
+    names = args.targets or list(TARGETS)
+    print(f"{'대상':<16}{'import(ms)':>12}  무거운 의존성")
+    for name in names:
+        if name not in TARGETS:
+            print(f"{name:<16}{'알 수 없음':>12}")
+            continue
+        try:
+            runs = [measure(TARGETS[name]) for _ in range(max(1, args.repeat))]
+        except (RuntimeError, OSError) as e:
+            print(f"{name:<16}{'실패':>12}  {e}")
+            continue
+
+        total_ms = statistics.median(run[0] for run in runs)
+        heavy = runs[-1][1]
+        heavy_text = ", ".join(f"{module} {us / 1000:.1f}ms" for module, us in sorted(heavy.items(), key=lambda x: -x[1]))
+        print(f"{name:<16}{total_ms:>12.1f}  {heavy_text or '-'}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
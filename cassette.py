@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""HTTP 요청 녹화/재생 (카세트).
+
+RecordingSession은 실제 요청을 그대로 보내면서 요청(URL, 파라미터, 헤더)과 응답(상태, 헤더, 원본 바이트),
+걸린 시간을 gzip으로 압축한 JSONL 카세트 파일에 한 줄씩 기록합니다.
+ReplaySession은 카세트의 응답을 녹화 당시 도착한 시각(녹화 시작 후 offset + 지연 시간, 배율을 곱한 값)에 맞춰
+돌려주므로 요청 사이 간격까지 포함한 트래픽 모양을 재현합니다. 컴퓨존에 접속하지 않고도
+같은 트래픽으로 파싱/캐시 변경을 측정하거나 부하 시험을 할 수 있습니다.
+
+    with CassetteWriter("run.cassette.gz") as writer:
+        parser.session = RecordingSession(writer)
+        parser.search_products("SSD", SORT_SALES, [])
+
+    parser.session = ReplaySession(Cassette.load("run.cassette.gz"), latency_scale=0.5)
+"""
+import base64
+import datetime
+import gzip
+import json
+import os
+import threading
+import time
+import urllib.parse
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMiss(LookupError):
+    """카세트에 녹화되지 않은 요청"""
+
+
+class ReplayedRequestError(Exception):
+    """녹화 당시 실패했던 요청 (연결 오류, 타임아웃 등)을 재생할 때 발생"""
+
+
+def request_key(method: str, url: str, params=None) -> str:
+    """요청 식별 키: 메서드 + 파라미터를 정렬해 붙인 URL"""
+    if params:
+        items = params.items() if isinstance(params, dict) else params
+        query = urllib.parse.urlencode(sorted((str(k), str(v)) for k, v in items))
+        url = f"{url}{'&' if '?' in url else '?'}{query}"
+    return f"{method.upper()} {url}"
+
+
+class CassetteWriter:
+    """녹화한 요청을 카세트 파일에 바로 이어 씁니다 (응답 본문을 메모리에 모아 두지 않음).
+
+    여러 스레드의 RecordingSession이 하나의 writer를 함께 써도 됩니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self.count = 0
+        self._write_line({"version": CASSETTE_VERSION, "created": datetime.datetime.now().isoformat()})
+
+    def _write_line(self, data: Dict) -> None:
+        self._file.write(json.dumps(data, ensure_ascii=False) + "\n")
+
+    def offset(self) -> float:
+        """녹화 시작 후 지난 시간 (초)"""
+        return time.monotonic() - self._started
+
+    def write(self, entry: Dict) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._write_line(entry)
+            self.count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class RecordingSession:
+    """requests.Session을 감싸 모든 GET 요청과 응답을 카세트에 기록합니다."""
+
+    def __init__(self, writer: CassetteWriter, session=None):
+        if session is None:
+            import requests
+            from compuzone import DEFAULT_HEADERS
+
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+        self.writer = writer
+        self.session = session
+
+    @property
+    def headers(self):
+        return self.session.headers
+
+    def get(self, url: str, params=None, headers=None, **kwargs):
+        offset = self.writer.offset()
+        started = time.monotonic()
+        entry = {
+            "method": "GET",
+            "url": url,
+            "params": dict(params) if params else {},
+            "key": request_key("GET", url, params),
+            "offset": round(offset, 6),
+        }
+        try:
+            resp = self.session.get(url, params=params, headers=headers, **kwargs)
+        except Exception as e:
+            entry["elapsed"] = round(time.monotonic() - started, 6)
+            entry["error"] = f"{type(e).__name__}: {e}"
+            self.writer.write(entry)
+            raise
+
+        entry["elapsed"] = round(time.monotonic() - started, 6)
+        request = getattr(resp, 'request', None)
+        entry["request_headers"] = dict(request.headers) if request is not None else dict(headers or {})
+        entry["status"] = resp.status_code
+        entry["headers"] = dict(resp.headers)
+        entry["final_url"] = getattr(resp, 'url', url)
+        entry["body"] = base64.b64encode(resp.content).decode('ascii')
+        self.writer.write(entry)
+        return resp
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class CassetteResponse:
+    """재생한 응답 (requests.Response에서 파서가 쓰는 속성만 제공)"""
+
+    def __init__(self, entry: Dict):
+        self.status_code = entry.get("status", 200)
+        self.headers = entry.get("headers", {})
+        self.url = entry.get("final_url", entry["url"])
+        self.content = base64.b64decode(entry.get("body", ""))
+        self.elapsed = datetime.timedelta(seconds=entry.get("elapsed", 0.0))
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def encoding(self) -> str:
+        content_type = next((v for k, v in self.headers.items() if k.lower() == 'content-type'), "")
+        for part in content_type.split(';'):
+            name, _, value = part.strip().partition('=')
+            if name.lower() == 'charset' and value:
+                return value.strip('"')
+        return 'utf-8'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+    def raise_for_status(self) -> None:
+        if self.ok:
+            return
+        from requests import HTTPError
+
+        raise HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class Cassette:
+    """불러온 카세트. 같은 요청이 여러 번 녹화되어 있으면 녹화 순서대로 돌아가며 돌려줍니다."""
+
+    def __init__(self, entries: List[Dict]):
+        self.entries = entries
+        self._by_key: Dict[str, List[Dict]] = {}
+        for entry in entries:
+            self._by_key.setdefault(entry["key"], []).append(entry)
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._replay_started: Optional[float] = None
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """카세트를 불러옵니다. 녹화가 중간에 끊겨 파일 끝이 잘렸으면 온전한 항목까지만 씁니다."""
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"카세트 파일이 없습니다: {path}")
+        entries = []
+        line_no = 0
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except ValueError:
+                        # 잘린 마지막 줄
+                        print(f"카세트 {line_no}번째 줄을 읽을 수 없어 이전 항목까지만 사용합니다: {path}")
+                        break
+                    if line_no == 1 and "version" in data:
+                        if data["version"] > CASSETTE_VERSION:
+                            raise ValueError(f"지원하지 않는 카세트 버전: {data['version']}")
+                        continue
+                    entries.append(data)
+        except (EOFError, gzip.BadGzipFile, zlib.error) as e:
+            if line_no == 0 and not entries:
+                raise ValueError(f"카세트 파일을 읽을 수 없습니다: {e}")
+            print(f"카세트 파일이 잘려 있어 온전한 {len(entries)}개 항목만 사용합니다 ({path}): {e}")
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def next_entry(self, key: str) -> Dict:
+        candidates = self._by_key.get(key)
+        if not candidates:
+            raise CassetteMiss(f"녹화되지 않은 요청: {key}")
+        with self._lock:
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+        return candidates[index % len(candidates)]
+
+    def rewind(self) -> None:
+        with self._lock:
+            self._cursor.clear()
+            self._replay_started = None
+
+    def replay_clock(self) -> float:
+        """재생 시작 시각 (time.monotonic). 처음 부를 때 정해지며 이 카세트를 쓰는 모든 세션이 공유합니다."""
+        with self._lock:
+            if self._replay_started is None:
+                self._replay_started = time.monotonic()
+            return self._replay_started
+
+    def latency_stats(self) -> Tuple[int, float, float]:
+        """(요청 수, 평균 지연 초, 최대 지연 초)"""
+        latencies = [entry.get("elapsed", 0.0) for entry in self.entries]
+        if not latencies:
+            return 0, 0.0, 0.0
+        return len(latencies), sum(latencies) / len(latencies), max(latencies)
+
+
+class ReplaySession:
+    """카세트의 응답을 녹화 당시 도착 시각에 맞춰 돌려줍니다.
+
+    응답은 재생 시작 후 (offset + 지연 시간) × latency_scale 시각에 돌려주며, 그보다 늦게 요청하면
+    지연 시간 × latency_scale만큼은 기다립니다. 그래서 요청 간격과 동시 요청 모양이 녹화 때와 같게 재현됩니다.
+    latency_scale=0이면 기다리지 않습니다. 녹화 당시 실패한 요청은 ReplayedRequestError로 재현합니다.
+    여러 스레드에서 하나의 ReplaySession을 함께 써도 되며, 같은 카세트의 세션들은 재생 시계를 공유합니다.
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0):
+        self.cassette = cassette
+        self.latency_scale = max(0.0, latency_scale)
+        self.headers: Dict[str, str] = {}
+
+    def get(self, url: str, params=None, headers=None, **kwargs) -> CassetteResponse:
+        entry = self.cassette.next_entry(request_key("GET", url, params))
+        if self.latency_scale > 0:
+            started = self.cassette.replay_clock()
+            now = time.monotonic()
+            latency = entry.get("elapsed", 0.0) * self.latency_scale
+            due = started + (entry.get("offset", 0.0) + entry.get("elapsed", 0.0)) * self.latency_scale
+            delay = max(due - now, latency)
+            if delay > 0:
+                time.sleep(delay)
+        if entry.get("error"):
+            raise ReplayedRequestError(entry["error"])
+        return CassetteResponse(entry)
+
+    def close(self) -> None:
+        pass
+
+
+def open_session(record: Optional[CassetteWriter] = None, replay: Optional[Cassette] = None,
+                 latency_scale: float = 1.0):
+    """녹화/재생 설정에 맞는 세션을 만듭니다 (둘 다 없으면 None: 파서 기본 세션 사용)."""
+    if replay is not None:
+        return ReplaySession(replay, latency_scale)
+    if record is not None:
+        return RecordingSession(record)
+    return None
@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""컴퓨존 검색 배치 실행 (headless CLI).
+
+검색어를 파일 또는 표준입력에서 한 줄씩 읽어 워커 풀로 검색하고,
+결과 Product 행을 CSV / JSONL / Parquet 으로 바로 스트리밍합니다.
+완료된 검색어는 체크포인트 파일에 기록되어 중단 후 다시 실행하면 이어서 진행합니다.
+
+예시:
+    python cli.py -i keywords.txt -o result.jsonl
+    cat keywords.txt | python cli.py -o result.csv --workers 8 --checkpoint result.ckpt
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from compuzone import (
+    SORT_ORDERS, SORT_SALES, CompuzoneParser, Product, ResponseCache, SearchCategory, parse_price,
+)
+
+FIELDNAMES = ["keyword", "name", "price", "price_text", "specifications", "product_link"]
+# --enrich-details일 때 덧붙는 상세 사양 열 (JSON 문자열)
+DETAIL_FIELD = "detail_specs"
+DETAIL_BATCH_SIZE = 20  # 상세 사양을 한 번에 동시 요청할 제품 수
+
+
+def product_to_row(keyword: str, product: Product, details: bool = False) -> Dict:
+    row = {
+        "keyword": keyword,
+        "name": product.name,
+        "price": parse_price(product.price),
+        "price_text": product.price,
+        "specifications": product.specifications,
+        "product_link": product.product_link,
+    }
+    if details:
+        row[DETAIL_FIELD] = json.dumps(product.detail_specs or {}, ensure_ascii=False)
+    return row
+
+
+class CsvRowWriter:
+    def __init__(self, path: str, append: bool, fieldnames: List[str] = FIELDNAMES):
+        write_header = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames)
+        if write_header:
+            self._writer.writeheader()
+
+    def write(self, rows: List[Dict]) -> None:
+        self._writer.writerows(rows)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JsonlRowWriter:
+    def __init__(self, path: str, append: bool, fieldnames: List[str] = FIELDNAMES):
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, rows: List[Dict]) -> None:
+        for row in rows:
+            self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetRowWriter:
+    """row group 단위로 나눠 쓰므로 메모리에는 최대 row_group_size 행만 유지됩니다."""
+
+    def __init__(self, path: str, append: bool, fieldnames: List[str] = FIELDNAMES, row_group_size: int = 5000):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit("Parquet 출력에는 pyarrow가 필요합니다: pip install pyarrow")
+
+        self._pa = pyarrow
+        # Parquet 파일은 이어 쓸 수 없으므로 재개 시 새 파트 파일을 만든다
+        if append and os.path.exists(path):
+            stem, ext = os.path.splitext(path)
+            part = 1
+            while os.path.exists(f"{stem}.part{part}{ext}"):
+                part += 1
+            path = f"{stem}.part{part}{ext}"
+
+        self._schema = pyarrow.schema([
+            (name, pyarrow.int64() if name == "price" else pyarrow.string()) for name in fieldnames
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        self._row_group_size = row_group_size
+        self._buffer: List[Dict] = []
+
+    def write(self, rows: List[Dict]) -> None:
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self._row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            table = self._pa.Table.from_pylist(self._buffer, schema=self._schema)
+            self._writer.write_table(table)
+            self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+
+WRITERS = {
+    "csv": CsvRowWriter,
+    "jsonl": JsonlRowWriter,
+    "parquet": ParquetRowWriter,
+}
+
+
+def iter_keywords(stream: Iterable[str], done: Set[str]) -> Iterator[str]:
+    """빈 줄, 주석(#), 이미 완료된 검색어를 건너뛰며 검색어를 하나씩 읽습니다."""
+    seen = set()
+    for line in stream:
+        keyword = line.strip()
+        if not keyword or keyword.startswith('#') or keyword in done or keyword in seen:
+            continue
+        seen.add(keyword)
+        yield keyword
+
+
+def load_checkpoint(path: Optional[str]) -> Set[str]:
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path, encoding='utf-8') as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+class BatchRunner:
+    """검색어를 워커 풀로 실행하고 성공한 검색어의 행만 writer에 쓰고 체크포인트에 기록합니다."""
+
+    def __init__(self, writer, maker_codes: List[str], limit: int, workers: int,
+                 sort_type: str = SORT_SALES, checkpoint_path: Optional[str] = None,
+                 categories: Optional[List[SearchCategory]] = None, min_price: Optional[int] = None,
+                 max_price: Optional[int] = None, pages: int = 1, parse_pool=None,
+                 low_memory: bool = False, max_responses: Optional[int] = None, memory_probe=None,
+                 session_factory: Optional[Callable[[], object]] = None,
+                 response_cache: Optional[ResponseCache] = None, detail_cache=None):
+        self.writer = writer
+        self.maker_codes = maker_codes
+        self.limit = limit
+        self.workers = max(1, workers)
+        self.sort_type = sort_type
+        self.checkpoint_path = checkpoint_path
+        self.categories = categories
+        self.min_price = min_price
+        self.max_price = max_price
+        self.pages = pages
+        # 응답 파싱을 맡길 프로세스 풀 (parse_pool.ParsePool, 모든 스레드가 공유)
+        self.parse_pool = parse_pool
+        # 메모리 절약 모드: 스레드 전체에서 동시에 들고 있는 응답 수를 max_responses(기본: 워커 수)로 제한
+        self.low_memory = low_memory
+        self.response_slots = (
+            threading.BoundedSemaphore(max(1, max_responses or self.workers)) if low_memory else None
+        )
+        self.memory_probe = memory_probe
+        # 스레드별 파서에 넣을 세션 생성 함수 (cassette 녹화/재생용, 선택 사항)
+        self.session_factory = session_factory
+        # 검색 응답 캐시 (모든 스레드가 공유, 선택 사항)
+        self.response_cache = response_cache
+        # 상세 사양 캐시 (product_detail.DetailCache, 모든 스레드가 공유). 있으면 상세 사양을 보강한다
+        self.detail_cache = detail_cache
+        # requests.Session은 스레드마다 하나씩 사용
+        self._local = threading.local()
+        # 워커 스레드가 파싱되는 대로 writer에 쓰므로 쓰기는 한 번에 하나씩
+        self._write_lock = threading.Lock()
+
+    def _parser(self) -> CompuzoneParser:
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = CompuzoneParser(categories=self.categories, parse_pool=self.parse_pool,
+                                     low_memory=self.low_memory, response_slots=self.response_slots,
+                                     memory_probe=self.memory_probe, response_cache=self.response_cache)
+            if self.session_factory is not None:
+                session = self.session_factory()
+                if session is not None:
+                    parser.session = session
+            self._local.parser = parser
+        return parser
+
+    def _enricher(self):
+        enricher = getattr(self._local, 'enricher', None)
+        if enricher is None:
+            from product_detail import DetailEnricher
+            enricher = DetailEnricher(self._parser(), cache=self.detail_cache)
+            self._local.enricher = enricher
+        return enricher
+
+    def _product_rows(self, keyword: str, products: List[Product]) -> List[Dict]:
+        details = self.detail_cache is not None
+        if details:
+            self._enricher().enrich(products)
+        return [product_to_row(keyword, product, details) for product in products]
+
+    def _search(self, keyword: str) -> int:
+        """검색어 하나를 검색해 행을 기록하고 기록한 행 수를 반환합니다.
+
+        제품은 파싱되는 대로 행으로 바꾸지만, 출력에는 검색이 끝까지 성공한 뒤 한 번에 씁니다.
+        요청이 실패하면 예외를 올리고 아무 행도 쓰지 않으므로, 체크포인트에 없는 검색어를 재개할 때
+        다시 검색해도 행이 중복되지 않습니다 (검색어당 버퍼는 --limit 행 이하).
+        """
+        rows: List[Dict] = []
+        # 상세 사양을 보강할 때는 DETAIL_BATCH_SIZE개씩 모아 동시에 요청한다
+        batch_size = DETAIL_BATCH_SIZE if self.detail_cache is not None else 1
+        batch: List[Product] = []
+        products = self._parser().iter_products(keyword, self.sort_type, self.maker_codes, limit=self.limit,
+                                                min_price=self.min_price, max_price=self.max_price,
+                                                pages=self.pages, raise_errors=True)
+        for product in products:
+            batch.append(product)
+            if len(batch) >= batch_size:
+                rows.extend(self._product_rows(keyword, batch))
+                batch = []
+        if batch:
+            rows.extend(self._product_rows(keyword, batch))
+
+        with self._write_lock:
+            self.writer.write(rows)
+            self.writer.flush()
+        if self.memory_probe is not None:
+            self.memory_probe.mark("write")
+        return len(rows)
+
+    def run(self, keywords: Iterable[str]) -> int:
+        """모든 검색어를 처리하고 기록한 행 수를 반환합니다."""
+        total_rows = 0
+        # 동시에 대기하는 결과를 워커 수의 2배로 제한해 메모리를 일정하게 유지
+        max_in_flight = self.workers * 2
+        checkpoint = open(self.checkpoint_path, 'a', encoding='utf-8') if self.checkpoint_path else None
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                pending = {}
+                keyword_iter = iter(keywords)
+                exhausted = False
+
+                while pending or not exhausted:
+                    while not exhausted and len(pending) < max_in_flight:
+                        keyword = next(keyword_iter, None)
+                        if keyword is None:
+                            exhausted = True
+                            break
+                        pending[executor.submit(self._search, keyword)] = keyword
+
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        keyword = pending.pop(future)
+                        try:
+                            count = future.result()
+                        except Exception as e:
+                            print(f"검색 실패 ({keyword}), 체크포인트에 기록하지 않음: {e}", file=sys.stderr)
+                            continue
+
+                        total_rows += count
+                        print(f"[{keyword}] {count}개", file=sys.stderr)
+
+                        # 검색이 성공하고 결과가 모두 기록된 뒤에만 완료로 표시한다
+                        if checkpoint:
+                            checkpoint.write(keyword + "\n")
+                            checkpoint.flush()
+        finally:
+            if checkpoint:
+                checkpoint.close()
+
+        return total_rows
+
+
+def _detect_format(output: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    ext = os.path.splitext(output)[1].lower().lstrip('.')
+    return ext if ext in WRITERS else "jsonl"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="컴퓨존 검색 배치 실행")
+    arg_parser.add_argument("-i", "--input", default="-", help="검색어 파일 (한 줄에 하나, 기본: 표준입력)")
+    arg_parser.add_argument("-o", "--output", required=True, help="출력 파일 경로")
+    arg_parser.add_argument("-f", "--format", choices=sorted(WRITERS), help="출력 형식 (기본: 확장자로 판단)")
+    arg_parser.add_argument("--makers", default="", help="제조사 코드 (쉼표로 구분)")
+    arg_parser.add_argument("--limit", type=int, default=100, help="검색어당 최대 제품 수")
+    arg_parser.add_argument("--workers", type=int, default=4, help="동시 검색 워커 수")
+    arg_parser.add_argument("--sort", default=SORT_SALES,
+                            help=f"정렬 순서 (PreOrder: {', '.join(SORT_ORDERS)})")
+    arg_parser.add_argument("--min-price", type=int, help="최저 가격 (원)")
+    arg_parser.add_argument("--max-price", type=int, help="최고 가격 (원)")
+    arg_parser.add_argument("--pages", type=int, default=1, help="카테고리당 최대 페이지 수 (페이지당 100개)")
+    arg_parser.add_argument("--categories", default="",
+                            help="검색 카테고리 BigDivNo[/MediumDivNo] (쉼표로 구분, 기본: 4 컴퓨터부품)")
+    arg_parser.add_argument("--parse-processes", type=int, default=0,
+                            help="응답 파싱 프로세스 수 (0: 검색 스레드에서 파싱, -1: CPU 코어 수)")
+    arg_parser.add_argument("--low-memory", action="store_true",
+                            help="메모리 절약 모드 (카테고리 순차 조회, 파싱 트리 즉시 해제, 동시 응답 수 제한)")
+    arg_parser.add_argument("--max-responses", type=int,
+                            help="메모리 절약 모드에서 동시에 들고 있을 응답 수 (기본: 워커 수)")
+    arg_parser.add_argument("--memory-report", action="store_true",
+                            help="단계별 최대 메모리를 측정해 끝날 때 출력 (tracemalloc, 느려짐)")
+    arg_parser.add_argument("--record", metavar="CASSETTE",
+                            help="모든 HTTP 요청/응답을 카세트 파일(gzip JSONL)에 녹화")
+    arg_parser.add_argument("--replay", metavar="CASSETTE",
+                            help="컴퓨존에 접속하지 않고 카세트 파일의 응답을 재생")
+    arg_parser.add_argument("--replay-speed", type=float, default=1.0,
+                            help="재생 시간 배율 (1: 녹화 당시 요청 간격과 지연 그대로, 0.5: 두 배 빠르게, 0: 기다리지 않음)")
+    arg_parser.add_argument("--cache-dir",
+                            help="검색 응답 디스크 캐시 디렉터리 (다시 실행하거나 여러 프로세스가 함께 쓸 때 재사용)")
+    arg_parser.add_argument("--cache-ttl", type=int, default=6 * 3600, help="디스크 캐시 응답 유지 시간 (초)")
+    arg_parser.add_argument("--cache-mb", type=int, default=512, help="디스크 캐시 크기 예산 (MB, 압축 후)")
+    arg_parser.add_argument("--enrich-details", action="store_true",
+                            help=f"제품 상세 페이지의 사양표를 가져와 {DETAIL_FIELD} 열(JSON)로 추가 (제품마다 요청 1회)")
+    arg_parser.add_argument("--checkpoint", help="완료된 검색어를 기록할 체크포인트 파일 (재개용)")
+    args = arg_parser.parse_args(argv)
+
+    # 출력 파일을 열기 전에 인자를 모두 확인한다 (거부된 실행이 기존 결과를 지우지 않도록)
+    if args.record and args.replay:
+        arg_parser.error("--record와 --replay는 함께 쓸 수 없습니다")
+    cassette_module = cassette = None
+    if args.record or args.replay:
+        import cassette as cassette_module
+    if args.replay:
+        try:
+            cassette = cassette_module.Cassette.load(args.replay)
+        except (OSError, ValueError, EOFError) as e:
+            arg_parser.error(f"카세트를 읽을 수 없습니다 ({args.replay}): {e}")
+    try:
+        stream = sys.stdin if args.input == "-" else open(args.input, encoding='utf-8')
+    except OSError as e:
+        arg_parser.error(f"검색어 파일을 열 수 없습니다: {e}")
+
+    done = load_checkpoint(args.checkpoint)
+    fmt = _detect_format(args.output, args.format)
+    maker_codes = [code.strip() for code in args.makers.split(',') if code.strip()]
+    categories = [SearchCategory.parse(code) for code in args.categories.split(',') if code.strip()]
+    fieldnames = FIELDNAMES + [DETAIL_FIELD] if args.enrich_details else FIELDNAMES
+
+    # 여기서부터 만든 자원은 어떤 경로로 끝나든 닫는다
+    with ExitStack() as resources:
+        if stream is not sys.stdin:
+            resources.callback(stream.close)
+        writer = WRITERS[fmt](args.output, append=bool(done), fieldnames=fieldnames)
+        resources.callback(writer.close)
+
+        detail_cache = None
+        if args.enrich_details:
+            from product_detail import DetailCache
+            detail_cache = DetailCache()
+
+        parse_pool = None
+        if args.parse_processes:
+            from parse_pool import ParsePool
+            parse_pool = ParsePool(workers=None if args.parse_processes < 0 else args.parse_processes)
+            resources.callback(parse_pool.close)
+
+        memory_probe = None
+        if args.memory_report:
+            from memory_report import StageMemory
+            memory_probe = StageMemory()
+            memory_probe.start()
+            resources.callback(memory_probe.stop)
+
+        recorder = None
+        if args.record:
+            recorder = cassette_module.CassetteWriter(args.record)
+
+            def close_recorder():
+                recorder.close()
+                print(f"녹화: {recorder.count}개 요청 ({args.record})", file=sys.stderr)
+            resources.callback(close_recorder)
+        if cassette_module is not None:
+            session_factory = lambda: cassette_module.open_session(recorder, cassette, args.replay_speed)
+        else:
+            session_factory = None
+
+        response_cache = None
+        if args.cache_dir:
+            from disk_cache import DiskResponseCache
+            backing = DiskResponseCache(args.cache_dir, max_bytes=args.cache_mb * 1024 * 1024, ttl=args.cache_ttl)
+            resources.callback(backing.close)
+            response_cache = ResponseCache(ttl=args.cache_ttl, backing=backing)
+
+        runner = BatchRunner(writer, maker_codes, args.limit, args.workers,
+                             sort_type=args.sort, checkpoint_path=args.checkpoint,
+                             categories=categories or None, min_price=args.min_price,
+                             max_price=args.max_price, pages=max(1, args.pages), parse_pool=parse_pool,
+                             low_memory=args.low_memory, max_responses=args.max_responses,
+                             memory_probe=memory_probe, session_factory=session_factory,
+                             response_cache=response_cache, detail_cache=detail_cache)
+        total = runner.run(iter_keywords(stream, done))
+
+        print(f"완료: {total}개 행 기록 ({args.output})", file=sys.stderr)
+        if memory_probe is not None:
+            for line in memory_probe.report():
+                print(line, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
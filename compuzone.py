@@ -1,31 +1,703 @@
 # -*- coding: utf-8 -*-
-import requests
+import dataclasses
+import hashlib
+import heapq
 import re
-from bs4 import BeautifulSoup
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Iterator, Optional, Sequence, Tuple
 import urllib.parse
 
+PRODUCT_NO_PATTERN = re.compile(r'ProductNo=(\d+)')
+
 @dataclass
 class Product:
     name: str
     price: str
     specifications: str
     product_link: str = ""
+    # 안정적인 식별자: ProductNo(SelGroupProductNo 또는 상세 링크)와 같은 ProductNo 안의 옵션 키
+    product_no: str = ""
+    option_key: str = ""
+    # 구조화된 속성 (패싯 필터용, 파서가 제품명/사양/가격에서 채움)
+    capacity: str = ""
+    gpu_series: str = ""
+    memory_type: str = ""
+    interface: str = ""
+    pack_size: int = 1
+    in_stock: bool = True
+    # 상세 페이지 사양표 (product_detail.DetailEnricher로 보강했을 때만 채워짐)
+    detail_specs: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def identity(self) -> Tuple[str, str]:
+        """중복 제거/이력 비교에 쓰는 (ProductNo, 옵션 키). ProductNo를 모르면 제품명으로 구분합니다."""
+        product_no = self.product_no or extract_product_no(self.product_link)
+        if product_no:
+            return product_no, self.option_key
+        return "", self.name
+
+
+# 컴퓨존 응답은 EUC-KR로 선언되지만 EUC-KR에 없는 확장 한글(예: 똠)이 섞여 있으므로 cp949로 디코딩
+RESPONSE_ENCODING = 'cp949'
+
+
+def parse_html(content: bytes):
+    """응답 바이트를 str로 만들지 않고 인코딩을 지정해 lxml에 바로 넘겨 파싱합니다."""
+    # bs4/soupsieve는 무거우므로 실제로 파싱할 때 불러온다 (콜드 스타트 단축)
+    from bs4 import BeautifulSoup, FeatureNotFound
+    
+    try:
+        return BeautifulSoup(content, 'lxml', from_encoding=RESPONSE_ENCODING)
+    except FeatureNotFound:
+        # lxml이 없는 환경에서는 직접 디코딩해 내장 파서 사용
+        return BeautifulSoup(content.decode(RESPONSE_ENCODING, errors='replace'), 'html.parser')
+
+
+def parse_price(price: str) -> Optional[int]:
+    """"12,345원" / "12,345원부터" 형식의 가격을 정수로 변환합니다 (품절 등은 None)."""
+    price_clean = re.sub(r'[^0-9]', '', price or '')
+    if price_clean and price_clean != '0':
+        return int(price_clean)
+    return None
+
+
+def extract_product_no(product_link: str) -> str:
+    """상세 페이지 링크에서 ProductNo를 추출합니다."""
+    match = PRODUCT_NO_PATTERN.search(product_link or '')
+    return match.group(1) if match else ""
+
+# 제조사 ID -> 제품명 [브랜드] 매핑 (HTML 체크박스에서 확인된 제조사들)
+KNOWN_BRAND_NAMES = {
+    '2': '삼성전자', '24': 'Western Digital', '25': 'SEAGATE',
+    '99': 'HP', '4629': '레노버', '10219': 'SEBAP', 
+    '439': '동화', '15947': 'HPE', '1419': 'G.SKILL',
+    '3400': 'ADATA', '6348': 'Crucial', '18': 'Kingston',
+    '763': 'Corsair', '1046': 'Patriot',
+    '14': 'GIGABYTE', '9': 'ASUS', '475': 'MSI',
+    '3169': 'MANLI', '1111': 'PNY', '8842': 'PALIT',
+    '2416': 'ZOTAC', '8231': 'Thermal grizzly', '6238': 'INNO3D',
+    '32': 'GAINWARD'
+}
+
+BRACKET_BRAND_PATTERN = re.compile(r'\[([^\]]+)\]')
+PAREN_SPEC_PATTERN = re.compile(r'\(([^)]+)\)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 사양 중복 판정용 패턴: 숫자+단위 용량, 제품 시리즈 (RTX 5080 등)
+SPEC_CAPACITY_PATTERN = re.compile(r'(\d+)\s*([KMGT]?B?)')
+SPEC_SERIES_PATTERN = re.compile(r'(RTX|GTX|RX|ARC)\s*(\d+)')
+SPEC_MEMORY_KEYWORDS = ('vram', 'memory', '메모리', 'gb', 'tb')
+
+
+def _spec_semantic_keys(text: str) -> Tuple[tuple, ...]:
+    """사양 문구의 의미 키 (정확한 문구, 메모리/저장 용량, 제품 시리즈)를 반환합니다.
+
+    두 문구가 키를 하나라도 공유하면 의미상 중복입니다.
+    """
+    lowered = text.lower().strip()
+    keys = [('text', lowered)]
+    upper = lowered.upper()
+    
+    # 같은 용량의 메모리/VRAM 정보면 중복
+    capacity_match = SPEC_CAPACITY_PATTERN.search(upper)
+    if capacity_match and any(keyword in lowered for keyword in SPEC_MEMORY_KEYWORDS):
+        number, unit = capacity_match.groups()
+        if unit in ('G', 'K', 'M', 'T'):
+            unit = unit + 'B'
+        keys.append(('capacity', number, unit))
+    
+    series_match = SPEC_SERIES_PATTERN.search(upper)
+    if series_match:
+        keys.append(('series',) + series_match.groups())
+    
+    return tuple(keys)
+
+
+# 구조화 속성 추출 패턴 (대문자 텍스트 기준)
+# 경계는 ASCII 영숫자로만 판단한다 (\b는 한글도 단어 문자로 보므로 "2TB정품", "지포스RTX"에서 맞지 않음)
+ATTR_CAPACITY_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*(TB|GB)(?![A-Z0-9])')
+# 모델 접미사(XT/Ti/SUPER)가 붙어 있어도 시리즈로 인식한다 ("RX9070XT", "RTX5070Ti")
+ATTR_GPU_SERIES_PATTERN = re.compile(
+    r'(?<![A-Z0-9])(RTX|GTX|RX)\s*(\d{3,4})(?:XT|TI|SUPER)?(?![A-Z0-9])'
+    r'|(?<![A-Z0-9])(ARC)\s*([AB]\d{3})(?![A-Z0-9])'
+)
+ATTR_MEMORY_TYPE_PATTERN = re.compile(r'(?<![A-Z0-9])(GDDR7|GDDR6X|GDDR6|LPDDR5X|LPDDR5|DDR5|DDR4|HBM3|HBM2)')
+ATTR_PCIE_PATTERN = re.compile(r'(?<![A-Z0-9])(?:PCIE|PCI-E)\s*(\d)(?:\.0)?|(?<![A-Z0-9])GEN\s*(\d)(?![A-Z0-9])')
+ATTR_INTERFACES = (('NVME', 'NVMe'), ('SATA', 'SATA'), ('THUNDERBOLT', 'Thunderbolt'), ('USB', 'USB'))
+PACK_SIZE_PATTERN = re.compile(r'\[?(\d+)PACK\]?')
+
+
+def extract_attributes(name: str, specifications: str) -> Dict[str, str]:
+    """제품명과 사양 문구에서 용량, GPU 시리즈, 메모리 타입, 인터페이스를 추출합니다.
+
+    제품명(옵션명 포함)을 먼저 보고, 없으면 사양 문구에서 찾습니다.
+    """
+    attributes = {'capacity': '', 'gpu_series': '', 'memory_type': '', 'interface': ''}
+    
+    for text in (name.upper(), specifications.upper()):
+        if not attributes['capacity']:
+            match = ATTR_CAPACITY_PATTERN.search(text)
+            if match:
+                attributes['capacity'] = f"{match.group(1)}{match.group(2)}"
+        if not attributes['gpu_series']:
+            match = ATTR_GPU_SERIES_PATTERN.search(text)
+            if match:
+                if match.group(1):
+                    attributes['gpu_series'] = f"{match.group(1)} {match.group(2)}"
+                else:
+                    attributes['gpu_series'] = f"ARC {match.group(4)}"
+        if not attributes['memory_type']:
+            match = ATTR_MEMORY_TYPE_PATTERN.search(text)
+            if match:
+                attributes['memory_type'] = match.group(1)
+    
+    # 인터페이스는 PCIe 세대가 가장 구체적이므로 제품명/사양 전체에서 먼저 찾는다
+    text = f"{name} {specifications}".upper()
+    match = ATTR_PCIE_PATTERN.search(text)
+    if match:
+        attributes['interface'] = f"PCIe {match.group(1) or match.group(2)}.0"
+    else:
+        for token, label in ATTR_INTERFACES:
+            if token in text:
+                attributes['interface'] = label
+                break
+    
+    return attributes
+
+
+# 검색 결과 목록의 제품 아이템 선택자 (첫 사용 시 프로세스당 한 번만 컴파일)
+_item_selector = None
+
+
+def item_selector():
+    global _item_selector
+    if _item_selector is None:
+        import soupsieve
+        _item_selector = soupsieve.compile("li.li-obj")
+    return _item_selector
+
+# 응답 바이트에서 제품 아이템(li.li-obj) 시작 태그 위치를 찾는 패턴 (트리를 만들지 않고 아이템 조각으로 나눌 때)
+ITEM_START_PATTERN = re.compile(rb'<li\b[^>]*\bclass\s*=\s*["\'][^"\']*(?<![\w-])li-obj(?![\w-])', re.IGNORECASE)
+
+
+# 아이템 조각의 끝을 찾을 때 세는 li/ul/ol 시작·끝 태그
+_LIST_TAG_PATTERN = re.compile(rb'<(/?)(li|ul|ol)\b[^>]*>', re.IGNORECASE)
+
+
+def _item_fragment_end(content: bytes, start: int, limit: int) -> int:
+    """start의 아이템이 끝나는 위치: 짝이 맞는 </li> 뒤, 또는 목록(ul/ol)이 닫히는 곳 (없으면 limit)"""
+    li_depth = 0
+    list_depth = 0  # 아이템 안에 중첩된 목록
+    for match in _LIST_TAG_PATTERN.finditer(content, start, limit):
+        closing, name = match.group(1), match.group(2).lower()
+        if name == b"li":
+            li_depth += -1 if closing else 1
+            if li_depth == 0:
+                return match.end()
+        elif closing:
+            if list_depth == 0:
+                # </li>를 생략한 마지막 아이템: 감싸는 목록이 닫히는 곳까지
+                return match.start()
+            list_depth -= 1
+        else:
+            list_depth += 1
+    return limit
+
+
+def split_item_fragments(content: bytes) -> List[bytes]:
+    """응답 바이트를 아이템 조각으로 나눕니다.
+
+    각 조각은 아이템의 </li>(또는 목록 끝)에서 끝나므로, 아이템 뒤의 페이지 하단 마크업이 바뀌어도
+    조각의 해시는 그대로입니다.
+    """
+    starts = [match.start() for match in ITEM_START_PATTERN.finditer(content)]
+    limits = starts[1:] + [len(content)]
+    return [content[start:_item_fragment_end(content, start, limit)] for start, limit in zip(starts, limits)]
+
+# 단일 제품 가격 선택자 우선순위 (".prd_price .number", ".prd_price .price",
+# ".price_sect .number", ".price .number", ".prd_price")
+_ITEM_PRICE_PRIORITY = ("prd_price number", "prd_price price", "price_sect number", "price number", "prd_price")
+
+
+class _SubOptionFields:
+    """.op_list 하나에서 필요한 태그들"""
+    __slots__ = ("tag", "opt_name", "product_no", "price")
+
+    def __init__(self, tag):
+        self.tag = tag
+        self.opt_name = None    # .opt_name
+        self.product_no = None  # .SelGroupProductNo
+        self.price = None       # .op_price .f_black
+
+
+class _OptionFields:
+    """.prd_option 하나에서 필요한 태그들"""
+    __slots__ = ("tag", "op_name", "opt_name", "list_area", "price", "sub_options")
+
+    def __init__(self, tag):
+        self.tag = tag
+        self.op_name = None     # .op_name (HDD 타입)
+        self.opt_name = None    # .opt_name (SSD 타입)
+        self.list_area = None   # .op_list_area
+        self.price = None       # .op_price .f_black, .op_price span
+        self.sub_options: List[_SubOptionFields] = []
+
+
+class _ItemFields:
+    """li.li-obj 서브트리를 한 번만 순회해 파싱에 필요한 태그를 모두 모읍니다.
+
+    아이템마다 select_one을 여러 번 호출하는 대신 자식 노드를 한 번 방문하면서
+    클래스 이름으로 각 필드의 첫 번째 일치 태그(문서 순서)를 기록합니다.
+    """
+
+    def __init__(self, item):
+        self.item = item
+        self.name_tag = None        # .prd_info_name
+        self.has_option_wrap = False
+        self.options: List[_OptionFields] = []
+        self.price_tags: Dict[str, object] = {}
+        self.sub_txt = None         # .prd_subTxt
+        self.info = None            # .prd_info
+        self._base_specs: Optional[List[str]] = None
+        self._walk(item, frozenset(), (), (), ())
+
+    def _walk(self, tag, price_scopes, options, area_options, sub_options):
+        for child in tag.children:
+            if child.name is None:
+                continue
+            classes = child.get('class') or ()
+            child_price_scopes = price_scopes
+            child_options = options
+            child_area_options = area_options
+            child_sub_options = sub_options
+
+            self._collect(child, classes, price_scopes, options, sub_options)
+
+            if classes:
+                if 'prd_option' in classes:
+                    option = _OptionFields(child)
+                    self.options.append(option)
+                    child_options = options + (option,)
+                if 'op_list_area' in classes:
+                    # 각 옵션의 첫 번째 .op_list_area 안에 있는 .op_list만 세부 옵션이 된다
+                    owners = tuple(o for o in options if o.list_area is None)
+                    for owner in owners:
+                        owner.list_area = child
+                    if owners:
+                        child_area_options = area_options + owners
+                if 'op_list' in classes and area_options:
+                    sub_option = _SubOptionFields(child)
+                    for owner in area_options:
+                        owner.sub_options.append(sub_option)
+                    child_sub_options = sub_options + (sub_option,)
+                scopes = [cls for cls in ('op_price', 'prd_price', 'price_sect', 'price') if cls in classes]
+                if scopes:
+                    child_price_scopes = price_scopes.union(scopes)
+
+            if child.contents:
+                self._walk(child, child_price_scopes, child_options, child_area_options, child_sub_options)
+
+    def _collect(self, tag, classes, price_scopes, options, sub_options):
+        if self.name_tag is None and 'prd_info_name' in classes:
+            self.name_tag = tag
+        if 'prd_option_wrap' in classes:
+            self.has_option_wrap = True
+        if self.sub_txt is None and 'prd_subTxt' in classes:
+            self.sub_txt = tag
+        if self.info is None and 'prd_info' in classes:
+            self.info = tag
+
+        if 'prd_price' in classes:
+            self.price_tags.setdefault("prd_price", tag)
+        for scope in ('prd_price', 'price_sect', 'price'):
+            if scope in price_scopes:
+                if 'number' in classes:
+                    self.price_tags.setdefault(f"{scope} number", tag)
+                if scope == 'prd_price' and 'price' in classes:
+                    self.price_tags.setdefault("prd_price price", tag)
+
+        in_op_price = 'op_price' in price_scopes
+        for option in options:
+            if option.op_name is None and 'op_name' in classes:
+                option.op_name = tag
+            if option.opt_name is None and 'opt_name' in classes:
+                option.opt_name = tag
+            if option.price is None and in_op_price and ('f_black' in classes or tag.name == 'span'):
+                option.price = tag
+        for sub_option in sub_options:
+            if sub_option.opt_name is None and 'opt_name' in classes:
+                sub_option.opt_name = tag
+            if sub_option.product_no is None and 'SelGroupProductNo' in classes:
+                sub_option.product_no = tag
+            if sub_option.price is None and in_op_price and 'f_black' in classes:
+                sub_option.price = tag
+
+    def item_price_tag(self):
+        for key in _ITEM_PRICE_PRIORITY:
+            tag = self.price_tags.get(key)
+            if tag is not None:
+                return tag
+        return None
+
+
+class _SearchPage:
+    """검색 API 응답 한 페이지. 아이템 트리는 처음 필요할 때 파싱합니다."""
+    __slots__ = ("content", "item_count", "products", "_soup", "_items", "_slot")
+
+    def __init__(self, content: bytes, slot=None):
+        self.content = content
+        self.item_count: Optional[int] = None  # 파싱한 뒤(또는 파싱 풀이 알려준 뒤) 채워짐
+        self.products: Optional[List["Product"]] = None  # 파싱 풀이 여러 페이지를 한 번에 파싱한 결과
+        self._soup = None
+        self._items = None
+        self._slot = slot  # 응답 보유 수 제한용 세마포어 (release 때 반환)
+
+    @property
+    def items(self) -> list:
+        if self._items is None:
+            self._soup = parse_html(self.content)
+            self._items = item_selector().select(self._soup)
+            self.item_count = len(self._items)
+        return self._items
+
+    def count_items(self) -> int:
+        return self.item_count if self.item_count is not None else len(self.items)
+
+    def release(self) -> None:
+        """페이지 트리와 응답 바이트를 바로 해제합니다 (트리는 순환 참조라 GC를 기다리지 않도록 분해)."""
+        if self._soup is not None:
+            # lxml로 만든 루트는 next_element가 비어 있어 루트의 decompose만으로는 자식이 분해되지 않는다
+            for child in list(self._soup.contents):
+                child.decompose()
+            self._soup.decompose()
+        self._soup = None
+        self._items = None
+        self.products = None
+        self.content = b""
+        if self._slot is not None:
+            slot, self._slot = self._slot, None
+            slot.release()
+
+
+def _heap_products(heap: List[Tuple[int, int, "Product"]]) -> List["Product"]:
+    """cheapest()의 최대 힙 (-가격, -순번, 제품)을 가격 오름차순(같으면 먼저 찾은 순) 목록으로"""
+    return [product for _, _, product in sorted(heap, key=lambda entry: (-entry[0], -entry[1]))]
+
+
+def _option_key(*parts: str) -> str:
+    """같은 ProductNo 안에서 옵션을 구분하는 키 (공백 정규화)"""
+    return " | ".join(WHITESPACE_PATTERN.sub(' ', part).strip() for part in parts if part)
+
+
+def _price_from_text(text: str) -> Optional[int]:
+    """가격 태그 문구의 가격 ("146,000원~ 1,416,200원"은 앞쪽 가격, 0원/품절은 None)"""
+    price_clean = re.sub(r'[^0-9]', '', text.split('~')[0])
+    if price_clean and price_clean != '0':
+        return int(price_clean)
+    return None
+
+
+def _item_price_floor(fields: _ItemFields) -> Optional[int]:
+    """아이템에서 나올 수 있는 제품 가격의 하한 (사양을 만들기 전에 가격 태그만 확인)
+
+    제품 가격은 모두 아래 태그 중 하나에서 오므로, 이 값보다 싼 제품은 나오지 않습니다.
+    가격이 있는 태그가 하나도 없으면 None.
+    """
+    if fields.has_option_wrap:
+        tags = [option.price for option in fields.options]
+        tags.extend(sub_option.price for option in fields.options for sub_option in option.sub_options)
+    else:
+        tags = [fields.item_price_tag()]
+
+    prices = [_price_from_text(tag.get_text(strip=True)) for tag in tags if tag is not None]
+    prices = [price for price in prices if price is not None]
+    return min(prices) if prices else None
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+
+@dataclass(frozen=True)
+class SearchCategory:
+    """검색 API 카테고리 (빈 문자열은 해당 단계 전체)"""
+    big_div_no: str
+    medium_div_no: str = ""
+    label: str = ""
+
+    @classmethod
+    def parse(cls, text: str) -> "SearchCategory":
+        """"4", "4/12" 형태(BigDivNo[/MediumDivNo])의 문자열을 카테고리로 바꿉니다."""
+        big, _, medium = text.strip().partition('/')
+        return cls(big.strip(), medium.strip())
+
+    def __str__(self) -> str:
+        code = f"{self.big_div_no}/{self.medium_div_no}" if self.medium_div_no else self.big_div_no
+        return f"{self.label}({code})" if self.label else code
+
+
+# 기본 검색 카테고리 (기존 동작: 컴퓨터부품)
+DEFAULT_CATEGORIES = (SearchCategory("4", label="컴퓨터부품"),)
+# 카테고리 제한 없이 검색
+ALL_CATEGORIES = SearchCategory("", label="전체")
+
+DEFAULT_CATEGORY_TTL = 6 * 3600  # 검색어별 카테고리 학습 결과 유지 시간
+MAX_CATEGORY_WORKERS = 4  # 카테고리 동시 요청 수
+
+# 검색 API 페이지당 제품 수 (PageCount)
+PAGE_SIZE = 100
+
+# 검색 API 정렬 순서 (PreOrder)
+SORT_SALES = "sale_order"
+SORT_PRICE_ASC = "low_price"
+SORT_PRICE_DESC = "high_price"
+SORT_ORDERS = {
+    SORT_SALES: "판매량순",
+    SORT_PRICE_ASC: "낮은 가격순",
+    SORT_PRICE_DESC: "높은 가격순",
+}
+
+DEFAULT_CHEAPEST_PAGES = 3  # cheapest()가 카테고리당 읽는 최대 페이지 수
+
+DEFAULT_RESPONSE_TTL = 300  # 검색 API 응답 캐시 유지 시간 (초)
+DEFAULT_RESPONSE_CACHE_SIZE = 512  # 메모리에 보관할 최대 응답 수
+
+
+class CategoryLearner:
+    """검색어별로 어떤 카테고리에서 제품이 나왔는지 기억해, 다음 검색 때 결과가 있는 카테고리만 조회합니다.
+
+    확인한 지 ttl이 지났거나 아직 조회하지 않은 카테고리는 다시 조회 대상에 포함됩니다.
+    요청이 실패한 카테고리는 기록하지 않습니다.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CATEGORY_TTL):
+        self.ttl = ttl
+        # {검색어: {카테고리: (확인 시각, 제품 아이템 수)}}
+        self._hits: Dict[str, Dict[SearchCategory, Tuple[float, int]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(keyword: str) -> str:
+        return WHITESPACE_PATTERN.sub(' ', keyword.strip().lower())
+
+    def productive(self, keyword: str, categories: Sequence[SearchCategory]) -> List[SearchCategory]:
+        """조회할 카테고리 목록 (결과가 없던 것으로 확인된 카테고리는 제외)"""
+        now = time.time()
+        with self._lock:
+            known = self._hits.get(self._normalize(keyword), {})
+            selected = []
+            for category in categories:
+                entry = known.get(category)
+                if entry is None or now - entry[0] > self.ttl or entry[1] > 0:
+                    selected.append(category)
+            return selected
+
+    def record(self, keyword: str, category: SearchCategory, item_count: int) -> None:
+        with self._lock:
+            self._hits.setdefault(self._normalize(keyword), {})[category] = (time.time(), item_count)
+
+    def forget(self, keyword: Optional[str] = None) -> None:
+        """학습 결과 삭제 (keyword가 없으면 전체)"""
+        with self._lock:
+            if keyword is None:
+                self._hits.clear()
+            else:
+                self._hits.pop(self._normalize(keyword), None)
+
+
+class ResponseCache:
+    """검색 API 응답 본문을 요청 키별로 보관하는 메모리 캐시 (TTL + 최대 개수, 오래 안 쓴 것부터 삭제)
+
+    여러 파서와 스레드가 하나의 캐시를 함께 쓸 수 있습니다. backing(disk_cache.DiskResponseCache 등)을 주면
+    메모리에 없을 때 그 아래 계층을 확인하고, 저장할 때는 두 계층에 함께 저장합니다.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_RESPONSE_TTL, max_entries: int = DEFAULT_RESPONSE_CACHE_SIZE,
+                 backing=None):
+        self.ttl = ttl
+        self.backing = backing
+        self.max_entries = max(1, max_entries)
+        # {요청 키: (만료 시각, 응답 본문)}
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.backing_hits = 0  # hits 중 아래 계층에서 찾은 수
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now <= entry[0]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+
+        stored = self._get_backing(key)
+        with self._lock:
+            if stored is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.backing_hits += 1
+        # 아래 계층의 유지 시간이 먼저 끝나면 그때 메모리에서도 만료시킨다
+        backing_expires = stored[0] + getattr(self.backing, "ttl", self.ttl)
+        self._put_memory(key, stored[1], min(now + self.ttl, backing_expires))
+        return stored[1]
+
+    def _get_backing(self, key: str) -> Optional[Tuple[float, bytes]]:
+        if self.backing is None:
+            return None
+        try:
+            return self.backing.get(key)
+        except Exception as e:
+            print(f"캐시 하위 계층 읽기 실패: {e}")
+            return None
+
+    def put(self, key: str, content: bytes) -> None:
+        now = time.time()
+        self._put_memory(key, content, now + self.ttl)
+        if self.backing is not None:
+            try:
+                self.backing.put(key, content, now)
+            except Exception as e:
+                print(f"캐시 하위 계층 저장 실패: {e}")
+
+    def _put_memory(self, key: str, content: bytes, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+DEFAULT_ITEM_CACHE_SIZE = 8192  # 파싱 결과를 보관할 최대 아이템 조각 수
+
+
+class ItemParseCache:
+    """아이템 HTML 조각 해시 → 파싱한 제품 목록 (오래 안 쓴 것부터 삭제)
+
+    키에는 조각 바이트와 함께 파싱 결과를 바꾸는 제조사 코드와 검색어 용량 필터가 들어갑니다.
+    반환하는 제품은 복사본이므로 호출한 쪽에서 고쳐도 캐시에는 영향이 없습니다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_ITEM_CACHE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[bytes, List[Product]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(fragment: bytes, maker_codes: Sequence[str], capacity_filter: Optional[str]) -> bytes:
+        digest = hashlib.blake2b(fragment, digest_size=16)
+        digest.update(b"\0" + "\x1f".join(maker_codes).encode('utf-8'))
+        digest.update(b"\0" + (capacity_filter or "").encode('utf-8'))
+        return digest.digest()
+
+    @staticmethod
+    def _copy(products: List[Product]) -> List[Product]:
+        return [dataclasses.replace(product, detail_specs=dict(product.detail_specs)) for product in products]
+
+    def get(self, key: bytes) -> Optional[List[Product]]:
+        with self._lock:
+            products = self._entries.get(key)
+            if products is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._copy(products)
+
+    def put(self, key: bytes, products: List[Product]) -> None:
+        products = self._copy(products)
+        with self._lock:
+            self._entries[key] = products
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def response_cache_key(url: str, params: Dict[str, str]) -> str:
+    """요청 URL과 파라미터(정렬)로 만든 캐시 키"""
+    return f"{url}?{urllib.parse.urlencode(sorted(params.items()))}"
+
 
 class CompuzoneParser:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        })
+    # 쇼핑몰 백엔드 이름 (retailers.RetailerBackend)
+    name = "compuzone"
+
+    def __init__(self, price_history=None, categories: Optional[Sequence[SearchCategory]] = None,
+                 parse_pool=None, low_memory: bool = False, response_slots: Optional[threading.Semaphore] = None,
+                 memory_probe=None, response_cache: Optional[ResponseCache] = None,
+                 item_cache: Optional[ItemParseCache] = None):
+        # requests.Session은 첫 요청 때 만든다 (생성만 해서는 requests를 불러오지 않음)
+        self._session = None
         self.base_url = "https://www.compuzone.co.kr/search/search.htm"
         self.search_api_url = "https://www.compuzone.co.kr/search/search_list.php"
+        # 검색 결과 가격 이력 저장소 (price_history.PriceHistoryStore, 선택 사항)
+        self.price_history = price_history
+        # 제품 검색 카테고리 (여러 개면 동시에 조회해 합친다)
+        self.categories = tuple(categories) if categories else DEFAULT_CATEGORIES
+        self.category_learner = CategoryLearner()
+        # 응답 파싱을 맡길 프로세스 풀 (parse_pool.ParsePool, 선택 사항)
+        self.parse_pool = parse_pool
+        # 메모리 절약 모드: 카테고리 첫 페이지를 미리 받지 않고, 파싱한 아이템 트리는 바로 분해한다
+        self.low_memory = low_memory
+        # 동시에 들고 있는 응답 수 제한 (여러 파서가 공유하는 세마포어, 선택 사항)
+        self.response_slots = response_slots
+        # 단계별 메모리 측정 (memory_report.StageMemory, 선택 사항)
+        self.memory_probe = memory_probe
+        # 검색 API 응답 캐시 (ResponseCache, 선택 사항). 캐시에 있으면 검색 페이지 방문과 API 요청을 모두 생략한다
+        self.response_cache = response_cache
+        # 아이템 조각별 파싱 결과 캐시 (ItemParseCache, 선택 사항). 바뀌지 않은 아이템은 다시 파싱하지 않는다
+        self.item_cache = item_cache
+        self._visited: "OrderedDict[str, float]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # 검색어별 제조사 목록 (응답 캐시가 있을 때만, 같은 유지 시간) {검색어: (저장 시각, 목록)}
+        self._maker_options: "OrderedDict[str, Tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            self._session = session
+        return self._session
+
+    @session.setter
+    def session(self, session) -> None:
+        self._session = session
 
     def _get_manufacturer_from_search_api(self, keyword: str) -> List[Dict[str, str]]:
         """search_list.php API 호출로 제조사 체크박스를 추출합니다."""
@@ -62,10 +734,9 @@ class CompuzoneParser:
             }
             
             resp = self.session.get(self.search_api_url, params=params, headers=headers, timeout=10)
-            resp.encoding = 'euc-kr'
             resp.raise_for_status()
             
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            soup = parse_html(resp.content)
             
             # 제조사 체크박스 추출
             checkbox_selectors = [
@@ -166,68 +837,35 @@ class CompuzoneParser:
     def _get_manufacturers_from_actual_products(self, keyword: str) -> List[Dict[str, str]]:
         """실제 검색된 제품들에서 제조사를 추출합니다."""
         try:
-            # 제조사 필터링 없이 전체 제품 검색
-            encoded_keyword = urllib.parse.quote(keyword, encoding='utf-8')
-            search_url = f"{self.base_url}?SearchProductKey={encoded_keyword}"
-            
-            # 검색 페이지 접근
-            resp = self.session.get(search_url, timeout=10)
-            resp.encoding = 'utf-8'
-            resp.raise_for_status()
-            
-            # API 호출로 실제 제품 목록 가져오기 (컴퓨터부품 카테고리로 제한)
-            params = {
-                "actype": "list",
-                "SearchType": "small",
-                "SearchText": keyword,
-                "PreOrder": "sale_order",
-                "PageCount": "100",  # 더 많은 제품을 가져와서 제조사 추출
-                "StartNum": "0",
-                "PageNum": "1",
-                "ListType": "0",
-                "BigDivNo": "4",  # 컴퓨터부품 카테고리
-                "MediumDivNo": "",
-                "DivNo": "",
-                "MinPrice": "0",
-                "MaxPrice": "0",
-                "ChkMakerNo": ""
-            }
-            
-            headers = {
-                "Accept": "*/*",
-                "Referer": search_url,
-                "X-Requested-With": "XMLHttpRequest",
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
-            }
-            
-            resp = self.session.get(self.search_api_url, params=params, headers=headers, timeout=10)
-            resp.encoding = 'euc-kr'
-            resp.raise_for_status()
-            
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            # 제조사 필터링 없이 검색 카테고리 전체의 제품 목록 가져오기
+            search_url = self._open_search_page(keyword)
+            # 페이지 트리는 읽고 나면 해제되므로 제품명 문자열만 모은다
+            product_names = []
+            item_count = 0
+            for _, page in self._iter_category_items(keyword, "sale_order", None, search_url):
+                for item in page.items:
+                    item_count += 1
+                    product_name_tag = item.select_one(".prd_info_name.prdTxt, .prd_info_name")
+                    if product_name_tag:
+                        product_names.append(product_name_tag.get_text(strip=True))
             
             # 제품 아이템에서 제조사 추출
-            product_items = soup.select("li.li-obj")
             manufacturers_found = {}  # {브랜드명: ID} 형태로 저장
             
-            print(f"실제 검색된 제품 수: {len(product_items)}개")
+            print(f"실제 검색된 제품 수: {item_count}개")
             
-            for item in product_items:
-                product_name_tag = item.select_one(".prd_info_name.prdTxt, .prd_info_name")
-                if product_name_tag:
-                    product_name = product_name_tag.get_text(strip=True)
+            for product_name in product_names:
+                # [브랜드] 형식에서 브랜드 추출
+                bracket_brand_match = re.search(r'\[([^\]]+)\]', product_name)
+                if bracket_brand_match:
+                    brand_name = bracket_brand_match.group(1)
                     
-                    # [브랜드] 형식에서 브랜드 추출
-                    bracket_brand_match = re.search(r'\[([^\]]+)\]', product_name)
-                    if bracket_brand_match:
-                        brand_name = bracket_brand_match.group(1)
-                        
-                        # 해당 브랜드의 제조사 ID 찾기 (API 호출을 통해)
-                        if brand_name not in manufacturers_found:
-                            brand_id = self._find_manufacturer_id_for_brand(brand_name, keyword)
-                            if brand_id:
-                                manufacturers_found[brand_name] = brand_id
-                                print(f"  - {brand_name} (ID: {brand_id})")
+                    # 해당 브랜드의 제조사 ID 찾기 (API 호출을 통해)
+                    if brand_name not in manufacturers_found:
+                        brand_id = self._find_manufacturer_id_for_brand(brand_name, keyword)
+                        if brand_id:
+                            manufacturers_found[brand_name] = brand_id
+                            print(f"  - {brand_name} (ID: {brand_id})")
             
             # 결과를 리스트로 변환
             result = []
@@ -322,7 +960,30 @@ class CompuzoneParser:
             return []
 
     def get_search_options(self, keyword: str) -> List[Dict[str, str]]:
-        """컴퓨존에서 검색 결과를 통해 브랜드를 추출합니다."""
+        """컴퓨존에서 검색 결과를 통해 브랜드를 추출합니다 (응답 캐시가 있으면 검색어별 결과도 캐시)."""
+        cache = self.response_cache
+        if cache is None:
+            return self._get_search_options(keyword)
+
+        key = CategoryLearner._normalize(keyword)
+        now = time.time()
+        with self._cache_lock:
+            entry = self._maker_options.get(key)
+            if entry is not None and now - entry[0] <= cache.ttl:
+                self._maker_options.move_to_end(key)
+                return [dict(option) for option in entry[1]]
+
+        options = self._get_search_options(keyword)
+        # 실패해서 빈 목록이면 캐시하지 않는다
+        if options:
+            with self._cache_lock:
+                self._maker_options[key] = (now, [dict(option) for option in options])
+                self._maker_options.move_to_end(key)
+                while len(self._maker_options) > cache.max_entries:
+                    self._maker_options.popitem(last=False)
+        return options
+
+    def _get_search_options(self, keyword: str) -> List[Dict[str, str]]:
         try:
             # 간단한 방법: 실제 제품 검색 후 제품명에서 브랜드 추출
             return self._extract_brands_from_search_results(keyword)
@@ -334,7 +995,6 @@ class CompuzoneParser:
             
             # 먼저 검색 페이지에 접근
             resp = self.session.get(search_url, timeout=10)
-            resp.encoding = 'euc-kr'  # 컴퓨존은 EUC-KR 인코딩 사용
             resp.raise_for_status()
             
             # 검색 결과 목록 가져오기
@@ -362,10 +1022,9 @@ class CompuzoneParser:
             }
             
             resp = self.session.get(self.search_api_url, params=params, headers=headers, timeout=10)
-            resp.encoding = 'euc-kr'  # 컴퓨존은 EUC-KR 인코딩 사용
             resp.raise_for_status()
             
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            soup = parse_html(resp.content)
             
             # 제품명에서 브랜드 추출
             product_items = soup.select("li.li-obj")
@@ -417,126 +1076,503 @@ class CompuzoneParser:
             # 오류 시에도 빈 목록 반환 (실제 데이터가 없으면 브랜드도 없어야 함)
             return []
 
-    def search_products(self, keyword: str, sort_type: str, maker_codes: List[str], limit: int = 5) -> List[Product]:
-        """컴퓨존에서 제품을 검색합니다."""
+    def _open_search_page(self, keyword: str) -> str:
+        """검색 페이지에 먼저 접근하고 API 요청의 Referer로 쓸 URL을 반환합니다."""
+        # URL 인코딩된 검색어
+        encoded_keyword = urllib.parse.quote(keyword, encoding='utf-8')
+        search_url = f"{self.base_url}?SearchProductKey={encoded_keyword}"
+        
+        # 응답 캐시가 있으면 방문은 첫 API 요청 직전으로 미룬다 (모두 캐시에서 나오면 방문하지 않음)
+        if self.response_cache is None:
+            self._visit_search_page(search_url)
+        return search_url
+
+    def _visit_search_page(self, search_url: str) -> None:
+        resp = self.session.get(search_url, timeout=10)
+        resp.raise_for_status()
+
+    def _visit_search_page_cached(self, search_url: str) -> None:
+        """캐시를 쓰는 경우의 지연 방문: 이 세션으로 캐시 유지 시간 안에 방문한 검색 페이지는 다시 방문하지 않는다."""
+        now = time.time()
+        with self._cache_lock:
+            visited_at = self._visited.get(search_url)
+            if visited_at is not None and now - visited_at <= self.response_cache.ttl:
+                return
+        self._visit_search_page(search_url)
+        with self._cache_lock:
+            self._visited[search_url] = now
+            self._visited.move_to_end(search_url)
+            while len(self._visited) > self.response_cache.max_entries:
+                self._visited.popitem(last=False)
+
+    def _fetch_category_page(self, keyword: str, sort_type: str, category: SearchCategory, referer: str,
+                             page: int = 1, min_price: Optional[int] = None,
+                             max_price: Optional[int] = None) -> "_SearchPage":
+        """카테고리 하나의 검색 API 응답 한 페이지를 가져옵니다 (파싱은 소비하는 쪽에서)."""
+        # 가격 범위와 정렬은 서버에 넘기고, 제조사 필터링은 클라이언트에서 처리
+        params = {
+            "actype": "list",
+            "SearchType": "small",
+            "SearchText": keyword,
+            "PreOrder": sort_type if sort_type else SORT_SALES,
+            "PageCount": str(PAGE_SIZE),  # 충분한 결과를 가져와서 클라이언트에서 필터링
+            "StartNum": str((page - 1) * PAGE_SIZE),
+            "PageNum": str(page),
+            "ListType": "0",
+            "BigDivNo": category.big_div_no,
+            "MediumDivNo": category.medium_div_no,
+            "DivNo": "",
+            "MinPrice": str(min_price or 0),  # 0은 제한 없음
+            "MaxPrice": str(max_price or 0),
+            "ChkMakerNo": ""
+        }
+        
+        headers = {
+            "Accept": "*/*",
+            "Referer": referer,
+            "X-Requested-With": "XMLHttpRequest",
+            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
+        }
+        
+        slot = self.response_slots
+        if slot is not None:
+            slot.acquire()
         try:
-            # URL 인코딩된 검색어
-            encoded_keyword = urllib.parse.quote(keyword, encoding='utf-8')
-            search_url = f"{self.base_url}?SearchProductKey={encoded_keyword}"
-            
-            # 검색 페이지 접근
-            resp = self.session.get(search_url, timeout=10)
-            resp.encoding = 'utf-8'
+            content = self._get_search_api(params, headers)
+        except Exception:
+            if slot is not None:
+                slot.release()
+            raise
+        self._mark_memory("fetch")
+        return _SearchPage(content, slot)
+
+    def _get_search_api(self, params: Dict[str, str], headers: Dict[str, str]) -> bytes:
+        """검색 API 응답 본문 (응답 캐시가 있으면 캐시를 먼저 확인)"""
+        cache = self.response_cache
+        if cache is None:
+            resp = self.session.get(self.search_api_url, params=params, headers=headers, timeout=10)
             resp.raise_for_status()
-            
-            # API 파라미터 설정 (컴퓨터부품 카테고리로 제한, 제조사 필터링은 클라이언트에서 처리)
-            params = {
-                "actype": "list",
-                "SearchType": "small",
-                "SearchText": keyword,
-                "PreOrder": sort_type if sort_type else "sale_order",
-                "PageCount": "100",  # 충분한 결과를 가져와서 클라이언트에서 필터링
-                "StartNum": "0",
-                "PageNum": "1",
-                "ListType": "0",
-                "BigDivNo": "4",  # 컴퓨터부품 카테고리
-                "MediumDivNo": "",
-                "DivNo": "",
-                "MinPrice": "0",
-                "MaxPrice": "0",
-                "ChkMakerNo": ""  # 서버 필터링 대신 클라이언트 필터링 사용
-            }
-            
-            headers = {
-                "Accept": "*/*",
-                "Referer": search_url,
-                "X-Requested-With": "XMLHttpRequest",
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
-            }
-            
+            return resp.content
+
+        key = response_cache_key(self.search_api_url, params)
+        content = cache.get(key)
+        if content is None:
+            self._visit_search_page_cached(headers["Referer"])
             resp = self.session.get(self.search_api_url, params=params, headers=headers, timeout=10)
-            resp.encoding = 'euc-kr'  # 컴퓨존은 EUC-KR 인코딩 사용
             resp.raise_for_status()
-            
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            
+            content = resp.content
+            cache.put(key, content)
+        return content
+
+    def _mark_memory(self, stage: str) -> None:
+        if self.memory_probe is not None:
+            self.memory_probe.mark(stage)
+
+    def _fetch_category_page_logged(self, keyword: str, sort_type: str, category: SearchCategory,
+                                    referer: str, show_category: bool, raise_errors: bool = False,
+                                    **page_options) -> Optional["_SearchPage"]:
+        """실패하면 출력하고 None을 반환합니다 (raise_errors면 예외를 그대로 올린다)."""
+        try:
+            return self._fetch_category_page(keyword, sort_type, category, referer, **page_options)
+        except Exception as e:
+            if raise_errors:
+                raise
+            where = f" ({category})" if show_category else ""
+            print(f"제품 검색 중 오류 발생{where}: {e}")
+            return None
+
+    def _iter_first_pages(self, keyword: str, sort_type: str, targets: Sequence[SearchCategory], referer: str,
+                          show_category: bool, **fetch_options) -> Iterator[Tuple[SearchCategory, "_SearchPage"]]:
+        """카테고리별 첫 페이지를 카테고리 순서대로 반환합니다 (여러 개면 동시에 요청)."""
+        if len(targets) <= 1 or self.low_memory:
+            for category in targets:
+                page = self._fetch_category_page_logged(keyword, sort_type, category, referer, show_category,
+                                                        **fetch_options)
+                if page is not None:
+                    yield category, page
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(len(targets), MAX_CATEGORY_WORKERS))
+        futures = [
+            (category, executor.submit(self._fetch_category_page_logged,
+                                       keyword, sort_type, category, referer, show_category, **fetch_options))
+            for category in targets
+        ]
+        consumed = 0
+        try:
+            for category, future in futures:
+                consumed += 1
+                page = future.result()
+                if page is not None:
+                    yield category, page
+        finally:
+            # 소비자가 중간에 멈추면 아직 시작하지 않은 요청은 취소하고, 받아 둔 응답은 해제한다
+            executor.shutdown(wait=False, cancel_futures=True)
+            for _, future in futures[consumed:]:
+                if (future.done() and not future.cancelled() and future.exception() is None
+                        and future.result() is not None):
+                    future.result().release()
+
+    def _iter_category_items(self, keyword: str, sort_type: str, categories: Optional[Sequence[SearchCategory]],
+                             referer: str, pages: int = 1, min_price: Optional[int] = None,
+                             max_price: Optional[int] = None, raise_errors: bool = False,
+                             maker_codes: Optional[List[str]] = None) -> Iterator[Tuple[SearchCategory, "_SearchPage"]]:
+        """카테고리별 검색 결과 페이지를 카테고리 순서대로 반환합니다.
+
+        카테고리가 여러 개면 첫 페이지는 동시에 요청하고, 이 검색어로 결과가 없던 카테고리는 건너뜁니다.
+        이때 파싱 풀이 있고 maker_codes를 주면 첫 페이지들을 한 번에 파싱 풀로 보낸다 (page.products).
+        다음 페이지는 소비자가 앞 페이지를 다 읽었을 때만 요청하며, 페이지가 덜 차면 마지막 페이지로 봅니다.
+        실패한 요청은 출력하고 건너뛰며, raise_errors면 예외를 그대로 올립니다.
+        """
+        categories = tuple(categories) if categories else self.categories
+        targets = self.category_learner.productive(keyword, categories)
+        show_category = len(categories) > 1
+        fetch_options = {"min_price": min_price, "max_price": max_price, "raise_errors": raise_errors}
+
+        first_pages = self._iter_first_pages(keyword, sort_type, targets, referer, show_category, **fetch_options)
+        if (maker_codes is not None and self.parse_pool is not None and self.item_cache is None
+                and len(targets) > 1 and not self.low_memory):
+            first_pages = self._parse_first_pages(first_pages, maker_codes, keyword)
+
+        for category, first_page in first_pages:
+            for page in self._iter_category_pages(keyword, sort_type, category, first_page, referer,
+                                                  show_category, pages, **fetch_options):
+                yield category, page
+
+    def _parse_first_pages(self, first_pages: Iterator[Tuple[SearchCategory, "_SearchPage"]],
+                           maker_codes: List[str], keyword: str) -> Iterator[Tuple[SearchCategory, "_SearchPage"]]:
+        """동시에 받은 카테고리별 첫 페이지를 parse_pages 한 번으로 여러 프로세스에 나눠 파싱합니다."""
+        collected = []
+        consumed = 0
+        try:
+            collected.extend(first_pages)
+            results = self.parse_pool.parse_pages([(page.content, maker_codes, keyword) for _, page in collected])
+            for (_, page), (item_count, products) in zip(collected, results):
+                page.item_count = item_count
+                page.products = products
+            for category, page in collected:
+                consumed += 1
+                yield category, page
+        finally:
+            # 실패하거나 소비자가 중간에 멈추면 아직 넘기지 않은 페이지를 해제한다
+            for _, page in collected[consumed:]:
+                page.release()
+
+    def _iter_category_pages(self, keyword: str, sort_type: str, category: SearchCategory, first_page: "_SearchPage",
+                             referer: str, show_category: bool, pages: int,
+                             **fetch_options) -> Iterator["_SearchPage"]:
+        """한 카테고리의 페이지를 차례로 반환합니다. 다음 페이지는 앞 페이지를 다 읽었을 때 요청합니다."""
+        page = first_page
+        page_num = 1
+        while True:
+            try:
+                yield page
+                item_count = page.count_items()
+            finally:
+                # 소비자가 페이지를 다 읽으면 (또는 중간에 멈추면) 트리와 응답을 바로 해제한다
+                page.release()
+                self._mark_memory("parse")
+            # 가격 제한 없는 첫 페이지만 학습한다 (실패한 카테고리는 다음 검색 때 다시 조회)
+            if page_num == 1 and not fetch_options.get("min_price") and not fetch_options.get("max_price"):
+                self.category_learner.record(keyword, category, item_count)
+            if page_num >= pages or item_count < PAGE_SIZE:
+                return
+            page_num += 1
+            page = self._fetch_category_page_logged(keyword, sort_type, category, referer, show_category,
+                                                    page=page_num, **fetch_options)
+            if page is None:
+                return
+
+    def _page_products(self, page: "_SearchPage", maker_codes: List[str], keyword: str) -> Iterator[Product]:
+        """검색 결과 페이지의 제품을 반환합니다.
+
+        파싱 풀이 여러 페이지를 한 번에 파싱해 두었으면(page.products) 그 결과를 쓰고,
+        아이템 캐시(ItemParseCache)가 있으면 전체 트리를 만들지 않고 바뀐 아이템 조각만 파싱하고,
+        파싱 풀(parse_pool.ParsePool)이 설정되어 있으면 응답 바이트를 다른 프로세스에서 파싱하며,
+        둘 다 없으면 아이템을 하나씩 파싱하면서 바로 반환합니다.
+        """
+        if page.products is not None:
+            yield from page.products
+            return
+
+        if self.item_cache is not None:
+            yield from self._page_products_incremental(page, maker_codes, keyword)
+            return
+
+        if self.parse_pool is not None:
+            item_count, products = self.parse_pool.parse_page(page.content, maker_codes, keyword)
+            page.item_count = item_count
+            yield from products
+            return
+
+        for item in page.items:
+            products = self._parse_product_item_with_options(item, maker_codes, keyword)
+            if self.low_memory:
+                # 제품은 문자열만 갖고 있으므로 아이템 서브트리는 바로 분해해도 된다
+                item.decompose()
+            yield from products
+
+    def _page_products_incremental(self, page: "_SearchPage", maker_codes: List[str],
+                                   keyword: str) -> Iterator[Product]:
+        """아이템 조각의 해시로 캐시를 찾아, 처음 보거나 바뀐 조각만 파싱합니다."""
+        fragments = split_item_fragments(page.content)
+        page.item_count = len(fragments)
+        capacity_filter = self._extract_capacity_from_keyword(keyword)
+        for fragment in fragments:
+            key = self.item_cache.key(fragment, maker_codes, capacity_filter)
+            products = self.item_cache.get(key)
+            if products is None:
+                products = self._parse_fragment(fragment, maker_codes, keyword)
+                self.item_cache.put(key, products)
+            yield from products
+
+    def _parse_fragment(self, fragment: bytes, maker_codes: List[str], keyword: str) -> List[Product]:
+        fragment_page = _SearchPage(fragment)
+        try:
             products = []
-            product_items = soup.select("li.li-obj")
-            
-            for item in product_items:
-                parsed_products = self._parse_product_item_with_options(item, maker_codes, keyword)
-                products.extend(parsed_products)
-                if len(products) >= limit:
-                    break
-            
-            return products[:limit]
-            
+            for item in fragment_page.items:
+                products.extend(self._parse_product_item_with_options(item, maker_codes, keyword))
+            return products
+        finally:
+            fragment_page.release()
+
+    def parse_page(self, content: bytes, maker_codes: List[str], keyword: str) -> Tuple[int, List[Product]]:
+        """검색 API 응답 바이트 한 페이지를 (아이템 수, 제품 목록)으로 파싱합니다."""
+        if self.item_cache is not None:
+            page = _SearchPage(content)
+            products = list(self._page_products_incremental(page, maker_codes, keyword))
+            return page.item_count, products
+
+        page = _SearchPage(content)
+        products = []
+        for item in page.items:
+            products.extend(self._parse_product_item_with_options(item, maker_codes, keyword))
+        return page.item_count, products
+
+    @staticmethod
+    def _in_price_range(product: Product, min_price: Optional[int], max_price: Optional[int]) -> bool:
+        """옵션 가격은 서버 필터와 다를 수 있으므로 파싱한 가격으로 한 번 더 확인합니다."""
+        if not min_price and not max_price:
+            return True
+        price = parse_price(product.price)
+        if price is None:
+            return False
+        return (not min_price or price >= min_price) and (not max_price or price <= max_price)
+
+    def iter_products(self, keyword: str, sort_type: str, maker_codes: List[str], limit: int = 5,
+                      categories: Optional[Sequence[SearchCategory]] = None, min_price: Optional[int] = None,
+                      max_price: Optional[int] = None, pages: int = 1,
+                      raise_errors: bool = False) -> Iterator[Product]:
+        """컴퓨존에서 제품을 검색하고, 파싱되는 대로 하나씩 반환합니다.
+
+        sort_type(PreOrder)과 가격 범위(min_price/max_price, 원)는 검색 API에 그대로 넘깁니다.
+        pages는 카테고리당 최대 페이지 수이며, limit개를 채우면 다음 페이지는 요청하지 않습니다.
+        categories(기본: self.categories)가 여러 개면 동시에 조회해 카테고리 순서대로 합치며,
+        앞 카테고리에서 이미 나온 제품은 다시 반환하지 않습니다.
+        요청이 실패하면 출력하고 받은 만큼만 반환하며, raise_errors면 예외를 올립니다
+        (결과가 없는 것과 실패를 구분해야 하는 배치 실행용).
+        """
+        try:
+            search_url = self._open_search_page(keyword)
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"제품 검색 중 오류 발생: {e}")
+            return
+        
+        products = []
+        # 페이지/카테고리를 넘나들며 이미 반환한 제품 (Product.identity)
+        seen = set()
+        try:
+            for _, page in self._iter_category_items(keyword, sort_type, categories, search_url,
+                                                     pages=pages, min_price=min_price, max_price=max_price,
+                                                     raise_errors=raise_errors, maker_codes=maker_codes):
+                for product in self._page_products(page, maker_codes, keyword):
+                    if not self._in_price_range(product, min_price, max_price):
+                        continue
+                    if product.identity in seen:
+                        continue
+                    seen.add(product.identity)
+                    products.append(product)
+                    yield product
+                    if len(products) >= limit:
+                        return
+        finally:
+            # 소비자가 중간에 멈춘 경우에도 그때까지 받은 결과는 기록한다
+            self._record_price_history(products, keyword)
+
+    def search_products(self, keyword: str, sort_type: str, maker_codes: List[str], limit: int = 5,
+                        categories: Optional[Sequence[SearchCategory]] = None, min_price: Optional[int] = None,
+                        max_price: Optional[int] = None, pages: int = 1) -> List[Product]:
+        """컴퓨존에서 제품을 검색합니다."""
+        return list(self.iter_products(keyword, sort_type, maker_codes, limit=limit, categories=categories,
+                                       min_price=min_price, max_price=max_price, pages=pages))
+
+    def cheapest(self, keyword: str, k: int = 10, maker_codes: Optional[List[str]] = None,
+                 categories: Optional[Sequence[SearchCategory]] = None, min_price: Optional[int] = None,
+                 max_price: Optional[int] = None, pages: int = DEFAULT_CHEAPEST_PAGES,
+                 on_update: Optional[Callable[[List[Product]], None]] = None) -> List[Product]:
+        """가격이 있는 제품 중 가장 싼 k개를 가격 오름차순으로 반환합니다.
+
+        낮은 가격순으로 요청해 크기 k의 힙만 유지합니다. 힙이 찬 뒤에는 아이템의 가격 태그만 보고
+        k위 안에 들 수 없는 아이템은 사양 문자열을 만들지 않고 건너뛰며, 응답이 실제로 가격순임이
+        확인되는 동안에는 k위보다 비싼 아이템이 나오면 그 카테고리의 나머지 아이템과 페이지를 읽지 않습니다.
+        on_update를 주면 페이지를 하나 읽을 때마다 (결과가 바뀌었으면) 지금까지의 상위 k개를 넘겨 줍니다
+        (끝나기 전에 미리보기를 그릴 때).
+        """
+        if k <= 0:
             return []
+        maker_codes = maker_codes or []
+
+        try:
+            search_url = self._open_search_page(keyword)
+        except Exception as e:
+            print(f"제품 검색 중 오류 발생: {e}")
+            return []
+
+        categories = tuple(categories) if categories else self.categories
+        targets = self.category_learner.productive(keyword, categories)
+        show_category = len(categories) > 1
+        price_range = {"min_price": min_price, "max_price": max_price}
+
+        # 최대 힙: (-가격, -순번, 제품) — 힙의 맨 위가 현재 k위(가장 비싼 것)
+        heap: List[Tuple[int, int, Product]] = []
+        seen = set()
+        sequence = 0
+        reported = 0  # on_update에 마지막으로 넘긴 시점의 sequence
+
+        for category, first_page in self._iter_first_pages(keyword, SORT_PRICE_ASC, targets, search_url,
+                                                            show_category, **price_range):
+            # 가격 하한이 줄어드는 아이템이 나오면 서버 정렬을 믿지 않고 끝까지 읽는다
+            ordered = True
+            last_floor = 0
+            stop = False
+            for page in self._iter_category_pages(keyword, SORT_PRICE_ASC, category, first_page, search_url,
+                                                  show_category, pages, **price_range):
+                for item in page.items:
+                    try:
+                        fields = _ItemFields(item)
+                    except Exception as e:
+                        print(f"제품 파싱 중 오류: {e}")
+                        continue
+
+                    floor = _item_price_floor(fields)
+                    if floor is None:
+                        continue  # 가격이 있는 옵션이 없다 (품절/가격 문의)
+                    if floor < last_floor:
+                        ordered = False
+                    last_floor = floor
+
+                    if len(heap) >= k and floor >= -heap[0][0]:
+                        if ordered:
+                            stop = True
+                            break
+                        continue
+
+                    for product in self._parse_item_fields(fields, maker_codes, keyword):
+                        price = parse_price(product.price)
+                        if price is None or not self._in_price_range(product, min_price, max_price):
+                            continue
+                        key = product.identity
+                        if key in seen:
+                            continue
+                        if len(heap) < k:
+                            heapq.heappush(heap, (-price, -sequence, product))
+                        elif price < -heap[0][0]:
+                            heapq.heapreplace(heap, (-price, -sequence, product))
+                        else:
+                            continue
+                        seen.add(key)
+                        sequence += 1
+                if on_update is not None and sequence != reported:
+                    reported = sequence
+                    on_update(_heap_products(heap))
+                if stop:
+                    break
+
+        result = _heap_products(heap)
+        self._record_price_history(result, keyword)
+        return result
+
+    def _record_price_history(self, products: List[Product], keyword: str) -> None:
+        """가격 이력 저장소가 설정되어 있으면 검색 결과를 기록합니다."""
+        if self.price_history is None or not products:
+            return
+        try:
+            self.price_history.record(products, keyword=keyword)
+        except Exception as e:
+            # 이력 저장 실패가 검색 결과를 막지 않도록 한다
+            print(f"가격 이력 저장 실패: {e}")
 
     def _parse_product_item_with_options(self, item, maker_codes: List[str], keyword: str) -> List[Product]:
         """제품 아이템을 파싱하고 검색어에 맞는 옵션만 필터링합니다."""
+        try:
+            # 아이템 서브트리를 한 번만 순회해 필요한 태그를 모은다
+            fields = _ItemFields(item)
+        except Exception as e:
+            print(f"제품 파싱 중 오류: {e}")
+            return []
+        return self._parse_item_fields(fields, maker_codes, keyword)
+
+    def _parse_item_fields(self, fields: _ItemFields, maker_codes: List[str], keyword: str) -> List[Product]:
+        """모아 둔 아이템 태그에서 제품 목록을 만듭니다."""
         try:
             # 제품명 추출
-            product_name_tag = item.select_one(".prd_info_name.prdTxt, .prd_info_name")
-            if not product_name_tag:
+            if fields.name_tag is None:
                 return []
                 
-            base_product_name = product_name_tag.get_text(strip=True)
+            base_product_name = fields.name_tag.get_text(strip=True)
             if not base_product_name:
                 return []
             
             # 브랜드 필터링
-            if maker_codes:
-                brand_found = False
-                bracket_brand_match = re.search(r'\[([^\]]+)\]', base_product_name)
-                if bracket_brand_match:
-                    bracket_brand = bracket_brand_match.group(1).strip()
-                    
-                    for code in maker_codes:
-                        if code.isdigit():
-                            known_brand_names = {
-                                '2': '삼성전자', '24': 'Western Digital', '25': 'SEAGATE',
-                                '99': 'HP', '4629': '레노버', '10219': 'SEBAP', 
-                                '439': '동화', '15947': 'HPE', '1419': 'G.SKILL',
-                                '3400': 'ADATA', '6348': 'Crucial', '18': 'Kingston',
-                                '763': 'Corsair', '1046': 'Patriot',
-                                '14': 'GIGABYTE', '9': 'ASUS', '475': 'MSI',
-                                '3169': 'MANLI', '1111': 'PNY', '8842': 'PALIT',
-                                '2416': 'ZOTAC', '8231': 'Thermal grizzly', '6238': 'INNO3D',
-                                '32': 'GAINWARD'
-                            }
-                            expected_brand = known_brand_names.get(code, '')
-                            if expected_brand and bracket_brand.upper() == expected_brand.upper():
-                                brand_found = True
-                                break
-                        elif code.upper() == bracket_brand.upper():
-                            brand_found = True
-                            break
-                        elif bracket_brand.upper() in code.upper() or code.upper() in bracket_brand.upper():
-                            brand_found = True
-                            break
-                
-                if not brand_found:
-                    return []
+            if maker_codes and not self._matches_maker_codes(base_product_name, maker_codes):
+                return []
             
             # 검색어에서 용량 정보 추출
             capacity_filter = self._extract_capacity_from_keyword(keyword)
             
             # 옵션 섹션 확인
-            option_wrap = item.select_one(".prd_option_wrap")
-            if option_wrap:
-                return self._parse_product_options_filtered(item, base_product_name, capacity_filter)
+            if fields.has_option_wrap:
+                products = self._parse_product_options_filtered(fields, base_product_name, capacity_filter)
             else:
                 # 옵션이 없는 경우 기존 방식으로 처리하되 용량 필터링 적용
-                product = self._parse_single_product_filtered(item, base_product_name, capacity_filter)
-                return [product] if product else []
+                product = self._parse_single_product_filtered(fields, base_product_name, capacity_filter)
+                products = [product] if product else []
+            
+            for product in products:
+                self._apply_attributes(product)
+            return products
             
         except Exception as e:
             print(f"제품 파싱 중 오류: {e}")
             return []
 
+    def _apply_attributes(self, product: Product) -> None:
+        """제품명/사양/가격에서 구조화 속성을 채웁니다."""
+        for name, value in extract_attributes(product.name, product.specifications).items():
+            setattr(product, name, value)
+        product.in_stock = parse_price(product.price) is not None
+
+    def _matches_maker_codes(self, product_name: str, maker_codes: List[str]) -> bool:
+        """제품명의 [브랜드]가 선택한 제조사 코드 중 하나와 일치하는지 확인합니다."""
+        bracket_brand_match = BRACKET_BRAND_PATTERN.search(product_name)
+        if not bracket_brand_match:
+            return False
+        bracket_brand = bracket_brand_match.group(1).strip().upper()
+        
+        for code in maker_codes:
+            if code.isdigit():
+                # 숫자 ID인 경우 알려진 매핑으로 확인
+                expected_brand = KNOWN_BRAND_NAMES.get(code, '')
+                if expected_brand and bracket_brand == expected_brand.upper():
+                    return True
+            # 브랜드명 직접 매칭 및 부분 매칭
+            elif code.upper() == bracket_brand or bracket_brand in code.upper() or code.upper() in bracket_brand:
+                return True
+        
+        return False
+
     def _extract_capacity_from_keyword(self, keyword: str) -> Optional[str]:
         """검색어에서 용량 정보를 추출합니다."""
         keyword_upper = keyword.upper()
@@ -561,17 +1597,15 @@ class CompuzoneParser:
         
         return None
 
-    def _parse_product_options_filtered(self, item, base_product_name: str, capacity_filter: Optional[str]) -> List[Product]:
+    def _parse_product_options_filtered(self, fields: _ItemFields, base_product_name: str, capacity_filter: Optional[str]) -> List[Product]:
         """제품 옵션들을 파싱하고 용량 필터를 적용합니다."""
         products = []
         
         try:
-            option_items = item.select(".prd_option")
-            
-            for option_item in option_items:
+            for option in fields.options:
                 # 옵션명 추출 (두 가지 구조 모두 지원)
-                option_name_tag = option_item.select_one(".op_name")  # HDD 타입
-                opt_detail_tag = option_item.select_one(".opt_name")  # SSD 타입
+                option_name_tag = option.op_name  # HDD 타입
+                opt_detail_tag = option.opt_name  # SSD 타입
                 
                 option_name = ""
                 option_detail = ""
@@ -592,17 +1626,15 @@ class CompuzoneParser:
                         continue
                 
                 # 세부 옵션 영역 확인 (.op_list_area)
-                op_list_area = option_item.select_one(".op_list_area")
-                if op_list_area:
+                if option.list_area is not None:
                     # 세부 옵션들이 있는 경우 (예: 4TB 개별/5팩/10팩)
-                    sub_options = op_list_area.select(".op_list")
-                    for sub_opt in sub_options:
-                        sub_product = self._parse_sub_option(sub_opt, base_product_name, option_name, item)
+                    for sub_option in option.sub_options:
+                        sub_product = self._parse_sub_option(sub_option, base_product_name, option_name, fields)
                         if sub_product:
                             products.append(sub_product)
                 else:
                     # 세부 옵션이 없는 일반적인 경우
-                    product = self._parse_regular_option(option_item, base_product_name, option_name, item)
+                    product = self._parse_regular_option(option, base_product_name, option_name, fields)
                     if product:
                         products.append(product)
                 
@@ -611,11 +1643,11 @@ class CompuzoneParser:
         
         return products
 
-    def _parse_sub_option(self, sub_opt, base_product_name: str, option_name: str, item) -> Optional[Product]:
+    def _parse_sub_option(self, sub_option: _SubOptionFields, base_product_name: str, option_name: str, fields: _ItemFields) -> Optional[Product]:
         """세부 옵션을 파싱합니다 (예: 4TB 개별/5팩/10팩)."""
         try:
             # 세부 옵션명 추출 (.opt_name)
-            sub_opt_name_tag = sub_opt.select_one(".opt_name")
+            sub_opt_name_tag = sub_option.opt_name
             if not sub_opt_name_tag:
                 return None
                 
@@ -623,17 +1655,25 @@ class CompuzoneParser:
             
             # 제품 번호 추출 (세부 옵션에서)
             product_link = ""
-            checkbox = sub_opt.select_one(".SelGroupProductNo")
+            product_no = ""
+            checkbox = sub_option.product_no
             if checkbox:
-                product_no = checkbox.get('value')
+                product_no = checkbox.get('value') or ""
                 if product_no:
                     product_link = f"https://www.compuzone.co.kr/product/product_detail.htm?ProductNo={product_no}"
             
+            # 세부 옵션 번호가 없으면 메인 제품 번호 + 옵션명으로 구분
+            option_key = ""
+            if not product_no:
+                product_no = extract_product_no(self._main_product_link(fields))
+                option_key = _option_key(option_name, sub_opt_name)
+            
             # 세부 옵션 가격 추출
-            sub_price_tag = sub_opt.select_one(".op_price .f_black")
+            sub_price_tag = sub_option.price
             if not sub_price_tag:
                 # 품절인지 확인
-                if "품절" in sub_opt.get_text() or "재입고" in sub_opt.get_text():
+                sub_opt_text = sub_option.tag.get_text()
+                if "품절" in sub_opt_text or "재입고" in sub_opt_text:
                     formatted_price = "품절"
                 else:
                     return None
@@ -652,7 +1692,7 @@ class CompuzoneParser:
             option_specs.append(option_name)
             
             # 2. 세부 사양 추가 (괄호 안의 내용)
-            spec_match = re.search(r'\(([^)]+)\)', sub_opt_name)
+            spec_match = PAREN_SPEC_PATTERN.search(sub_opt_name)
             if spec_match:
                 detailed_specs = spec_match.group(1)
                 option_specs.append(detailed_specs)
@@ -662,9 +1702,11 @@ class CompuzoneParser:
                 option_specs.append("5개 팩")
             elif '[10PACK]' in sub_opt_name or '10PACK' in sub_opt_name:
                 option_specs.append("10개 팩")
+            pack_match = PACK_SIZE_PATTERN.search(sub_opt_name)
+            pack_size = int(pack_match.group(1)) if pack_match else 1
             
             # 4. 기본 제품 사양 추가
-            base_specs = self._extract_base_product_specs(item)
+            base_specs = self._extract_base_product_specs(fields)
             if base_specs:
                 option_specs.extend(base_specs[:1])  # 최대 1개만
             
@@ -684,33 +1726,24 @@ class CompuzoneParser:
                 name=full_product_name,
                 price=formatted_price,
                 specifications=final_specs,
-                product_link=product_link
+                product_link=product_link,
+                product_no=product_no,
+                option_key=option_key,
+                pack_size=pack_size
             )
             
         except Exception as e:
             print(f"세부 옵션 파싱 중 오류: {e}")
             return None
 
-    def _parse_regular_option(self, option_item, base_product_name: str, option_name: str, item) -> Optional[Product]:
+    def _parse_regular_option(self, option: _OptionFields, base_product_name: str, option_name: str, fields: _ItemFields) -> Optional[Product]:
         """일반적인 옵션을 파싱합니다."""
         try:
             # 제품 번호 추출 (메인 제품에서)
-            product_link = ""
-            main_link = item.select_one(".prd_info_name")
-            if main_link:
-                href = main_link.get('href')
-                if href:
-                    if href.startswith('http'):
-                        product_link = href
-                    elif href.startswith('/'):
-                        product_link = f"https://www.compuzone.co.kr{href}"
-                    elif href.startswith('../'):
-                        product_link = f"https://www.compuzone.co.kr/{href.replace('../', '')}"
-                    else:
-                        product_link = f"https://www.compuzone.co.kr/{href}"
+            product_link = self._main_product_link(fields)
             
             # 옵션 가격 추출
-            option_price_tag = option_item.select_one(".op_price .f_black, .op_price span")
+            option_price_tag = option.price
             if not option_price_tag:
                 return None
                 
@@ -731,7 +1764,7 @@ class CompuzoneParser:
                 if price_clean and price_clean != '0':
                     formatted_price = f"{int(price_clean):,}원"
                 else:
-                    if "품절" in option_item.get_text():
+                    if "품절" in option.tag.get_text():
                         formatted_price = "품절"
                     else:
                         return None
@@ -744,16 +1777,16 @@ class CompuzoneParser:
                 option_specs.append(option_name)
             
             # 2. 세부 사양 추출 (SSD/HDD 타입별)
-            opt_detail_tag = option_item.select_one(".opt_name")
+            opt_detail_tag = option.opt_name
             if opt_detail_tag:
                 additional_detail = opt_detail_tag.get_text(strip=True)
-                spec_match = re.search(r'\(([^)]+)\)', additional_detail)
+                spec_match = PAREN_SPEC_PATTERN.search(additional_detail)
                 if spec_match:
                     detailed_specs = spec_match.group(1)
                     option_specs.append(detailed_specs)
             
             # 3. 기본 제품 사양 추가
-            base_specs = self._extract_base_product_specs(item)
+            base_specs = self._extract_base_product_specs(fields)
             if base_specs:
                 option_specs.extend(base_specs[:2])  # 최대 2개만
             
@@ -763,11 +1796,14 @@ class CompuzoneParser:
             # 사양 정리
             final_specs = " / ".join(option_specs) if option_specs else "컴퓨존 상품"
             
+            # 일반 옵션은 메인 제품 번호를 공유하므로 옵션명으로 구분
             return Product(
                 name=full_product_name,
                 price=formatted_price,
                 specifications=final_specs,
-                product_link=product_link
+                product_link=product_link,
+                product_no=extract_product_no(product_link),
+                option_key=_option_key(option_name)
             )
             
         except Exception as e:
@@ -815,7 +1851,24 @@ class CompuzoneParser:
         
         return False
 
-    def _parse_single_product_filtered(self, item, product_name: str, capacity_filter: Optional[str]) -> Optional[Product]:
+    def _main_product_link(self, fields: _ItemFields) -> str:
+        """메인 제품명 링크(.prd_info_name href)를 절대 URL로 반환합니다."""
+        main_link = fields.name_tag
+        if main_link is None:
+            return ""
+        href = main_link.get('href')
+        if not href:
+            return ""
+        if href.startswith('http'):
+            return href
+        elif href.startswith('/'):
+            return f"https://www.compuzone.co.kr{href}"
+        elif href.startswith('../'):
+            return f"https://www.compuzone.co.kr/{href.replace('../', '')}"
+        else:
+            return f"https://www.compuzone.co.kr/{href}"
+
+    def _parse_single_product_filtered(self, fields: _ItemFields, product_name: str, capacity_filter: Optional[str]) -> Optional[Product]:
         """단일 제품을 파싱하고 용량 필터를 적용합니다."""
         try:
             # 용량 필터링 적용
@@ -824,35 +1877,13 @@ class CompuzoneParser:
                     return None
             
             # 제품 링크 추출
-            product_link = ""
-            main_link = item.select_one(".prd_info_name")
-            if main_link:
-                href = main_link.get('href')
-                if href:
-                    if href.startswith('http'):
-                        product_link = href
-                    elif href.startswith('/'):
-                        product_link = f"https://www.compuzone.co.kr{href}"
-                    elif href.startswith('../'):
-                        product_link = f"https://www.compuzone.co.kr/{href.replace('../', '')}"
-                    else:
-                        product_link = f"https://www.compuzone.co.kr/{href}"
+            product_link = self._main_product_link(fields)
             
-            # 기존 단일 제품 파싱 로직
+            # 기존 단일 제품 파싱 로직 (가격 선택자 우선순위대로)
             price_text = "품절"
-            price_selectors = [
-                ".prd_price .number",
-                ".prd_price .price", 
-                ".price_sect .number",
-                ".price .number",
-                ".prd_price"
-            ]
-            
-            for selector in price_selectors:
-                price_tag = item.select_one(selector)
-                if price_tag:
-                    price_text = price_tag.get_text(strip=True)
-                    break
+            price_tag = fields.item_price_tag()
+            if price_tag:
+                price_text = price_tag.get_text(strip=True)
             
             price_clean = re.sub(r'[^0-9]', '', price_text)
             if price_clean and price_clean != '0':
@@ -860,7 +1891,7 @@ class CompuzoneParser:
             else:
                 formatted_price = "품절"
             
-            specifications = self._extract_base_product_specs(item)
+            specifications = self._extract_base_product_specs(fields)
             final_specs_text = " / ".join(specifications) if specifications else "컴퓨존 상품"
             deduplicated_specs = self._smart_deduplicate_specs(final_specs_text)
             
@@ -868,7 +1899,8 @@ class CompuzoneParser:
                 name=product_name, 
                 price=formatted_price, 
                 specifications=deduplicated_specs,
-                product_link=product_link
+                product_link=product_link,
+                product_no=extract_product_no(product_link)
             )
             
         except Exception as e:
@@ -878,8 +1910,10 @@ class CompuzoneParser:
     def _parse_product_item(self, item, maker_codes: List[str]) -> Optional[Product]:
         """제품 아이템을 파싱합니다."""
         try:
+            fields = _ItemFields(item)
+            
             # 제품명 추출
-            product_name_tag = item.select_one(".prd_info_name.prdTxt, .prd_info_name")
+            product_name_tag = fields.name_tag
             if not product_name_tag:
                 return None
                 
@@ -888,61 +1922,14 @@ class CompuzoneParser:
                 return None
             
             # 브랜드 필터링 (컴퓨존 [브랜드] 형식 고려)
-            if maker_codes:
-                brand_found = False
-                
-                # [브랜드] 형식에서 브랜드 추출
-                bracket_brand_match = re.search(r'\[([^\]]+)\]', product_name)
-                if bracket_brand_match:
-                    bracket_brand = bracket_brand_match.group(1).strip()
-                    
-                    # 제조사 코드와 매칭
-                    for code in maker_codes:
-                        # 숫자 ID인 경우 알려진 매핑으로 확인
-                        if code.isdigit():
-                            known_brand_names = {
-                                '2': '삼성전자', '24': 'Western Digital', '25': 'SEAGATE',
-                                '99': 'HP', '4629': '레노버', '10219': 'SEBAP', 
-                                '439': '동화', '15947': 'HPE', '1419': 'G.SKILL',
-                                '3400': 'ADATA', '6348': 'Crucial', '18': 'Kingston',
-                                '763': 'Corsair', '1046': 'Patriot',
-                                # HTML 체크박스에서 확인된 RTX 5090 제조사들
-                                '14': 'GIGABYTE', '9': 'ASUS', '475': 'MSI',
-                                '3169': 'MANLI', '1111': 'PNY', '8842': 'PALIT',
-                                '2416': 'ZOTAC', '8231': 'Thermal grizzly', '6238': 'INNO3D',
-                                '32': 'GAINWARD'
-                            }
-                            expected_brand = known_brand_names.get(code, '')
-                            if expected_brand and bracket_brand.upper() == expected_brand.upper():
-                                brand_found = True
-                                break
-                        # 브랜드명 직접 매칭
-                        elif code.upper() == bracket_brand.upper():
-                            brand_found = True
-                            break
-                        # 부분 매칭도 시도
-                        elif bracket_brand.upper() in code.upper() or code.upper() in bracket_brand.upper():
-                            brand_found = True
-                            break
-                
-                if not brand_found:
-                    return None
+            if maker_codes and not self._matches_maker_codes(product_name, maker_codes):
+                return None
             
             # 가격 추출 - 여러 가능한 선택자 시도
             price_text = "품절"  # 기본값을 품절로 변경
-            price_selectors = [
-                ".prd_price .number",
-                ".prd_price .price", 
-                ".price_sect .number",
-                ".price .number",
-                ".prd_price"
-            ]
-            
-            for selector in price_selectors:
-                price_tag = item.select_one(selector)
-                if price_tag:
-                    price_text = price_tag.get_text(strip=True)
-                    break
+            price_tag = fields.item_price_tag()
+            if price_tag:
+                price_text = price_tag.get_text(strip=True)
             
             # 가격 정리
             price_clean = re.sub(r'[^0-9]', '', price_text)
@@ -961,17 +1948,17 @@ class CompuzoneParser:
                 specifications.extend(name_specs)
             
             # 2. .prd_subTxt에서 상세 사양 정보 추출 (가장 정확한 방법)
-            prd_subTxt = item.select_one(".prd_subTxt")
+            prd_subTxt = fields.sub_txt
             if prd_subTxt:
                 spec_text = prd_subTxt.get_text(strip=True)
                 if spec_text and len(spec_text) > 10:
                     # 불필요한 텍스트 제거 후 사양 정보 추가
-                    clean_spec = re.sub(r'\s+', ' ', spec_text)
+                    clean_spec = WHITESPACE_PATTERN.sub(' ', spec_text)
                     specifications.append(clean_spec[:200])  # 너무 길면 자르기
             
             # 3. .prd_subTxt가 없으면 .prd_info에서 추출 (기존 방법)
             if not any('/' in spec for spec in specifications):
-                prd_info = item.select_one(".prd_info")
+                prd_info = fields.info
                 if prd_info:
                     info_text = prd_info.get_text(separator=' | ', strip=True)
                     parts = info_text.split(' | ')
@@ -1003,23 +1990,28 @@ class CompuzoneParser:
             print(f"제품 파싱 중 오류: {e}")
             return None
 
-    def _extract_base_product_specs(self, item) -> List[str]:
-        """제품의 기본 사양 정보를 추출합니다."""
+    def _extract_base_product_specs(self, fields: _ItemFields) -> List[str]:
+        """제품의 기본 사양 정보를 추출합니다 (아이템당 한 번만 계산)."""
+        if fields._base_specs is None:
+            fields._base_specs = self._compute_base_product_specs(fields)
+        return fields._base_specs
+
+    def _compute_base_product_specs(self, fields: _ItemFields) -> List[str]:
         specifications = []
         
         # 1. .prd_subTxt에서 상세 사양 정보 추출 (가장 정확한 방법)
-        prd_subTxt = item.select_one(".prd_subTxt")
+        prd_subTxt = fields.sub_txt
         if prd_subTxt:
             spec_text = prd_subTxt.get_text(strip=True)
             if spec_text and len(spec_text) > 10:
                 # 불필요한 텍스트 제거 후 사양 정보 추가
-                clean_spec = re.sub(r'\s+', ' ', spec_text)
+                clean_spec = WHITESPACE_PATTERN.sub(' ', spec_text)
                 spec_parts = [part.strip() for part in clean_spec.split('/') if part.strip()]
                 specifications.extend(spec_parts[:3])  # 처음 3개만
         
         # 2. .prd_subTxt가 없으면 .prd_info에서 추출 (기존 방법)
         if not specifications:
-            prd_info = item.select_one(".prd_info")
+            prd_info = fields.info
             if prd_info:
                 info_text = prd_info.get_text(separator=' | ', strip=True)
                 parts = info_text.split(' | ')
@@ -1070,7 +2062,7 @@ class CompuzoneParser:
         return specs[:3]  # 최대 3개만 반환
 
     def _smart_deduplicate_specs(self, specs_text: str) -> str:
-        """스마트 사양 중복 제거 - 의미적 유사성 기반"""
+        """스마트 사양 중복 제거 - 의미 키 기반 단일 패스 (더 긴 문구를 유지)"""
         if not specs_text:
             return specs_text
         
@@ -1079,74 +2071,53 @@ class CompuzoneParser:
             return specs_text
         
         unique_parts = []
+        unique_keys = []
+        # 의미 키 -> 그 키를 가진 unique_parts 인덱스
+        key_index: Dict[tuple, set] = {}
         
         for part in parts:
-            is_duplicate = False
-            
-            for i, existing_part in enumerate(unique_parts):
-                if self._is_semantic_duplicate(part, existing_part):
-                    # 더 정보가 많은 것을 선택
-                    if len(part) > len(existing_part):
-                        unique_parts[i] = part
-                    is_duplicate = True
-                    break
+            keys = _spec_semantic_keys(part)
+            hits = [i for key in keys for i in key_index.get(key, ())]
             
-            if not is_duplicate:
+            if not hits:
+                position = len(unique_parts)
                 unique_parts.append(part)
+                unique_keys.append(keys)
+                for key in keys:
+                    key_index.setdefault(key, set()).add(position)
+                continue
+            
+            # 가장 먼저 남겨진 중복 항목과 비교해 더 정보가 많은 것을 선택
+            position = min(hits)
+            if len(part) > len(unique_parts[position]):
+                for key in unique_keys[position]:
+                    key_index[key].discard(position)
+                unique_parts[position] = part
+                unique_keys[position] = keys
+                for key in keys:
+                    key_index.setdefault(key, set()).add(position)
         
         return " / ".join(unique_parts)
     
     def _is_semantic_duplicate(self, text1: str, text2: str) -> bool:
-        """두 텍스트가 의미적으로 중복인지 판단"""
-        t1, t2 = text1.lower().strip(), text2.lower().strip()
-        
-        # 1. 완전 동일
-        if t1 == t2:
-            return True
-        
-        # 2. 숫자+단위 패턴으로 용량 비교
-        def extract_capacity(text):
-            match = re.search(r'(\d+)\s*([KMGT]?B?)', text.upper())
-            if match:
-                number, unit = match.groups()
-                if unit in ['G', 'K', 'M', 'T']:
-                    unit = unit + 'B'
-                return (number, unit)
-            return None
-        
-        cap1, cap2 = extract_capacity(t1), extract_capacity(t2)
-        
-        # 같은 용량의 메모리/VRAM 정보면 중복
-        if cap1 and cap2 and cap1 == cap2:
-            has_mem1 = any(kw in t1 for kw in ['vram', 'memory', '메모리', 'gb', 'tb'])
-            has_mem2 = any(kw in t2 for kw in ['vram', 'memory', '메모리', 'gb', 'tb'])
-            if has_mem1 and has_mem2:
-                return True
-        
-        # 3. 제품 시리즈 중복 (RTX 5080 등)
-        def extract_series(text):
-            match = re.search(r'(RTX|GTX|RX|ARC)\s*(\d+)', text.upper())
-            return match.groups() if match else None
-        
-        series1, series2 = extract_series(t1), extract_series(t2)
-        if series1 and series2 and series1 == series2:
-            return True
-        
-        return False
+        """두 텍스트가 의미적으로 중복인지 판단 (의미 키가 하나라도 같으면 중복)"""
+        return not set(_spec_semantic_keys(text1)).isdisjoint(_spec_semantic_keys(text2))
+
+    def iter_unique_products(self, keyword: str, maker_codes: List[str], limit: int = 10,
+                             categories: Optional[Sequence[SearchCategory]] = None,
+                             sort_type: str = SORT_SALES, min_price: Optional[int] = None,
+                             max_price: Optional[int] = None, pages: int = 1) -> Iterator[Product]:
+        """중복(같은 Product.identity)을 제거한 제품을 파싱되는 대로 하나씩 반환합니다."""
+        seen = set()
+        for product in self.iter_products(keyword, sort_type, maker_codes, limit=limit, categories=categories,
+                                          min_price=min_price, max_price=max_price, pages=pages):
+            if product.identity not in seen:
+                seen.add(product.identity)
+                yield product
 
     def get_unique_products(self, keyword: str, maker_codes: List[str]) -> List[Product]:
-        """danawa와 호환되도록 하지만 컴퓨존은 단일 검색만 수행"""
-        products = self.search_products(keyword, "sale_order", maker_codes, limit=10)
-        
-        # 중복 제거
-        unique_products = []
-        seen_names = set()
-        for product in products:
-            if product.name not in seen_names:
-                unique_products.append(product)
-                seen_names.add(product.name)
-        
-        return unique_products
+        """retailers.RetailerBackend 규약의 중복 제거 검색 (컴퓨존은 단일 검색만 수행)"""
+        return list(self.iter_unique_products(keyword, maker_codes, limit=10))
 
 
 # 원본 코드의 독립 실행을 위한 함수들 (하위 호환성)
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""검색 API 응답의 디스크 캐시 (압축, 내용 주소 지정).
+
+응답 본문은 내용 해시(SHA-256) 이름의 압축 파일로 한 번만 저장하고, 요청 키 → 해시 색인은 SQLite에 둡니다.
+같은 본문이 여러 요청 키로 들어와도 파일은 하나이며, 전체 크기가 예산을 넘으면 오래 안 쓴 본문부터 지웁니다.
+파일은 임시 파일에 쓴 뒤 이름을 바꾸고 색인은 WAL 모드 SQLite를 쓰므로, 재시작 후에도 남고
+같은 호스트의 여러 프로세스가 한 디렉터리를 함께 쓸 수 있습니다.
+
+압축은 zstandard 패키지가 있으면 zstd, 없으면 zlib을 씁니다.
+
+    cache = ResponseCache(backing=DiskResponseCache("~/.cache/compuzone"))
+    parser = CompuzoneParser(response_cache=cache)
+"""
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from typing import Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 압축된 본문 전체 크기 예산
+DEFAULT_DISK_TTL = 6 * 3600  # 디스크에 저장한 응답을 쓸 수 있는 시간 (초)
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 6
+# 접근 시각 갱신 간격: 자주 읽히는 키마다 매번 쓰기 트랜잭션을 만들지 않는다
+ACCESS_UPDATE_INTERVAL = 60
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    raw_size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+CREATE INDEX IF NOT EXISTS blobs_accessed ON blobs (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_stored ON entries (stored_at);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+# meta 행: 압축된 본문 크기의 합. 본문을 넣고 지우는 트랜잭션 안에서 함께 갱신해 put마다 SUM을 구하지 않는다
+_TOTAL_SIZE = "total_size"
+# 예산을 넘으면 이 비율까지 줄여, 예산 근처에서 put마다 정리가 일어나지 않게 한다
+EVICT_TARGET_RATIO = 0.9
+
+
+def _compress(content: bytes) -> Tuple[str, bytes]:
+    if zstandard is not None:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(content)
+    return CODEC_ZLIB, zlib.compress(content, ZLIB_LEVEL)
+
+
+def _decompress(codec: str, data: bytes) -> Optional[bytes]:
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    if codec == CODEC_ZSTD and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data)
+    return None  # 이 환경에서 풀 수 없는 형식 (zstandard 미설치)
+
+
+class DiskResponseCache:
+    """요청 키 → 응답 본문 디스크 캐시. compuzone.ResponseCache의 backing으로 씁니다."""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES, ttl: float = DEFAULT_DISK_TTL):
+        self.directory = os.path.expanduser(directory)
+        self.blob_dir = os.path.join(self.directory, "blobs")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.index_path = os.path.join(self.directory, "index.sqlite")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # sqlite3 연결은 스레드마다 하나씩
+        self._local = threading.local()
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+        # 이 행이 없던 색인(이전 버전)이면 한 번만 합계를 구해 채운다
+        conn.execute(
+            "INSERT OR IGNORE INTO meta (name, value) SELECT ?, COALESCE(SUM(size), 0) FROM blobs",
+            (_TOTAL_SIZE,)
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.index_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    def get(self, key: str) -> Optional[Tuple[float, bytes]]:
+        """(저장 시각, 본문). 없거나 유지 시간이 지났으면 None"""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT e.digest, e.stored_at, b.codec, b.accessed_at FROM entries e "
+            "JOIN blobs b ON b.digest = e.digest WHERE e.key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        digest, stored_at, codec, accessed_at = row
+        now = time.time()
+        if now - stored_at > self.ttl:
+            return None
+
+        try:
+            with open(self._blob_path(digest), 'rb') as f:
+                content = _decompress(codec, f.read())
+        except FileNotFoundError:
+            # 다른 프로세스가 방금 지운 본문
+            self._forget_blob(digest)
+            return None
+        except Exception as e:
+            # 읽기 오류나 손상된 본문 (zlib.error, zstandard.ZstdError 등): 없는 것으로 보고 지운다
+            print(f"디스크 캐시 읽기 실패 ({digest[:12]}): {e}")
+            self._forget_blob(digest)
+            return None
+        if content is None:
+            return None
+
+        if now - accessed_at > ACCESS_UPDATE_INTERVAL:
+            conn.execute("UPDATE blobs SET accessed_at = ? WHERE digest = ?", (now, digest))
+        return stored_at, content
+
+    def put(self, key: str, content: bytes, stored_at: Optional[float] = None) -> None:
+        stored_at = time.time() if stored_at is None else stored_at
+        digest = hashlib.sha256(content).hexdigest()
+        conn = self._connect()
+        path = self._blob_path(digest)
+        try:
+            # 압축은 쓰기 잠금 밖에서 한다 (이미 있는 본문이면 건너뜀)
+            known = conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            compressed = None
+            if known is None or not os.path.exists(path):
+                compressed = _compress(content)
+
+            # 본문 확인, 파일 쓰기, 색인 갱신을 한 트랜잭션으로 묶어 다른 프로세스의 정리와 섞이지 않게 한다
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                known = conn.execute("SELECT size FROM blobs WHERE digest = ?", (digest,)).fetchone()
+                if known is None or not os.path.exists(path):
+                    codec, data = compressed if compressed is not None else _compress(content)
+                    self._write_atomic(path, data)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO blobs (digest, codec, size, raw_size, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (digest, codec, len(data), len(content), stored_at)
+                    )
+                    # 파일만 사라졌던 본문은 이전 크기를 빼고 다시 더한다
+                    self._add_total(conn, len(data) - (known[0] if known is not None else 0))
+                else:
+                    conn.execute("UPDATE blobs SET accessed_at = ? WHERE digest = ?", (stored_at, digest))
+
+                previous = conn.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, digest, stored_at) VALUES (?, ?, ?)",
+                    (key, digest, stored_at)
+                )
+                orphaned = []
+                if previous is not None and previous[0] != digest:
+                    # 내용이 바뀐 키: 예전 본문을 다른 키가 가리키지 않으면 함께 지운다
+                    orphaned = self._delete_orphans(conn, [previous[0]])
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self._remove_files(orphaned)
+            self._evict(conn)
+        except (OSError, sqlite3.Error) as e:
+            print(f"디스크 캐시 저장 실패: {e}")
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _total(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT value FROM meta WHERE name = ?", (_TOTAL_SIZE,)).fetchone()[0]
+
+    @staticmethod
+    def _add_total(conn: sqlite3.Connection, delta: int) -> None:
+        """본문 크기 합계를 바꿉니다 (본문을 넣고 지우는 트랜잭션 안에서 부를 것)"""
+        if delta:
+            conn.execute("UPDATE meta SET value = value + ? WHERE name = ?", (delta, _TOTAL_SIZE))
+
+    def _delete_blobs(self, conn: sqlite3.Connection, digests) -> None:
+        """본문과 그 본문을 가리키는 키를 색인에서 지우고 크기 합계를 줄입니다 (트랜잭션 안에서 부를 것)"""
+        freed = 0
+        for digest in digests:
+            row = conn.execute("SELECT size FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            conn.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+            if row is not None:
+                conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+                freed += row[0]
+        self._add_total(conn, -freed)
+
+    def _delete_orphans(self, conn: sqlite3.Connection, digests) -> list:
+        """주어진 본문 중 어떤 키도 가리키지 않는 것을 지우고 그 목록을 반환합니다 (트랜잭션 안에서 부를 것)"""
+        orphaned = [digest for digest in set(digests) if conn.execute(
+            "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone() is None]
+        self._delete_blobs(conn, orphaned)
+        return orphaned
+
+    def _remove_files(self, digests) -> None:
+        # 색인에서 지운 뒤 파일을 지운다 (읽는 쪽은 파일이 없으면 빈 캐시로 본다)
+        for digest in digests:
+            try:
+                os.remove(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
+
+    def _forget_blob(self, digest: str) -> None:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._delete_blobs(conn, [digest])
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        self._remove_files([digest])
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """전체 크기가 예산을 넘으면 유지 시간이 지난 키와 그 키만 가리키던 본문을 먼저 지우고,
+        그래도 넘으면 오래 안 쓴 본문과 그 본문을 가리키는 키를 예산의 EVICT_TARGET_RATIO까지 지운다.
+        크기 합계는 meta 행에서 읽으므로 예산 안이면 색인을 훑지 않는다."""
+        if self._total(conn) <= self.max_bytes:
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 다른 프로세스가 먼저 지웠을 수 있으므로 트랜잭션 안에서 다시 읽는다
+            if self._total(conn) <= self.max_bytes:
+                conn.execute("COMMIT")
+                return
+
+            cutoff = time.time() - self.ttl
+            expired = [row[0] for row in conn.execute(
+                "SELECT DISTINCT digest FROM entries WHERE stored_at < ?", (cutoff,)
+            ).fetchall()]
+            conn.execute("DELETE FROM entries WHERE stored_at < ?", (cutoff,))
+            removed = self._delete_orphans(conn, expired)
+
+            total = self._total(conn)
+            target = int(self.max_bytes * EVICT_TARGET_RATIO)
+            victims = []
+            if total > self.max_bytes:
+                # accessed_at 색인 순으로 필요한 만큼만 읽는다
+                for digest, size in conn.execute("SELECT digest, size FROM blobs ORDER BY accessed_at"):
+                    if total <= target:
+                        break
+                    victims.append(digest)
+                    total -= size
+            self._delete_blobs(conn, victims)
+            removed.extend(victims)
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._remove_files(removed)
+
+    def stats(self) -> Tuple[int, int, int, int]:
+        """(키 수, 본문 수, 압축 크기 합, 원본 크기 합)"""
+        conn = self._connect()
+        keys = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        blobs, size, raw_size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(raw_size), 0) FROM blobs"
+        ).fetchone()
+        return keys, blobs, size, raw_size
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
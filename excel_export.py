@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""검색 결과 Excel 내보내기.
+
+openpyxl의 write-only 모드로 제품 iterator에서 바로 행을 씁니다.
+중간 DataFrame이나 전체 워크북 객체를 메모리에 만들지 않으므로
+수천 행짜리 결과도 빠르고 가볍게 내보낼 수 있습니다.
+"""
+import io
+from typing import BinaryIO, Iterable, Union
+
+from compuzone import Product, parse_price
+
+HEADERS = ["제품명", "가격", "주요 사양", "구매링크"]
+COLUMN_WIDTHS = {"A": 60, "B": 14, "C": 60, "D": 12}
+PRICE_FORMAT = '#,##0"원"'
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def write_products_xlsx(products: Iterable[Product], output: Union[str, BinaryIO],
+                        sheet_title: str = "검색 결과") -> int:
+    """제품 목록을 xlsx로 쓰고 기록한 제품 수를 반환합니다."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_title)
+
+    # write-only 모드에서는 행을 쓰기 전에 열 너비를 지정해야 한다
+    for column, width in COLUMN_WIDTHS.items():
+        sheet.column_dimensions[column].width = width
+
+    header_font = Font(bold=True)
+    header_row = []
+    for title in HEADERS:
+        cell = WriteOnlyCell(sheet, value=title)
+        cell.font = header_font
+        header_row.append(cell)
+    sheet.append(header_row)
+
+    count = 0
+    for product in products:
+        price = parse_price(product.price)
+        if price is not None and product.price.endswith("원"):
+            price_cell = WriteOnlyCell(sheet, value=price)
+            price_cell.number_format = PRICE_FORMAT
+        else:
+            # 품절, "원부터" 같은 범위 가격은 표기 그대로 남긴다
+            price_cell = WriteOnlyCell(sheet, value=product.price)
+
+        if product.product_link:
+            link_cell = WriteOnlyCell(sheet, value=f"구매{count + 1}")
+            link_cell.hyperlink = product.product_link
+            link_cell.style = "Hyperlink"
+        else:
+            link_cell = WriteOnlyCell(sheet, value="링크없음")
+
+        sheet.append([product.name, price_cell, product.specifications, link_cell])
+        count += 1
+
+    workbook.save(output)
+    return count
+
+
+def products_to_xlsx_bytes(products: Iterable[Product]) -> bytes:
+    """다운로드 버튼용으로 xlsx 파일 내용을 bytes로 반환합니다."""
+    buffer = io.BytesIO()
+    write_products_xlsx(products, buffer)
+    return buffer.getvalue()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""검색 결과 패싯(속성) 인덱스.
+
+캐시된 검색 결과의 구조화 속성(용량, GPU 시리즈, 메모리 타입, 인터페이스, 팩 구성, 재고)을
+속성값 -> 제품 위치 집합으로 색인해, 추가 요청 없이 결과를 좁히고 각 값의 개수를 보여줍니다.
+"""
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Set
+
+from compuzone import Product
+
+_CAPACITY_VALUE_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(TB|GB)$')
+
+FACET_FIELDS = ("capacity", "gpu_series", "memory_type", "interface", "pack_size", "in_stock")
+
+FACET_LABELS = {
+    "capacity": "용량",
+    "gpu_series": "GPU 시리즈",
+    "memory_type": "메모리 타입",
+    "interface": "인터페이스",
+    "pack_size": "팩 구성",
+    "in_stock": "재고",
+}
+
+
+def format_facet_value(field: str, value) -> str:
+    """UI에 표시할 속성값 문구"""
+    if field == "pack_size":
+        return "단품" if value == 1 else f"{value}개 팩"
+    if field == "in_stock":
+        return "재고 있음" if value else "품절"
+    return str(value)
+
+
+def _value_sort_key(field: str, value):
+    """용량은 실제 크기순(500GB < 1TB), 재고는 재고 있음 먼저, 나머지는 값 순서"""
+    if field == "capacity":
+        match = _CAPACITY_VALUE_PATTERN.match(value)
+        if match:
+            size = float(match.group(1)) * (1024 if match.group(2) == "TB" else 1)
+            return (0, size, "")
+        return (1, 0, value)
+    if field == "in_stock":
+        return (0, not value, "")
+    if isinstance(value, int):
+        return (0, value, "")
+    return (0, 0, str(value))
+
+
+class FacetIndex:
+    """제품 목록의 속성값 역색인"""
+
+    def __init__(self, products: Iterable[Product], fields: Iterable[str] = FACET_FIELDS):
+        self.products: List[Product] = list(products)
+        self.fields = tuple(fields)
+        # {속성: {값: 제품 위치 집합}}
+        self._postings: Dict[str, Dict[object, Set[int]]] = {field: {} for field in self.fields}
+
+        for position, product in enumerate(self.products):
+            for field in self.fields:
+                value = getattr(product, field, "")
+                if value == "" or value is None:
+                    continue
+                self._postings[field].setdefault(value, set()).add(position)
+
+    def values(self, field: str) -> List:
+        """속성의 전체 값 목록 (정렬됨)"""
+        return sorted(self._postings.get(field, {}), key=lambda value: _value_sort_key(field, value))
+
+    def _matching(self, selection: Mapping[str, Iterable], exclude: Optional[str] = None) -> Set[int]:
+        """선택 조건에 맞는 제품 위치 (같은 속성 안에서는 OR, 속성 간에는 AND)"""
+        matched = set(range(len(self.products)))
+        for field, selected in selection.items():
+            if field == exclude or field not in self._postings:
+                continue
+            selected = list(selected)
+            if not selected:
+                continue
+            positions = set()
+            for value in selected:
+                positions |= self._postings[field].get(value, set())
+            matched &= positions
+            if not matched:
+                break
+        return matched
+
+    def filter(self, selection: Mapping[str, Iterable]) -> List[Product]:
+        """선택 조건에 맞는 제품을 원래 순서대로 반환합니다."""
+        matched = self._matching(selection)
+        return [product for position, product in enumerate(self.products) if position in matched]
+
+    def counts(self, selection: Optional[Mapping[str, Iterable]] = None) -> Dict[str, Dict[object, int]]:
+        """속성별 값 개수. 각 속성의 개수는 그 속성 자신의 선택을 제외한 조건으로 계산합니다."""
+        selection = selection or {}
+        result = {}
+        for field in self.fields:
+            matched = self._matching(selection, exclude=field)
+            result[field] = {
+                value: len(positions & matched)
+                for value, positions in self._postings[field].items()
+            }
+        return result
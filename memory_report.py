@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""배치 실행의 단계별 메모리 측정 (tracemalloc).
+
+파서와 배치 실행기가 단계(fetch: 응답 수신, parse: 페이지 파싱 후 해제, write: 결과 기록)가
+끝날 때마다 mark()를 호출하면, 직전 mark() 이후 (= 그 단계 동안) 추적된 파이썬 메모리의 최고치를
+단계별로 기록하고 다음 단계를 위해 최고치를 초기화합니다 (tracemalloc.reset_peak).
+스레드가 여러 개면 다른 스레드가 잡고 있는 메모리도 함께 잡히므로 단계 간 상대 비교용입니다.
+"""
+import threading
+import tracemalloc
+from typing import Dict, List
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+STAGES = ("fetch", "parse", "write")
+
+
+class StageMemory:
+    """단계별 최대 메모리 (단계 동안의 tracemalloc 최고치 기준)"""
+
+    def __init__(self):
+        self._peaks: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self._overall_peak = 0  # 단계마다 최고치를 초기화하므로 전체 최고치는 따로 모은다
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        # 첫 단계는 지금부터 잰다
+        tracemalloc.reset_peak()
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def mark(self, stage: str) -> None:
+        if not tracemalloc.is_tracing():
+            return
+        with self._lock:
+            # 이 단계 동안의 최고치를 기록하고, 다음 단계가 시작되므로 최고치를 초기화한다
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            self._peaks[stage] = max(self._peaks.get(stage, 0), peak)
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+            self._overall_peak = max(self._overall_peak, peak)
+
+    def peaks(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._peaks)
+
+    def report(self) -> List[str]:
+        """사람이 읽을 수 있는 보고서 줄 목록"""
+        with self._lock:
+            stages = [stage for stage in STAGES if stage in self._peaks]
+            stages += sorted(stage for stage in self._peaks if stage not in STAGES)
+            lines = [
+                f"{stage:<6} 최대 {self._peaks[stage] / 1048576:8.1f} MB ({self._counts[stage]}회)"
+                for stage in stages
+            ]
+            overall_peak = self._overall_peak
+
+        if tracemalloc.is_tracing():
+            overall_peak = max(overall_peak, tracemalloc.get_traced_memory()[1])
+            lines.append(f"전체   최대 {overall_peak / 1048576:8.1f} MB (tracemalloc)")
+        if resource is not None:
+            # Linux에서 ru_maxrss는 KB 단위
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            lines.append(f"RSS    최대 {max_rss / 1024:8.1f} MB")
+        return lines
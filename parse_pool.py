@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""검색 응답 파싱용 프로세스 풀.
+
+BeautifulSoup 파싱은 CPU를 쓰면서 GIL을 잡고 있어, 여러 검색어를 스레드로 돌려도 코어를 하나만 씁니다.
+ParsePool은 응답 바이트를 프로세스 풀로 보내 파싱하고 제품은 작은 튜플 레코드로 돌려받습니다.
+작은 작업은 프로세스 간 전송 비용이 파싱보다 크므로 현재 프로세스에서 바로 파싱합니다.
+
+    pool = ParsePool(workers=16)
+    parser = CompuzoneParser(parse_pool=pool)
+"""
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Sequence, Tuple
+
+from compuzone import CompuzoneParser, Product
+
+# 레코드 필드 순서 (Product 필드 중 검색 파싱이 채우는 것)
+RECORD_FIELDS = (
+    "name", "price", "specifications", "product_link", "product_no", "option_key",
+    "capacity", "gpu_series", "memory_type", "interface", "pack_size", "in_stock",
+)
+
+DEFAULT_SYNC_THRESHOLD = 32 * 1024  # 이보다 작은 작업(바이트)은 현재 프로세스에서 파싱
+CHUNKS_PER_WORKER = 4  # 워커당 나눠 줄 청크 수 (마지막 청크가 늦게 끝나는 쏠림 완화)
+
+ParseJob = Tuple[bytes, List[str], str]  # (응답 바이트, 제조사 코드, 검색어)
+ParseResult = Tuple[int, List[Product]]  # (아이템 수, 제품 목록)
+
+
+def product_to_record(product: Product) -> tuple:
+    return tuple(getattr(product, name) for name in RECORD_FIELDS)
+
+
+def product_from_record(record: tuple) -> Product:
+    return Product(**dict(zip(RECORD_FIELDS, record)))
+
+
+# 워커 프로세스마다 하나씩 만드는 파서 (요청은 하지 않으므로 세션도 만들어지지 않는다)
+_worker_parser: Optional[CompuzoneParser] = None
+
+
+def _init_worker() -> None:
+    global _worker_parser
+    _worker_parser = CompuzoneParser()
+
+
+def _parse_job(job: ParseJob) -> Tuple[int, List[tuple]]:
+    content, maker_codes, keyword = job
+    item_count, products = _worker_parser.parse_page(content, maker_codes, keyword)
+    return item_count, [product_to_record(product) for product in products]
+
+
+class ParsePool:
+    """응답 바이트를 여러 프로세스에서 파싱합니다 (작은 작업은 동기 처리)."""
+
+    def __init__(self, workers: Optional[int] = None, sync_threshold: int = DEFAULT_SYNC_THRESHOLD):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.sync_threshold = sync_threshold
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._local_parser = CompuzoneParser()
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """풀은 첫 큰 작업 때 만든다. 워커가 하나면 풀 없이 동기로 처리한다."""
+        if self.workers <= 1:
+            return None
+        with self._lock:
+            if self._executor is None:
+                # 검색 스레드가 돌고 있는 프로세스를 fork하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker
+                )
+            return self._executor
+
+    def _parse_sync(self, job: ParseJob) -> ParseResult:
+        content, maker_codes, keyword = job
+        return self._local_parser.parse_page(content, maker_codes, keyword)
+
+    def _discard_broken(self, executor: ProcessPoolExecutor, error: Exception) -> None:
+        print(f"파싱 프로세스 풀 오류, 현재 프로세스에서 파싱합니다: {error}")
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _report_failure(error: Exception) -> None:
+        # 작업 전송(pickle) 실패, 종료된 풀, 워커 안의 오류 등: 풀은 그대로 두고 이 작업만 현재 프로세스에서 파싱
+        print(f"파싱 프로세스 작업 실패, 현재 프로세스에서 파싱합니다: {error}")
+
+    def chunksize_for(self, job_count: int) -> int:
+        """작업 수에 맞춘 청크 크기: 워커마다 CHUNKS_PER_WORKER개 정도의 청크가 돌아가게 한다."""
+        return max(1, math.ceil(job_count / (self.workers * CHUNKS_PER_WORKER)))
+
+    def parse_page(self, content: bytes, maker_codes: List[str], keyword: str) -> ParseResult:
+        """응답 한 페이지를 파싱합니다. 여러 스레드에서 동시에 호출하면 각 페이지가 다른 프로세스에서 처리됩니다."""
+        job = (content, list(maker_codes), keyword)
+        executor = None if len(content) < self.sync_threshold else self._get_executor()
+        if executor is None:
+            return self._parse_sync(job)
+
+        try:
+            item_count, records = executor.submit(_parse_job, job).result()
+        except BrokenProcessPool as e:
+            self._discard_broken(executor, e)
+            return self._parse_sync(job)
+        except Exception as e:
+            self._report_failure(e)
+            return self._parse_sync(job)
+        return item_count, [product_from_record(record) for record in records]
+
+    def parse_pages(self, jobs: Sequence[ParseJob]) -> List[ParseResult]:
+        """여러 페이지를 한 번에 파싱해 입력 순서대로 반환합니다."""
+        jobs = [(content, list(maker_codes), keyword) for content, maker_codes, keyword in jobs]
+        total_bytes = sum(len(job[0]) for job in jobs)
+        executor = None if len(jobs) <= 1 or total_bytes < self.sync_threshold else self._get_executor()
+        if executor is None:
+            return [self._parse_sync(job) for job in jobs]
+
+        try:
+            results = list(executor.map(_parse_job, jobs, chunksize=self.chunksize_for(len(jobs))))
+        except BrokenProcessPool as e:
+            self._discard_broken(executor, e)
+            return [self._parse_sync(job) for job in jobs]
+        except Exception as e:
+            self._report_failure(e)
+            return [self._parse_sync(job) for job in jobs]
+        return [
+            (item_count, [product_from_record(record) for record in records])
+            for item_count, records in results
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""인기 검색어 캐시 예열.
+
+재시작 직후에는 캐시가 비어 있어 인기 검색어의 첫 사용자가 검색 페이지 방문, API 요청, 파싱을 모두 기다립니다.
+Prewarmer는 최근 조회 로그의 상위 N개 검색어(또는 설정한 목록)를 시작할 때와 주기적으로 미리 조회해
+검색 응답 캐시와 검색어별 제조사 목록 캐시를 채웁니다. 컴퓨존에 부담을 주지 않도록 초당 검색어 수를 제한합니다.
+
+    query_log = QueryLog("queries.jsonl")
+    prewarmer = Prewarmer(parser, lambda: top_keywords("queries.jsonl", 20), interval=1800)
+    prewarmer.start()
+"""
+import json
+import os
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from compuzone import SORT_PRICE_ASC, SORT_SALES, WHITESPACE_PATTERN, CompuzoneParser
+
+DEFAULT_TOP_N = 20
+DEFAULT_RATE = 0.5  # 초당 예열할 검색어 수
+DEFAULT_WINDOW = 7 * 24 * 3600  # 상위 검색어를 집계할 최근 기간 (초)
+# 예열할 정렬 순서: 제품/제조사 목록(판매량순)과 최저가(낮은 가격순)
+DEFAULT_SORT_TYPES = (SORT_SALES, SORT_PRICE_ASC)
+
+
+def _normalize(keyword: str) -> str:
+    return WHITESPACE_PATTERN.sub(' ', keyword.strip())
+
+
+class QueryLog:
+    """조회된 검색어를 JSONL로 이어 쓰는 로그 (한 줄에 {"time", "route", "keyword"})"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, route: str, keyword: str) -> None:
+        keyword = _normalize(keyword)
+        if not keyword:
+            return
+        line = json.dumps({"time": time.time(), "route": route, "keyword": keyword}, ensure_ascii=False)
+        with self._lock:
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                print(f"조회 로그 기록 실패: {e}")
+
+
+def top_keywords(path: str, n: int = DEFAULT_TOP_N, window: Optional[float] = DEFAULT_WINDOW) -> List[str]:
+    """조회 로그에서 최근 window초 동안 가장 많이 조회된 검색어 n개 (대소문자 구분 없이 집계)"""
+    if not os.path.exists(path):
+        return []
+    since = time.time() - window if window else None
+    counts: Counter = Counter()
+    spellings: Dict[str, str] = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if since is not None and entry.get("time", 0) < since:
+                continue
+            keyword = _normalize(entry.get("keyword", ""))
+            if not keyword:
+                continue
+            key = keyword.lower()
+            counts[key] += 1
+            # 가장 최근에 쓰인 표기로 조회한다
+            spellings[key] = keyword
+    return [spellings[key] for key, _ in counts.most_common(n)]
+
+
+def load_keywords(path: str) -> List[str]:
+    """검색어 목록 파일 (한 줄에 하나, # 주석)"""
+    with open(path, encoding='utf-8') as f:
+        keywords = [_normalize(line) for line in f if line.strip() and not line.lstrip().startswith('#')]
+    return list(dict.fromkeys(keywords))
+
+
+def keyword_source(keywords: Sequence[str] = (), query_log_path: Optional[str] = None,
+                   top_n: int = DEFAULT_TOP_N) -> Callable[[], List[str]]:
+    """설정한 검색어 다음에 조회 로그의 상위 검색어를 (중복 없이) 돌려주는 함수"""
+    def source() -> List[str]:
+        merged = list(keywords)
+        if query_log_path:
+            merged += top_keywords(query_log_path, top_n)
+        seen = set()
+        unique = []
+        for keyword in merged:
+            if keyword.lower() not in seen:
+                seen.add(keyword.lower())
+                unique.append(keyword)
+        return unique
+    return source
+
+
+class Prewarmer:
+    """검색어 목록을 속도 제한을 지키며 미리 조회해 파서의 캐시를 채웁니다.
+
+    start()는 바로 한 번 예열하고, interval이 있으면 그 주기로 반복합니다 (백그라운드 스레드).
+    파서에 응답 캐시(compuzone.ResponseCache)가 없으면 예열해도 남는 것이 없습니다.
+    """
+
+    def __init__(self, parser: CompuzoneParser, source: Callable[[], Iterable[str]],
+                 rate: float = DEFAULT_RATE, interval: Optional[float] = None,
+                 sort_types: Sequence[str] = DEFAULT_SORT_TYPES):
+        if parser.response_cache is None:
+            print("응답 캐시가 없는 파서는 예열해도 효과가 없습니다")
+        self.parser = parser
+        self.source = source
+        self.rate = rate
+        self.interval = interval
+        self.sort_types = tuple(sort_types)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.runs = 0
+        self.warmed = 0
+
+    def _warm_keyword(self, keyword: str) -> None:
+        # 제조사 목록 (판매량순 첫 페이지 응답도 함께 캐시된다)
+        self.parser.get_search_options(keyword)
+        for sort_type in self.sort_types:
+            if self._stop.is_set():
+                return
+            if sort_type != SORT_SALES:
+                self.parser.search_products(keyword, sort_type, [], limit=1)
+
+    def warm_once(self) -> int:
+        """모든 검색어를 한 번 예열하고 예열한 검색어 수를 반환합니다."""
+        try:
+            keywords = list(self.source())
+        except Exception as e:
+            print(f"예열 검색어 읽기 실패: {e}")
+            return 0
+
+        delay = 1.0 / self.rate if self.rate > 0 else 0.0
+        count = 0
+        started = time.monotonic()
+        for index, keyword in enumerate(keywords):
+            if index and self._stop.wait(delay):
+                break
+            try:
+                self._warm_keyword(keyword)
+            except Exception as e:
+                print(f"예열 실패 ({keyword}): {e}")
+                continue
+            count += 1
+
+        self.runs += 1
+        self.warmed += count
+        print(f"캐시 예열: {count}/{len(keywords)}개 검색어 ({time.monotonic() - started:.1f}초)")
+        return count
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.warm_once()
+            if not self.interval or self._stop.wait(self.interval):
+                return
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="prewarm", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""검색 결과 가격 이력 저장소 (SQLite).
+
+search_products 결과를 제품 번호(ProductNo) + 옵션 단위로 기록합니다.
+스냅샷은 append-only로 쌓이며, 직전 스냅샷과 비교해 가격이나 재고 상태가
+바뀐 행만 저장하므로 매일 수천 개 SKU를 추적해도 DB가 불필요하게 커지지 않습니다.
+"""
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from compuzone import Product, parse_price
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS price_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_no TEXT NOT NULL,
+    option_key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    price INTEGER,
+    price_text TEXT NOT NULL,
+    in_stock INTEGER NOT NULL,
+    keyword TEXT NOT NULL DEFAULT '',
+    captured_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_price_snapshots_key
+    ON price_snapshots (product_no, option_key, captured_at);
+CREATE INDEX IF NOT EXISTS idx_price_snapshots_time
+    ON price_snapshots (captured_at);
+CREATE TABLE IF NOT EXISTS refresh_marks (
+    name TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+# 각 (product_no, option_key)의 마지막 스냅샷 (append-only 테이블에서 최대 id)
+_LATEST_STATE_QUERY = """
+SELECT product_no, option_key, price, in_stock FROM price_snapshots
+WHERE id IN (SELECT MAX(id) FROM price_snapshots GROUP BY product_no, option_key)
+"""
+
+SnapshotKey = Tuple[str, str]
+
+
+def _key_filter(product_no: str, option_key: Optional[str]) -> Tuple[str, list]:
+    where = "product_no = ?"
+    params: list = [product_no]
+    if option_key is not None:
+        where += " AND option_key = ?"
+        params.append(option_key)
+    return where, params
+
+
+def _window_filter(product_no: str, option_key: Optional[str], since: float) -> Tuple[str, list]:
+    """since 이후의 스냅샷과, 옵션별로 since 시점에 유효하던 (직전) 스냅샷을 고르는 조건.
+
+    바뀐 경우만 기록하므로 기간 시작 전에 기록된 가격이 기간 내내 유지되었을 수 있다.
+    """
+    key_where, key_params = _key_filter(product_no, option_key)
+    where = (f"{key_where} AND (captured_at >= ? OR id IN ("
+             f"SELECT MAX(id) FROM price_snapshots WHERE {key_where} AND captured_at < ? GROUP BY option_key))")
+    return where, key_params + [since] + key_params + [since]
+
+
+def snapshot_key(product: Product) -> SnapshotKey:
+    """제품의 스냅샷 키 (ProductNo, 옵션 키)를 반환합니다 (Product.identity)."""
+    return product.identity
+
+
+class PriceHistoryStore:
+    """제품 가격 스냅샷을 SQLite에 append-only로 저장합니다."""
+
+    def __init__(self, path: str = "price_history.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        # 직전 스냅샷 상태 캐시: {(product_no, option_key): (price, in_stock)}
+        self._latest: Optional[Dict[SnapshotKey, Tuple[Optional[int], bool]]] = None
+
+    def _load_latest(self) -> Dict[SnapshotKey, Tuple[Optional[int], bool]]:
+        if self._latest is None:
+            rows = self._conn.execute(_LATEST_STATE_QUERY).fetchall()
+            self._latest = {(row[0], row[1]): (row[2], bool(row[3])) for row in rows}
+        return self._latest
+
+    def record(self, products: Iterable[Product], keyword: str = "",
+               captured_at: Optional[float] = None) -> int:
+        """가격/재고가 바뀐 제품만 하나의 트랜잭션으로 기록하고 저장된 행 수를 반환합니다."""
+        captured_at = time.time() if captured_at is None else captured_at
+
+        with self._lock:
+            latest = self._load_latest()
+            rows = []
+            changed = {}
+
+            for product in products:
+                key = snapshot_key(product)
+                price = parse_price(product.price)
+                state = (price, price is not None)
+                if latest.get(key) == state or changed.get(key) == state:
+                    continue
+                changed[key] = state
+                rows.append((key[0], key[1], product.name, price, product.price,
+                             int(state[1]), keyword, captured_at))
+
+            if not rows:
+                return 0
+
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO price_snapshots (product_no, option_key, name, price, "
+                    "price_text, in_stock, keyword, captured_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+            latest.update(changed)
+            return len(rows)
+
+    def latest_state(self, key: SnapshotKey) -> Optional[Tuple[Optional[int], bool]]:
+        """제품의 마지막 스냅샷 상태 (가격, 재고 여부). 기록된 적이 없으면 None"""
+        with self._lock:
+            return self._load_latest().get(key)
+
+    def mark_refreshed(self, name: str, refreshed_at: Optional[float] = None) -> None:
+        """이름 붙인 갱신 작업(예: watchlist 항목)의 마지막 갱신 시각을 기록합니다."""
+        refreshed_at = time.time() if refreshed_at is None else refreshed_at
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO refresh_marks (name, refreshed_at) VALUES (?, ?)",
+                (name, refreshed_at)
+            )
+
+    def last_refreshed(self, name: str) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute("SELECT refreshed_at FROM refresh_marks WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def lowest_price(self, product_no: str, days: int = 30,
+                     option_key: Optional[str] = None) -> Optional[int]:
+        """최근 days일 동안의 최저가를 반환합니다."""
+        since = time.time() - days * 86400
+        where, params = _window_filter(product_no, option_key, since)
+        query = f"SELECT MIN(price) FROM price_snapshots WHERE {where} AND price IS NOT NULL"
+
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        return row[0] if row else None
+
+    def history(self, product_no: str, option_key: Optional[str] = None,
+                days: Optional[int] = None) -> List[Dict]:
+        """제품의 스냅샷 이력을 시간순으로 반환합니다."""
+        if days is not None:
+            where, params = _window_filter(product_no, option_key, time.time() - days * 86400)
+        else:
+            where, params = _key_filter(product_no, option_key)
+        query = ("SELECT option_key, name, price, price_text, in_stock, keyword, captured_at "
+                 f"FROM price_snapshots WHERE {where} ORDER BY captured_at, id")
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {
+                'option_key': row[0], 'name': row[1], 'price': row[2],
+                'price_text': row[3], 'in_stock': bool(row[4]),
+                'keyword': row[5], 'captured_at': row[6]
+            }
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""제품 상세 페이지 사양 보강 (선택 단계).
+
+검색 목록의 사양은 .prd_subTxt 등 일부 문구만 담고 있으므로, 필요할 때
+product_detail.htm?ProductNo=... 를 제한된 워커 풀로 동시에 가져와 전체 사양표를
+구조화된 필드로 파싱합니다. 상세 페이지는 ProductNo 단위로 긴 TTL 동안 캐시되어
+같은 SKU를 반복 검색해도 다시 요청하지 않습니다.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from compuzone import CompuzoneParser, Product, parse_html
+
+DETAIL_URL = "https://www.compuzone.co.kr/product/product_detail.htm"
+DEFAULT_DETAIL_TTL = 7 * 24 * 3600  # 상세 사양은 자주 바뀌지 않는다
+
+# 사양표를 감싸는 요소를 찾을 때 사용하는 id/class 키워드
+_SPEC_CONTAINER_PATTERN = re.compile(r'spec|detail_info|prd_detail', re.IGNORECASE)
+
+
+class DetailCache:
+    """ProductNo별 상세 사양 캐시 (TTL + 최대 개수 LRU, 스레드 안전)."""
+
+    def __init__(self, ttl: float = DEFAULT_DETAIL_TTL, max_entries: int = 5000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, product_no: str) -> Optional[Dict[str, str]]:
+        with self._lock:
+            entry = self._entries.get(product_no)
+            if entry is None:
+                return None
+            stored_at, specs = entry
+            if time.time() - stored_at > self.ttl:
+                del self._entries[product_no]
+                return None
+            self._entries.move_to_end(product_no)
+            return specs
+
+    def set(self, product_no: str, specs: Dict[str, str]) -> None:
+        with self._lock:
+            self._entries[product_no] = (time.time(), specs)
+            self._entries.move_to_end(product_no)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def parse_detail_specs(content: bytes) -> Dict[str, str]:
+    """상세 페이지 응답 바이트에서 사양표(th/td 쌍)를 {항목: 값} 형태로 추출합니다."""
+    soup = parse_html(content)
+
+    # 사양 영역이 따로 있으면 그 안의 표만 사용하고, 없으면 페이지 전체의 표를 본다
+    containers = [
+        tag for tag in soup.find_all(True)
+        if _SPEC_CONTAINER_PATTERN.search(tag.get('id', '') or '')
+        or any(_SPEC_CONTAINER_PATTERN.search(cls) for cls in tag.get('class', []))
+    ]
+    tables = []
+    for container in containers:
+        tables.extend(container.find_all('table'))
+    if not tables:
+        tables = soup.find_all('table')
+
+    specs: Dict[str, str] = {}
+    for table in tables:
+        for row in table.find_all('tr'):
+            label = None
+            for cell in row.find_all(['th', 'td'], recursive=False):
+                text = re.sub(r'\s+', ' ', cell.get_text(' ', strip=True))
+                if cell.name == 'th':
+                    label = text
+                elif label:
+                    # 한 행에 th/td 쌍이 여러 개 있는 표도 지원
+                    if text and label not in specs:
+                        specs[label] = text
+                    label = None
+    return specs
+
+
+class DetailEnricher:
+    """검색 결과 제품의 상세 사양을 동시에 가져와 Product.detail_specs에 채웁니다."""
+
+    def __init__(self, parser: CompuzoneParser, cache: Optional[DetailCache] = None,
+                 max_workers: int = 4, timeout: float = 10):
+        self.parser = parser
+        self.cache = cache if cache is not None else DetailCache()
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def fetch_specs(self, product_no: str) -> Dict[str, str]:
+        """ProductNo 하나의 상세 사양을 반환합니다 (캐시 우선)."""
+        cached = self.cache.get(product_no)
+        if cached is not None:
+            return cached
+
+        try:
+            resp = self.parser.session.get(DETAIL_URL, params={"ProductNo": product_no}, timeout=self.timeout)
+            resp.raise_for_status()
+            specs = parse_detail_specs(resp.content)
+        except Exception as e:
+            print(f"상세 사양 가져오기 실패 (ProductNo={product_no}): {e}")
+            return {}
+
+        self.cache.set(product_no, specs)
+        return specs
+
+    def enrich(self, products: Iterable[Product]) -> List[Product]:
+        """제품 목록의 detail_specs를 채워서 반환합니다. 같은 ProductNo는 한 번만 요청합니다."""
+        products = list(products)
+        # 순서를 유지하며 중복 제거 (dict 키 조회라 제품 수에 선형)
+        product_nos = list(dict.fromkeys(product.identity[0] for product in products if product.identity[0]))
+
+        if not product_nos:
+            return products
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(product_nos)))) as executor:
+            specs_by_no = dict(zip(product_nos, executor.map(self.fetch_specs, product_nos)))
+
+        for product in products:
+            specs = specs_by_no.get(product.identity[0])
+            if specs:
+                product.detail_specs = dict(specs)
+
+        return products
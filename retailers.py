@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""여러 쇼핑몰 파서를 하나의 인터페이스로 묶는 백엔드 규약과 병렬 집계기.
+
+각 쇼핑몰 파서는 RetailerBackend 규약(제조사 옵션, 제품 검색, 중복 제거 검색)을 구현하고
+register_backend()로 등록합니다. RetailerAggregator는 등록된 백엔드를 동시에 조회해
+제한 시간(deadline) 안에 도착한 결과만 모아 가격순으로 합칩니다.
+StaticBackend는 네트워크 없이 집계기를 시험할 때 쓰는 대역입니다.
+
+    aggregator = RetailerAggregator(create_backends(), deadline=3)
+    result = aggregator.search("SSD 2TB")
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Protocol, runtime_checkable
+
+from compuzone import BRACKET_BRAND_PATTERN, CompuzoneParser, Product, parse_price
+
+DEFAULT_DEADLINE = 5.0  # 초
+
+# 백엔드별 조회 상태
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+
+
+@runtime_checkable
+class RetailerBackend(Protocol):
+    """쇼핑몰 파서가 구현해야 하는 규약"""
+
+    name: str
+
+    def get_search_options(self, keyword: str) -> List[Dict[str, str]]:
+        """검색어의 제조사 옵션 목록 ([{'name': ..., 'code': ...}])"""
+        ...
+
+    def search_products(self, keyword: str, sort_type: str, maker_codes: List[str], limit: int = 5) -> List[Product]:
+        ...
+
+    def get_unique_products(self, keyword: str, maker_codes: List[str]) -> List[Product]:
+        ...
+
+
+# 등록된 백엔드 생성 함수 {이름: 생성 함수}
+_BACKEND_FACTORIES: Dict[str, Callable[[], RetailerBackend]] = {}
+_registry_lock = threading.Lock()
+
+
+def register_backend(name: str, factory: Callable[[], RetailerBackend]) -> None:
+    """백엔드 생성 함수를 등록합니다 (같은 이름이면 교체)."""
+    with _registry_lock:
+        _BACKEND_FACTORIES[name] = factory
+
+
+def unregister_backend(name: str) -> None:
+    with _registry_lock:
+        _BACKEND_FACTORIES.pop(name, None)
+
+
+def registered_backends() -> List[str]:
+    with _registry_lock:
+        return list(_BACKEND_FACTORIES)
+
+
+def create_backends(names: Optional[Iterable[str]] = None) -> List[RetailerBackend]:
+    """등록된 백엔드(기본: 전체)를 새로 만들어 반환합니다."""
+    with _registry_lock:
+        factories = dict(_BACKEND_FACTORIES)
+    names = list(factories) if names is None else list(names)
+    unknown = [name for name in names if name not in factories]
+    if unknown:
+        raise ValueError(f"등록되지 않은 백엔드: {', '.join(unknown)}")
+    return [factories[name]() for name in names]
+
+
+register_backend(CompuzoneParser.name, CompuzoneParser)
+
+
+class StaticBackend:
+    """미리 준비한 제품 목록으로 응답하는 로컬 대역 백엔드 (시험용)
+
+    검색어의 모든 단어가 제품명에 들어 있는 제품을 반환하고, 제조사 코드는 제품명의 [브랜드]와 비교합니다.
+    delay를 주면 응답 전에 그만큼 기다려 느린 쇼핑몰을 흉내 냅니다.
+    """
+
+    def __init__(self, name: str, products: Iterable[Product], delay: float = 0.0,
+                 error: Optional[Exception] = None):
+        self.name = name
+        self.products = list(products)
+        self.delay = delay
+        self.error = error
+
+    def _respond(self) -> None:
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+
+    def _matches(self, product: Product, keyword: str, maker_codes: List[str]) -> bool:
+        name = product.name.lower()
+        if not all(word in name for word in keyword.lower().split()):
+            return False
+        if maker_codes:
+            brand = BRACKET_BRAND_PATTERN.search(product.name)
+            return bool(brand) and brand.group(1) in maker_codes
+        return True
+
+    def get_search_options(self, keyword: str) -> List[Dict[str, str]]:
+        self._respond()
+        brands = []
+        for product in self.products:
+            brand = BRACKET_BRAND_PATTERN.search(product.name)
+            if brand and brand.group(1) not in brands and self._matches(product, keyword, []):
+                brands.append(brand.group(1))
+        return [{'name': brand, 'code': brand} for brand in brands]
+
+    def search_products(self, keyword: str, sort_type: str, maker_codes: List[str], limit: int = 5) -> List[Product]:
+        self._respond()
+        return [product for product in self.products if self._matches(product, keyword, maker_codes)][:limit]
+
+    def get_unique_products(self, keyword: str, maker_codes: List[str]) -> List[Product]:
+        seen = set()
+        unique = []
+        for product in self.search_products(keyword, "", maker_codes, limit=len(self.products)):
+            if product.identity not in seen:
+                seen.add(product.identity)
+                unique.append(product)
+        return unique
+
+
+@dataclass
+class RetailerOffer:
+    """집계 결과의 한 줄 (어느 쇼핑몰의 어떤 제품인지)"""
+    retailer: str
+    product: Product
+    price: Optional[int]
+
+
+@dataclass
+class BackendStatus:
+    status: str
+    elapsed: float
+    count: int = 0
+    error: str = ""
+
+
+@dataclass
+class AggregatedResult:
+    """가격순으로 합친 제품과 백엔드별 상태"""
+    offers: List[RetailerOffer] = field(default_factory=list)
+    backends: Dict[str, BackendStatus] = field(default_factory=dict)
+    options: Dict[str, List[Dict[str, str]]] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        """모든 백엔드가 제한 시간 안에 성공했는지"""
+        return all(status.status == STATUS_OK for status in self.backends.values())
+
+
+def _offer_sort_key(offer: RetailerOffer):
+    # 가격을 알 수 없는 제품(품절/가격 문의)은 뒤로
+    return (offer.price is None, offer.price or 0)
+
+
+class RetailerAggregator:
+    """여러 백엔드를 동시에 조회하고 제한 시간 안에 도착한 결과만 합칩니다.
+
+    제한 시간이 지나도 끝나지 않은 백엔드는 기다리지 않고 timeout으로 표시합니다
+    (해당 요청은 백그라운드에서 끝까지 진행된 뒤 버려집니다).
+    """
+
+    def __init__(self, backends: Iterable[RetailerBackend], deadline: float = DEFAULT_DEADLINE):
+        self.backends = list(backends)
+        self.deadline = deadline
+
+    def _gather(self, call: Callable[[RetailerBackend], list], deadline: Optional[float]):
+        """모든 백엔드에 call을 동시에 실행하고 {이름: (상태, 결과)}를 반환합니다."""
+        deadline = self.deadline if deadline is None else deadline
+        started = time.monotonic()
+        finished_at: Dict[str, float] = {}
+
+        def run(backend: RetailerBackend) -> list:
+            try:
+                return call(backend)
+            finally:
+                finished_at[backend.name] = time.monotonic() - started
+
+        executor = ThreadPoolExecutor(max_workers=max(1, len(self.backends)))
+        try:
+            futures = {executor.submit(run, backend): backend for backend in self.backends}
+            done, _ = wait(futures, timeout=deadline)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        results = {}
+        for future, backend in futures.items():
+            if future not in done:
+                results[backend.name] = (BackendStatus(STATUS_TIMEOUT, time.monotonic() - started), None)
+                continue
+            elapsed = finished_at.get(backend.name, time.monotonic() - started)
+            try:
+                value = future.result()
+            except Exception as e:
+                print(f"{backend.name} 조회 실패: {e}")
+                results[backend.name] = (BackendStatus(STATUS_ERROR, elapsed, error=str(e)), None)
+                continue
+            results[backend.name] = (BackendStatus(STATUS_OK, elapsed, count=len(value)), value)
+        return results
+
+    def search(self, keyword: str, maker_codes: Optional[Mapping[str, List[str]]] = None,
+               deadline: Optional[float] = None) -> AggregatedResult:
+        """모든 백엔드의 중복 제거 검색 결과를 가격순으로 합칩니다.
+
+        maker_codes는 백엔드별 제조사 코드 {백엔드 이름: [코드]}이며, 없는 백엔드는 전체 제조사로 검색합니다.
+        """
+        maker_codes = maker_codes or {}
+        gathered = self._gather(
+            lambda backend: backend.get_unique_products(keyword, list(maker_codes.get(backend.name, []))),
+            deadline
+        )
+
+        result = AggregatedResult()
+        for name, (status, products) in gathered.items():
+            result.backends[name] = status
+            for product in products or []:
+                result.offers.append(RetailerOffer(name, product, parse_price(product.price)))
+        result.offers.sort(key=_offer_sort_key)
+        return result
+
+    def search_options(self, keyword: str, deadline: Optional[float] = None) -> AggregatedResult:
+        """모든 백엔드의 제조사 옵션을 {백엔드 이름: 옵션 목록}으로 모읍니다."""
+        gathered = self._gather(lambda backend: backend.get_search_options(keyword), deadline)
+
+        result = AggregatedResult()
+        for name, (status, options) in gathered.items():
+            result.backends[name] = status
+            if options is not None:
+                result.options[name] = options
+        return result
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""검색 결과 내 재검색용 역색인.
+
+캐시된 검색 결과의 제품명과 사양을 토큰화해 토큰 -> 제품 위치 집합으로 색인합니다.
+"2TB만", "Gen4만" 같은 결과 내 검색을 새 요청 없이 로컬에서 바로 처리합니다.
+
+토큰화 규칙:
+- 영문/숫자는 소문자 단어 단위 ("rtx5090"은 "rtx", "5090"도 함께 색인)
+- 한글은 단어와 2글자 조각(bigram)으로 색인해 "그래픽"으로 "그래픽카드"를 찾을 수 있게 함
+- 용량은 GB 단위로 정규화 ("2TB" == "2048GB" == "2 TB")
+- PCIe 세대는 "gen4" 형태로 정규화 ("PCIe 4.0", "PCIe4", "Gen4")
+"""
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from compuzone import Product
+
+# 경계는 ASCII 영숫자로만 판단한다 (re의 \b는 한글도 \w로 보므로 "2TB정품", "Gen4만"에서 맞지 않음)
+_CAPACITY_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*(tb|gb|mb)(?![a-z0-9])')
+_PCIE_GEN_PATTERN = re.compile(r'(?:pcie|pci-e)\s*(\d)(?:\.0)?|(?<![a-z0-9])gen\s*(\d)(?![a-z0-9])')
+_WORD_PATTERN = re.compile(r'[가-힣]+|[0-9a-z]+')
+_ALNUM_SPLIT_PATTERN = re.compile(r'[a-z]+|[0-9]+')
+
+_UNIT_TO_GB = {"tb": 1024, "gb": 1, "mb": 1 / 1024}
+# 검색어에서 따로 떨어진 조사는 조건으로 쓰지 않는다 ("2TB만" -> "2TB")
+_QUERY_PARTICLES = frozenset(["만", "도", "은", "는", "이", "가", "을", "를", "의", "로", "으로"])
+
+
+def _capacity_term(number: str, unit: str) -> str:
+    size = float(number) * _UNIT_TO_GB[unit]
+    return f"cap:{size:g}gb"
+
+
+def _special_terms(text: str) -> List[str]:
+    """용량/PCIe 세대 정규화 토큰"""
+    terms = [_capacity_term(number, unit) for number, unit in _CAPACITY_PATTERN.findall(text)]
+    for match in _PCIE_GEN_PATTERN.finditer(text):
+        terms.append(f"gen{match.group(1) or match.group(2)}")
+    return terms
+
+
+def _hangul_terms(word: str) -> List[str]:
+    if len(word) == 1:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def tokenize(text: str) -> Set[str]:
+    """색인용 토큰 집합"""
+    text = text.lower()
+    tokens = set(_special_terms(text))
+
+    for word in _WORD_PATTERN.findall(text):
+        if '가' <= word[0] <= '힣':
+            tokens.add(word)
+            tokens.update(_hangul_terms(word))
+        else:
+            tokens.add(word)
+            parts = _ALNUM_SPLIT_PATTERN.findall(word)
+            if len(parts) > 1:
+                tokens.update(parts)
+
+    return tokens
+
+
+def query_terms(query: str) -> List[List[str]]:
+    """검색어를 AND로 묶인 조건 목록으로 바꿉니다.
+
+    각 조건은 [토큰] 또는 ["prefix:" 토큰] 하나로, 용량/세대 표현은 정규화 토큰 하나로 대체됩니다.
+    """
+    query = query.lower()
+    terms: List[List[str]] = [[term] for term in _special_terms(query)]
+
+    # 정규화된 표현은 원래 숫자/단위 조각으로 다시 검색하지 않는다
+    remainder = _PCIE_GEN_PATTERN.sub(' ', _CAPACITY_PATTERN.sub(' ', query))
+
+    for word in _WORD_PATTERN.findall(remainder):
+        if word in _QUERY_PARTICLES:
+            continue
+        if '가' <= word[0] <= '힣':
+            terms.extend([term] for term in _hangul_terms(word))
+        else:
+            # 영문/숫자는 접두어 검색 ("sam" -> "samsung")
+            terms.append([f"prefix:{word}"])
+
+    return terms
+
+
+class TokenIndex:
+    """제품 목록의 토큰 역색인"""
+
+    def __init__(self, products: Iterable[Product]):
+        self.products: List[Product] = list(products)
+        self._postings: Dict[str, Set[int]] = {}
+
+        for position, product in enumerate(self.products):
+            for token in tokenize(f"{product.name} {product.specifications}"):
+                self._postings.setdefault(token, set()).add(position)
+
+        # 접두어 검색용 정렬된 어휘
+        self._vocabulary = sorted(self._postings)
+
+    def _lookup(self, term: str) -> Set[int]:
+        if not term.startswith("prefix:"):
+            return self._postings.get(term, set())
+
+        prefix = term[len("prefix:"):]
+        positions: Set[int] = set()
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            positions |= self._postings[token]
+        return positions
+
+    def search_positions(self, query: str) -> Optional[Set[int]]:
+        """검색어에 맞는 제품 위치 집합. 검색어에 토큰이 없으면 None (= 전체)"""
+        conditions = query_terms(query)
+        if not conditions:
+            return None
+
+        matched: Optional[Set[int]] = None
+        # 결과가 작은 조건부터 교집합을 구해 빨리 끝낸다
+        for positions in sorted((self._lookup(term) for (term,) in conditions), key=len):
+            matched = set(positions) if matched is None else matched & positions
+            if not matched:
+                return set()
+        return matched
+
+    def search(self, query: str) -> List[Product]:
+        """검색어에 맞는 제품을 원래 순서대로 반환합니다."""
+        positions = self.search_positions(query)
+        if positions is None:
+            return list(self.products)
+        return [self.products[position] for position in sorted(positions)]
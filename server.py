@@ -0,0 +1,523 @@
+# -*- coding: utf-8 -*-
+"""컴퓨존 가격 조회 JSON HTTP 서비스 (asyncio, 외부 웹 프레임워크 없음).
+
+여러 내부 도구가 각자 스크레이퍼를 돌리지 않고 하나의 파서, 응답 캐시, 연결 풀을 함께 쓰도록
+다음 엔드포인트를 제공합니다. 모든 JSON 응답에는 ETag가 붙고 If-None-Match가 같으면 304를 돌려줍니다.
+
+    GET /makers?keyword=SSD
+    GET /products?keyword=SSD&makers=2,24&limit=20&sort=low_price&min_price=&max_price=&pages=1&details=1
+    GET /cheapest?keyword=SSD 2TB&k=10&makers=&min_price=&max_price=&details=1
+    GET /compare?keyword=SSD 2TB&makers=&deadline=5   (등록된 쇼핑몰 백엔드 동시 조회, retailers.RetailerAggregator)
+    GET /metrics   (Prometheus 텍스트 형식)
+    GET /healthz
+
+details=1이면 제품 상세 페이지의 사양표를 가져와 detail_specs에 채웁니다 (제품마다 요청 1회, 캐시됨).
+
+예시:
+    python server.py --port 8080 --workers 8 --cache-ttl 300
+"""
+import argparse
+import asyncio
+import dataclasses
+import hashlib
+import json
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from compuzone import (
+    DEFAULT_HEADERS, DEFAULT_RESPONSE_CACHE_SIZE, DEFAULT_RESPONSE_TTL, SORT_ORDERS, SORT_SALES,
+    DEFAULT_ITEM_CACHE_SIZE, CompuzoneParser, ItemParseCache, Product, ResponseCache, parse_price,
+)
+
+DEFAULT_PORT = 8080
+DEFAULT_WORKERS = 8  # 파서 호출을 실행할 스레드 수 (= 연결 풀 크기)
+MAX_LIMIT = 500  # /products, /cheapest 한 번에 반환할 최대 제품 수
+DEFAULT_DEADLINE = 5  # /compare에서 쇼핑몰 응답을 기다릴 시간 (초)
+MAX_DEADLINE = 30
+KEEPALIVE_TIMEOUT = 15  # 유휴 연결 유지 시간 (초)
+MAX_HEADERS = 100
+MAX_BODY = 64 * 1024  # 읽고 버릴 요청 본문 최대 크기 (넘으면 413 후 연결 종료)
+
+# 요청 처리 시간 히스토그램 구간 (초)
+DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+STATUS_TEXT = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error",
+}
+
+
+class BadRequest(ValueError):
+    """잘못된 쿼리 파라미터 (400)"""
+
+
+def product_to_dict(product: Product) -> Dict:
+    data = dataclasses.asdict(product)
+    data["price_value"] = parse_price(product.price)
+    return data
+
+
+class ServiceMetrics:
+    """Prometheus 텍스트 형식으로 내보내는 요청 수, 처리 시간, 캐시 적중 지표"""
+
+    def __init__(self, response_cache: Optional[ResponseCache] = None, item_cache: Optional[ItemParseCache] = None):
+        self.response_cache = response_cache
+        self.item_cache = item_cache
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, int], int] = {}
+        # {경로: ([구간별 누적 수], 합계, 개수)}
+        self._durations: Dict[str, Tuple[List[int], float, int]] = {}
+        self._shared = 0  # 진행 중인 같은 요청의 결과를 함께 받은 횟수
+        self.in_flight = 0
+
+    def observe(self, route: str, status: int, elapsed: float) -> None:
+        with self._lock:
+            self._requests[(route, status)] = self._requests.get((route, status), 0) + 1
+            buckets, total, count = self._durations.get(route, ([0] * len(DURATION_BUCKETS), 0.0, 0))
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if elapsed <= bound:
+                    buckets[i] += 1
+            self._durations[route] = (buckets, total + elapsed, count + 1)
+
+    def shared(self) -> None:
+        with self._lock:
+            self._shared += 1
+
+    def render(self) -> str:
+        lines = [
+            "# HELP compuzone_http_requests_total HTTP requests by route and status.",
+            "# TYPE compuzone_http_requests_total counter",
+        ]
+        with self._lock:
+            for (route, status), count in sorted(self._requests.items()):
+                lines.append(f'compuzone_http_requests_total{{route="{route}",status="{status}"}} {count}')
+
+            lines += [
+                "# HELP compuzone_http_request_duration_seconds HTTP request duration.",
+                "# TYPE compuzone_http_request_duration_seconds histogram",
+            ]
+            for route, (buckets, total, count) in sorted(self._durations.items()):
+                for bound, bucket_count in zip(DURATION_BUCKETS, buckets):
+                    lines.append(
+                        f'compuzone_http_request_duration_seconds_bucket{{route="{route}",le="{bound}"}} {bucket_count}'
+                    )
+                lines.append(f'compuzone_http_request_duration_seconds_bucket{{route="{route}",le="+Inf"}} {count}')
+                lines.append(f'compuzone_http_request_duration_seconds_sum{{route="{route}"}} {total:.6f}')
+                lines.append(f'compuzone_http_request_duration_seconds_count{{route="{route}"}} {count}')
+
+            lines += [
+                "# HELP compuzone_shared_requests_total Requests answered by joining an identical in-flight request.",
+                "# TYPE compuzone_shared_requests_total counter",
+                f"compuzone_shared_requests_total {self._shared}",
+                "# HELP compuzone_http_in_flight Requests currently being handled.",
+                "# TYPE compuzone_http_in_flight gauge",
+                f"compuzone_http_in_flight {self.in_flight}",
+            ]
+
+        cache = self.response_cache
+        if cache is not None:
+            lines += [
+                "# HELP compuzone_response_cache_hits_total Search API responses served from the cache.",
+                "# TYPE compuzone_response_cache_hits_total counter",
+                f"compuzone_response_cache_hits_total {cache.hits}",
+                "# HELP compuzone_response_cache_misses_total Search API responses fetched from Compuzone.",
+                "# TYPE compuzone_response_cache_misses_total counter",
+                f"compuzone_response_cache_misses_total {cache.misses}",
+                "# HELP compuzone_response_cache_backing_hits_total Cache hits served from the disk tier.",
+                "# TYPE compuzone_response_cache_backing_hits_total counter",
+                f"compuzone_response_cache_backing_hits_total {cache.backing_hits}",
+                "# HELP compuzone_response_cache_entries Search API responses currently cached.",
+                "# TYPE compuzone_response_cache_entries gauge",
+                f"compuzone_response_cache_entries {len(cache)}",
+            ]
+        item_cache = self.item_cache
+        if item_cache is not None:
+            lines += [
+                "# HELP compuzone_item_cache_hits_total Product items reused without re-parsing.",
+                "# TYPE compuzone_item_cache_hits_total counter",
+                f"compuzone_item_cache_hits_total {item_cache.hits}",
+                "# HELP compuzone_item_cache_misses_total Product items parsed because they were new or changed.",
+                "# TYPE compuzone_item_cache_misses_total counter",
+                f"compuzone_item_cache_misses_total {item_cache.misses}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+def make_session(pool_size: int):
+    """스레드 수만큼 연결을 유지하는 requests.Session (모든 요청이 함께 사용)"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _query_text(query: Dict[str, List[str]], name: str, default: str = "") -> str:
+    values = query.get(name)
+    return values[-1].strip() if values else default
+
+
+def _query_int(query: Dict[str, List[str]], name: str, default: Optional[int] = None,
+               minimum: int = 0, maximum: Optional[int] = None) -> Optional[int]:
+    text = _query_text(query, name)
+    if not text:
+        return default
+    try:
+        value = int(text)
+    except ValueError:
+        raise BadRequest(f"{name}는 정수여야 합니다: {text}")
+    if value < minimum:
+        raise BadRequest(f"{name}는 {minimum} 이상이어야 합니다")
+    return min(value, maximum) if maximum is not None else value
+
+
+def _query_flag(query: Dict[str, List[str]], name: str) -> bool:
+    return _query_text(query, name).lower() in ("1", "true", "yes")
+
+
+def _query_codes(query: Dict[str, List[str]], name: str) -> List[str]:
+    codes = []
+    for value in query.get(name, []):
+        codes.extend(code.strip() for code in value.split(',') if code.strip())
+    return codes
+
+
+class CompuzoneService:
+    """엔드포인트 처리. 파서 호출은 스레드 풀에서 실행하고, 진행 중인 같은 요청은 결과를 함께 받습니다."""
+
+    def __init__(self, parser: CompuzoneParser, workers: int = DEFAULT_WORKERS,
+                 max_age: int = DEFAULT_RESPONSE_TTL, query_log=None, retailers: Optional[List] = None):
+        from retailers import RetailerAggregator
+
+        self.parser = parser
+        # /compare: 공유 파서(컴퓨존)와 추가 쇼핑몰 백엔드(retailers.RetailerBackend)를 동시에 조회
+        self.aggregator = RetailerAggregator([parser] + list(retailers or []))
+        # 조회된 검색어 로그 (prewarm.QueryLog, 선택 사항). 예열할 인기 검색어를 고르는 데 쓴다
+        self.query_log = query_log
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="compuzone")
+        self.max_age = max_age
+        self.metrics = ServiceMetrics(parser.response_cache, parser.item_cache)
+        self._in_flight: Dict[tuple, asyncio.Future] = {}
+        # details=1 요청에서 처음 쓸 때 만든다 (product_detail.DetailEnricher)
+        self._detail_enricher = None
+        self._detail_lock = threading.Lock()
+        self.routes = {
+            "/makers": self.makers,
+            "/products": self.products,
+            "/cheapest": self.cheapest,
+            "/compare": self.compare,
+        }
+
+    async def _run(self, key: tuple, func, *args, **kwargs):
+        """같은 키의 요청이 진행 중이면 새로 실행하지 않고 그 결과를 기다린다."""
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.metrics.shared()
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, lambda: func(*args, **kwargs))
+        self._in_flight[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def detail_enricher(self):
+        with self._detail_lock:
+            if self._detail_enricher is None:
+                from product_detail import DetailEnricher
+                self._detail_enricher = DetailEnricher(self.parser)
+            return self._detail_enricher
+
+    def _search_call(self, func, details: bool):
+        """details면 검색 결과 제품의 상세 사양까지 채우는 호출로 감싼다."""
+        if not details:
+            return func
+
+        def call(*args, **kwargs):
+            return self.detail_enricher().enrich(func(*args, **kwargs))
+        return call
+
+    def _keyword(self, query: Dict[str, List[str]], route: str) -> str:
+        keyword = _query_text(query, "keyword")
+        if not keyword:
+            raise BadRequest("keyword가 필요합니다")
+        if self.query_log is not None:
+            self.query_log.record(route, keyword)
+        return keyword
+
+    async def makers(self, query: Dict[str, List[str]]) -> Dict:
+        keyword = self._keyword(query, "/makers")
+        makers = await self._run(("makers", keyword), self.parser.get_search_options, keyword)
+        return {"keyword": keyword, "makers": makers}
+
+    async def products(self, query: Dict[str, List[str]]) -> Dict:
+        keyword = self._keyword(query, "/products")
+        maker_codes = _query_codes(query, "makers")
+        limit = _query_int(query, "limit", 10, minimum=1, maximum=MAX_LIMIT)
+        sort_type = _query_text(query, "sort", SORT_SALES)
+        if sort_type not in SORT_ORDERS:
+            raise BadRequest(f"sort는 {', '.join(SORT_ORDERS)} 중 하나여야 합니다")
+        min_price = _query_int(query, "min_price")
+        max_price = _query_int(query, "max_price")
+        pages = _query_int(query, "pages", 1, minimum=1, maximum=10)
+        details = _query_flag(query, "details")
+
+        key = ("products", keyword, tuple(maker_codes), limit, sort_type, min_price, max_price, pages, details)
+        products = await self._run(key, self._search_call(self.parser.search_products, details), keyword,
+                                   sort_type, maker_codes, limit=limit, min_price=min_price, max_price=max_price,
+                                   pages=pages)
+        return {"keyword": keyword, "count": len(products), "products": [product_to_dict(p) for p in products]}
+
+    async def cheapest(self, query: Dict[str, List[str]]) -> Dict:
+        keyword = self._keyword(query, "/cheapest")
+        maker_codes = _query_codes(query, "makers")
+        k = _query_int(query, "k", 10, minimum=1, maximum=MAX_LIMIT)
+        min_price = _query_int(query, "min_price")
+        max_price = _query_int(query, "max_price")
+        details = _query_flag(query, "details")
+
+        key = ("cheapest", keyword, tuple(maker_codes), k, min_price, max_price, details)
+        products = await self._run(key, self._search_call(self.parser.cheapest, details), keyword, k, maker_codes,
+                                   min_price=min_price, max_price=max_price)
+        return {"keyword": keyword, "count": len(products), "products": [product_to_dict(p) for p in products]}
+
+    async def compare(self, query: Dict[str, List[str]]) -> Dict:
+        keyword = self._keyword(query, "/compare")
+        # makers는 컴퓨존 제조사 코드 (다른 쇼핑몰은 전체 제조사로 검색)
+        maker_codes = {self.parser.name: _query_codes(query, "makers")}
+        deadline = _query_int(query, "deadline", DEFAULT_DEADLINE, minimum=1, maximum=MAX_DEADLINE)
+
+        key = ("compare", keyword, tuple(maker_codes[self.parser.name]), deadline)
+        result = await self._run(key, self.aggregator.search, keyword, maker_codes, deadline=deadline)
+        return {
+            "keyword": keyword,
+            "complete": result.complete,
+            "backends": {name: dataclasses.asdict(status) for name, status in result.backends.items()},
+            "count": len(result.offers),
+            "offers": [
+                {"retailer": offer.retailer, "price": offer.price, "product": product_to_dict(offer.product)}
+                for offer in result.offers
+            ],
+        }
+
+    async def dispatch(self, method: str, target: str, headers: Dict[str, str]) -> Tuple[int, bytes, Dict[str, str]]:
+        """(상태 코드, 본문, 추가 헤더)를 반환합니다."""
+        url = urllib.parse.urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+
+        if method not in ("GET", "HEAD"):
+            return self._json(405, {"error": "GET만 지원합니다"})
+        if path == "/healthz":
+            return self._json(200, {"status": "ok"})
+        if path == "/metrics":
+            body = self.metrics.render().encode('utf-8')
+            return 200, body, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
+        handler = self.routes.get(path)
+        if handler is None:
+            return self._json(404, {"error": f"알 수 없는 경로: {path}"})
+
+        query = urllib.parse.parse_qs(url.query)
+        try:
+            payload = await handler(query)
+        except BadRequest as e:
+            return self._json(400, {"error": str(e)})
+        except Exception as e:
+            print(f"요청 처리 실패 ({target}): {e}", file=sys.stderr)
+            return self._json(500, {"error": "내부 오류"})
+
+        status, body, extra = self._json(200, payload)
+        etag = extra["ETag"]
+        extra["Cache-Control"] = f"max-age={self.max_age}"
+        if etag in [tag.strip() for tag in headers.get("if-none-match", "").split(',')]:
+            return 304, b"", {"ETag": etag, "Cache-Control": extra["Cache-Control"]}
+        return status, body, extra
+
+    @staticmethod
+    def _json(status: int, payload: Dict) -> Tuple[int, bytes, Dict[str, str]]:
+        body = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+        return status, body, {"Content-Type": "application/json; charset=utf-8", "ETag": etag}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """HTTP/1.1 연결 하나를 처리합니다 (keep-alive 지원).
+
+        요청 본문은 쓰지 않지만 다음 요청과 섞이지 않도록 Content-Length만큼 읽어 버립니다.
+        chunked 본문은 411, MAX_BODY보다 큰 본문은 413으로 응답하고 연결을 닫습니다.
+        """
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._write(writer, *self._json(400, {"error": "잘못된 요청"}), keep_alive=False)
+                    break
+
+                headers = {}
+                for _ in range(MAX_HEADERS):
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                rejected = await self._discard_body(reader, headers)
+                if rejected is not None:
+                    await self._write(writer, *rejected, keep_alive=False)
+                    break
+
+                started = time.monotonic()
+                self.metrics.in_flight += 1
+                try:
+                    status, body, extra = await self.dispatch(method, target, headers)
+                finally:
+                    self.metrics.in_flight -= 1
+                route = urllib.parse.urlsplit(target).path.rstrip('/') or '/'
+                route = route if route in self.routes or route in ("/metrics", "/healthz") else "other"
+                self.metrics.observe(route, status, time.monotonic() - started)
+
+                await self._write(writer, status, body, extra, keep_alive, head=method == "HEAD")
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _discard_body(self, reader: asyncio.StreamReader,
+                            headers: Dict[str, str]) -> Optional[Tuple[int, bytes, Dict[str, str]]]:
+        """요청 본문을 읽어 버립니다. 받을 수 없는 본문이면 돌려줄 오류 응답을 반환합니다."""
+        if "transfer-encoding" in headers:
+            return self._json(411, {"error": "Content-Length가 필요합니다 (chunked 본문은 지원하지 않음)"})
+        length_text = headers.get("content-length")
+        if not length_text:
+            return None
+        try:
+            length = int(length_text)
+        except ValueError:
+            length = -1
+        if length < 0:
+            return self._json(400, {"error": f"잘못된 Content-Length: {length_text}"})
+        if length > MAX_BODY:
+            return self._json(413, {"error": f"요청 본문은 {MAX_BODY}바이트까지만 받습니다"})
+        if length:
+            await reader.readexactly(length)
+        return None
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, status: int, body: bytes, headers: Dict[str, str],
+                     keep_alive: bool, head: bool = False) -> None:
+        """응답을 씁니다. HEAD면 GET과 같은 헤더(Content-Length 포함)를 보내고 본문은 보내지 않는다."""
+        lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        lines.append(f"Content-Length: {len(body)}")
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + (b"" if head else body))
+        await writer.drain()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def serve(service: CompuzoneService, host: str, port: int) -> None:
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"컴퓨존 API 서비스 시작: {addresses}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="컴퓨존 가격 조회 JSON HTTP 서비스")
+    arg_parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    arg_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="포트")
+    arg_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                            help="동시에 실행할 파서 호출 수 (= 연결 풀 크기)")
+    arg_parser.add_argument("--cache-ttl", type=int, default=DEFAULT_RESPONSE_TTL,
+                            help="검색 API 응답 캐시 유지 시간 (초)")
+    arg_parser.add_argument("--cache-size", type=int, default=DEFAULT_RESPONSE_CACHE_SIZE,
+                            help="메모리에 보관할 최대 응답 수")
+    arg_parser.add_argument("--item-cache-size", type=int, default=DEFAULT_ITEM_CACHE_SIZE,
+                            help="파싱 결과를 재사용할 최대 제품 아이템 수 (0: 매번 전체 파싱)")
+    arg_parser.add_argument("--disk-cache", metavar="DIR",
+                            help="검색 응답 디스크 캐시 디렉터리 (재시작 후에도 유지, 여러 프로세스 공유)")
+    arg_parser.add_argument("--disk-cache-mb", type=int, default=512, help="디스크 캐시 크기 예산 (MB, 압축 후)")
+    arg_parser.add_argument("--disk-cache-ttl", type=int, default=6 * 3600, help="디스크 캐시 응답 유지 시간 (초)")
+    arg_parser.add_argument("--retailers", default="",
+                            help="/compare에서 컴퓨존과 함께 조회할 등록된 쇼핑몰 백엔드 (쉼표로 구분)")
+    arg_parser.add_argument("--query-log", help="조회된 검색어를 기록할 JSONL 파일 (예열 대상 선정용)")
+    arg_parser.add_argument("--prewarm-keywords", help="시작할 때 미리 조회할 검색어 파일 (한 줄에 하나)")
+    arg_parser.add_argument("--prewarm-top", type=int, default=0,
+                            help="조회 로그에서 미리 조회할 상위 검색어 수 (0: 사용 안 함)")
+    arg_parser.add_argument("--prewarm-interval", type=int, default=0,
+                            help="예열 반복 주기 (초, 0: 시작할 때 한 번만)")
+    arg_parser.add_argument("--prewarm-rate", type=float, default=0.5, help="초당 예열할 검색어 수")
+    args = arg_parser.parse_args(argv)
+
+    # 컴퓨존은 서비스의 공유 파서를 그대로 쓴다
+    retailer_names = [name.strip() for name in args.retailers.split(',') if name.strip()]
+    retailer_names = [name for name in retailer_names if name != CompuzoneParser.name]
+    retailers = None
+    if retailer_names:
+        from retailers import create_backends
+        try:
+            retailers = create_backends(retailer_names)
+        except ValueError as e:
+            arg_parser.error(str(e))
+
+    backing = None
+    if args.disk_cache:
+        from disk_cache import DiskResponseCache
+        backing = DiskResponseCache(args.disk_cache, max_bytes=args.disk_cache_mb * 1024 * 1024,
+                                    ttl=args.disk_cache_ttl)
+    response_cache = ResponseCache(ttl=args.cache_ttl, max_entries=args.cache_size, backing=backing)
+    item_cache = ItemParseCache(args.item_cache_size) if args.item_cache_size > 0 else None
+    parser = CompuzoneParser(response_cache=response_cache, item_cache=item_cache)
+    parser.session = make_session(max(1, args.workers))
+    query_log = prewarmer = None
+    if args.query_log or args.prewarm_keywords:
+        import prewarm
+        query_log = prewarm.QueryLog(args.query_log) if args.query_log else None
+        keywords = prewarm.load_keywords(args.prewarm_keywords) if args.prewarm_keywords else []
+        log_path = args.query_log if args.prewarm_top > 0 else None
+        if keywords or log_path:
+            source = prewarm.keyword_source(keywords, log_path, args.prewarm_top)
+            prewarmer = prewarm.Prewarmer(parser, source, rate=args.prewarm_rate,
+                                          interval=args.prewarm_interval or None)
+            prewarmer.start()
+
+    service = CompuzoneService(parser, workers=args.workers, max_age=args.cache_ttl, query_log=query_log,
+                               retailers=retailers)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if prewarmer is not None:
+            prewarmer.stop(timeout=1)
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
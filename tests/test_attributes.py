@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from compuzone import extract_attributes
+
+
+@pytest.mark.parametrize("name, capacity", [
+    ("[삼성전자] 870 EVO 2TB정품", "2TB"),
+    ("[WD] SN850X 1TB (병행수입)", "1TB"),
+    ("[SK하이닉스] Platinum P41 500GB벌크", "500GB"),
+    ("[SEAGATE] IronWolf 12TB", "12TB"),
+])
+def test_capacity_before_hangul(name, capacity):
+    assert extract_attributes(name, "")["capacity"] == capacity
+
+
+@pytest.mark.parametrize("name, series", [
+    ("[MSI] 지포스RTX 5070 게이밍", "RTX 5070"),
+    ("[SAPPHIRE] 라데온 RX9070XT 퓨어", "RX 9070"),
+    ("[ASUS] TUF RTX5070Ti OC", "RTX 5070"),
+    ("[GIGABYTE] RTX 4070 SUPER 윈드포스", "RTX 4070"),
+    ("[ZOTAC] RTX 4080SUPER", "RTX 4080"),
+    ("[INTEL] 아크ARC B580 리미티드", "ARC B580"),
+])
+def test_gpu_series_glued_forms(name, series):
+    assert extract_attributes(name, "")["gpu_series"] == series
+
+
+def test_gpu_series_rejects_longer_model_numbers():
+    assert extract_attributes("RTX50700", "")["gpu_series"] == ""
+
+
+def test_memory_type_and_interface_after_hangul():
+    attributes = extract_attributes("[MSI] 그래픽카드", "메모리GDDR7 / 인터페이스PCIe5.0")
+    assert attributes["memory_type"] == "GDDR7"
+    assert attributes["interface"] == "PCIe 5.0"
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+import os
+import sqlite3
+import time
+
+from disk_cache import DiskResponseCache
+
+
+def _query(cache, sql, *params):
+    with sqlite3.connect(cache.index_path) as conn:
+        return conn.execute(sql, params).fetchone()
+
+
+def _meta_total(cache):
+    return _query(cache, "SELECT value FROM meta WHERE name = 'total_size'")[0]
+
+
+def _digest(cache, key):
+    return _query(cache, "SELECT digest FROM entries WHERE key = ?", key)[0]
+
+
+def _blob_files(cache):
+    return sorted(name for _, _, names in os.walk(cache.blob_dir) for name in names)
+
+
+def test_put_get_and_dedupe(tmp_path):
+    cache = DiskResponseCache(str(tmp_path))
+    body = "검색 결과".encode('utf-8') * 100
+    cache.put("a", body)
+    cache.put("b", body)
+
+    assert cache.get("a")[1] == body
+    keys, blobs, size, raw_size = cache.stats()
+    assert (keys, blobs, raw_size) == (2, 1, len(body))
+    assert len(_blob_files(cache)) == 1
+    assert _meta_total(cache) == size
+    cache.close()
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = DiskResponseCache(str(tmp_path), ttl=60)
+    cache.put("a", b"x" * 100, stored_at=time.time() - 61)
+    assert cache.get("a") is None
+    cache.close()
+
+
+def test_replaced_key_drops_orphaned_blob(tmp_path):
+    cache = DiskResponseCache(str(tmp_path))
+    cache.put("a", b"old" * 100)
+    cache.put("a", b"new" * 100)
+
+    assert cache.get("a")[1] == b"new" * 100
+    assert cache.stats()[:2] == (1, 1)
+    assert _blob_files(cache) == [_digest(cache, "a")]
+    assert _meta_total(cache) == cache.stats()[2]
+    cache.close()
+
+
+def test_corrupt_blob_is_a_miss_and_removed(tmp_path):
+    cache = DiskResponseCache(str(tmp_path))
+    cache.put("a", b"x" * 1000)
+    cache.put("b", b"y" * 1000)
+    path = cache._blob_path(_digest(cache, "a"))
+    with open(path, 'wb') as f:
+        f.write(b"not compressed")
+
+    assert cache.get("a") is None
+    assert not os.path.exists(path)
+    assert cache.stats()[:2] == (1, 1)
+    assert _meta_total(cache) == cache.stats()[2]
+
+    # 다시 저장하면 정상
+    cache.put("a", b"x" * 1000)
+    assert cache.get("a")[1] == b"x" * 1000
+    cache.close()
+
+
+def test_missing_blob_file_is_rewritten_on_put(tmp_path):
+    cache = DiskResponseCache(str(tmp_path))
+    cache.put("a", b"x" * 1000)
+    size = _meta_total(cache)
+    os.remove(cache._blob_path(_digest(cache, "a")))
+
+    cache.put("b", b"x" * 1000)
+    assert cache.get("a")[1] == b"x" * 1000
+    assert _meta_total(cache) == size
+    cache.close()
+
+
+def test_eviction_keeps_total_under_budget(tmp_path):
+    cache = DiskResponseCache(str(tmp_path), max_bytes=10000)
+    now = time.time()
+    for i in range(20):
+        # 압축되지 않는 본문, 오래된 것부터
+        cache.put(f"k{i}", os.urandom(1000), stored_at=now - 20 + i)
+
+    keys, blobs, size, _ = cache.stats()
+    assert size <= 10000
+    assert _meta_total(cache) == size
+    assert len(_blob_files(cache)) == blobs == keys
+    assert cache.get("k0") is None
+    assert cache.get("k19") is not None
+    cache.close()
+
+
+def test_eviction_purges_expired_entries_first(tmp_path):
+    cache = DiskResponseCache(str(tmp_path), max_bytes=5000, ttl=60)
+    cache.put("old", os.urandom(3000), stored_at=time.time() - 120)
+    cache.put("new", os.urandom(3000))
+
+    assert cache.get("new") is not None
+    assert cache.stats()[:2] == (1, 1)
+    assert _meta_total(cache) == cache.stats()[2]
+    cache.close()
+
+
+def test_total_is_filled_for_index_without_meta_row(tmp_path):
+    cache = DiskResponseCache(str(tmp_path))
+    cache.put("a", b"x" * 1000)
+    cache.put("b", b"y" * 1000)
+    size = cache.stats()[2]
+    cache.close()
+    with sqlite3.connect(os.path.join(str(tmp_path), "index.sqlite")) as conn:
+        conn.execute("DELETE FROM meta")
+
+    reopened = DiskResponseCache(str(tmp_path))
+    assert _meta_total(reopened) == size
+    reopened.close()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from compuzone import CompuzoneParser, _ItemFields, _item_price_floor, item_selector, parse_html, parse_price
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES = ["search_page.html", "search_page_options.html"]
+
+# _ItemFields 이전 파서가 쓰던 선택자 (가격은 이 순서로 처음 찾은 태그)
+PRICE_SELECTORS = [".prd_price .number", ".prd_price .price", ".price_sect .number", ".price .number", ".prd_price"]
+
+
+def _read(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+def _items(name):
+    return item_selector().select(parse_html(_read(name)))
+
+
+def _select_price(item):
+    for selector in PRICE_SELECTORS:
+        tag = item.select_one(selector)
+        if tag is not None:
+            return tag
+    return None
+
+
+def _same(tags, expected):
+    return [id(tag) for tag in tags] == [id(tag) for tag in expected]
+
+
+@pytest.mark.parametrize("page", PAGES)
+def test_walker_matches_select_one(page):
+    items = _items(page)
+    assert items
+    for item in items:
+        fields = _ItemFields(item)
+        assert fields.name_tag is item.select_one(".prd_info_name.prdTxt, .prd_info_name")
+        assert fields.has_option_wrap == (item.select_one(".prd_option_wrap") is not None)
+        assert fields.sub_txt is item.select_one(".prd_subTxt")
+        assert fields.info is item.select_one(".prd_info")
+        assert fields.item_price_tag() is _select_price(item)
+
+        assert _same([option.tag for option in fields.options], item.select(".prd_option"))
+        for option in fields.options:
+            assert option.op_name is option.tag.select_one(".op_name")
+            assert option.opt_name is option.tag.select_one(".opt_name")
+            assert option.list_area is option.tag.select_one(".op_list_area")
+            assert option.price is option.tag.select_one(".op_price .f_black, .op_price span")
+
+            expected = option.list_area.select(".op_list") if option.list_area is not None else []
+            assert _same([sub_option.tag for sub_option in option.sub_options], expected)
+            for sub_option in option.sub_options:
+                assert sub_option.opt_name is sub_option.tag.select_one(".opt_name")
+                assert sub_option.product_no is sub_option.tag.select_one(".SelGroupProductNo")
+                assert sub_option.price is sub_option.tag.select_one(".op_price .f_black")
+
+
+@pytest.mark.parametrize("page", PAGES)
+def test_price_floor_is_not_above_any_product_price(page):
+    parser = CompuzoneParser()
+    for item in _items(page):
+        floor = _item_price_floor(_ItemFields(item))
+        prices = [parse_price(product.price) for product in parser._parse_product_item_with_options(item, [], "x")]
+        prices = [price for price in prices if price is not None]
+        if floor is None:
+            assert not prices
+        else:
+            assert prices and floor <= min(prices)
+
+
+def test_option_items_parse_to_one_product_per_option():
+    _, products = CompuzoneParser().parse_page(_read("search_page.html"), [], "x")
+    by_no = {product.product_no: product for product in products}
+
+    # 세부 옵션(.op_list)은 SelGroupProductNo로, 옵션 가격은 .op_price에서
+    assert by_no["2003"].price == "159,000원"
+    assert by_no["2004"].pack_size == 5
+    assert not by_no["2005"].in_stock
+    assert [product.option_key for product in products if product.product_no == "3001"] == [
+        "1TB (MZ-V9P1T0BW)", "2TB (MZ-V9P2T0BW)", "4TB (MZ-V9P4T0BW)"
+    ]
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from compuzone import CompuzoneParser, ItemParseCache, split_item_fragments
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES = ["search_page.html", "search_page_options.html"]
+
+
+def _read(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("page, count", [("search_page.html", 4), ("search_page_options.html", 3)])
+def test_fragments_end_at_item_closing_tag(page, count):
+    fragments = split_item_fragments(_read(page))
+    assert len(fragments) == count
+    for fragment in fragments:
+        assert fragment.startswith(b'<li class="li-obj">')
+        assert fragment.endswith(b"</li>")
+
+
+def test_nested_list_stays_in_its_item():
+    # 두 번째 아이템은 옵션 목록(ul > li.prd_option)을 품고 있다
+    fragments = split_item_fragments(_read("search_page_options.html"))
+    assert fragments[1].count(b'class="prd_option"') == 3
+    assert b"[MSI]" not in fragments[1]
+
+
+def test_footer_change_keeps_last_fragment():
+    content = _read("search_page.html")
+    changed = content.replace(b"</ul></div>", b'</ul><div class="paging">2 3 4</div></div>')
+    assert changed != content
+    assert split_item_fragments(changed) == split_item_fragments(content)
+
+
+def test_omitted_closing_li_ends_at_list_end():
+    content = (b'<ul><li class="li-obj">A<li class="li-obj">B<ul><li>x</li></ul></ul>'
+               b'<div class="paging">1</div>')
+    assert split_item_fragments(content) == [b'<li class="li-obj">A', b'<li class="li-obj">B<ul><li>x</li></ul>']
+
+
+@pytest.mark.parametrize("page", PAGES)
+@pytest.mark.parametrize("keyword, maker_codes", [("x", []), ("ssd 4TB", []), ("hdd 8TB", ["SEAGATE"])])
+def test_incremental_parse_matches_full_parse(page, keyword, maker_codes):
+    content = _read(page)
+    expected = CompuzoneParser().parse_page(content, maker_codes, keyword)
+    parser = CompuzoneParser(item_cache=ItemParseCache())
+
+    assert parser.parse_page(content, maker_codes, keyword) == expected
+    # 두 번째는 모든 조각을 캐시에서
+    assert parser.parse_page(content, maker_codes, keyword) == expected
+    assert parser.item_cache.hits == expected[0]
+
+
+def test_only_changed_item_is_reparsed():
+    content = _read("search_page.html")
+    parser = CompuzoneParser(item_cache=ItemParseCache())
+    parser.parse_page(content, [], "x")
+
+    changed = content.replace(b"3,990,000", b"3,890,000")
+    count, products = parser.parse_page(changed, [], "x")
+    assert (count, products) == CompuzoneParser().parse_page(changed, [], "x")
+    assert products[0].price == "3,890,000원"
+    assert (parser.item_cache.hits, parser.item_cache.misses) == (3, 5)
+
+
+def test_cached_products_are_copies():
+    content = _read("search_page.html")
+    parser = CompuzoneParser(item_cache=ItemParseCache())
+    _, products = parser.parse_page(content, [], "x")
+    products[0].detail_specs["칩셋"] = "변경"
+
+    _, again = parser.parse_page(content, [], "x")
+    assert again[0].detail_specs == {}
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from memory_report import StageMemory
+
+
+def test_stage_peak_includes_memory_freed_before_mark():
+    probe = StageMemory()
+    probe.start()
+    try:
+        buffer = bytearray(8 * 1024 * 1024)
+        del buffer
+        probe.mark("parse")
+        probe.mark("write")
+        peaks = probe.peaks()
+    finally:
+        probe.stop()
+
+    # 단계가 끝날 때는 이미 해제되었어도 단계 동안의 최고치가 남는다
+    assert peaks["parse"] >= 8 * 1024 * 1024
+    # 다음 단계는 초기화된 최고치부터 잰다
+    assert peaks["write"] < 8 * 1024 * 1024
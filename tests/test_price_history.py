@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+import time
+
+from compuzone import Product
+from price_history import PriceHistoryStore
+
+DAY = 86400
+
+
+def _product(price: str) -> Product:
+    return Product(name="[삼성전자] 870 EVO 2TB", price=price, specifications="", product_no="1")
+
+
+def test_unchanged_price_across_window_boundary(tmp_path):
+    store = PriceHistoryStore(str(tmp_path / "history.db"))
+    now = time.time()
+    assert store.record([_product("100,000원")], captured_at=now - 40 * DAY) == 1
+    # 같은 가격은 다시 기록되지 않는다
+    assert store.record([_product("100,000원")], captured_at=now) == 0
+
+    assert store.lowest_price("1", days=30) == 100000
+    assert [row["price"] for row in store.history("1", days=30)] == [100000]
+    store.close()
+
+
+def test_window_starts_with_price_in_effect(tmp_path):
+    store = PriceHistoryStore(str(tmp_path / "history.db"))
+    now = time.time()
+    store.record([_product("150,000원")], captured_at=now - 60 * DAY)
+    store.record([_product("90,000원")], captured_at=now - 40 * DAY)
+    store.record([_product("120,000원")], captured_at=now - 10 * DAY)
+
+    # 기간 시작 시점의 가격(90,000원)은 포함하고, 그보다 오래된 가격은 제외한다
+    assert store.lowest_price("1", days=30) == 90000
+    assert [row["price"] for row in store.history("1", days=30)] == [90000, 120000]
+    assert [row["price"] for row in store.history("1")] == [150000, 90000, 120000]
+    assert store.lowest_price("2", days=30) is None
+    store.close()
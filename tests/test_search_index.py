@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from compuzone import Product
+from search_index import TokenIndex, query_terms, tokenize
+
+PRODUCTS = [
+    Product(name="[삼성전자] 870 EVO 2TB정품", price="189,000원", specifications="SATA3 / 2.5인치"),
+    Product(name="[WD] SN850X 1TB", price="129,000원", specifications="M.2 NVMe / PCIe4.0 / Gen4지원"),
+    Product(name="[SK하이닉스] P41 2TB", price="199,000원", specifications="M.2 NVMe / PCIe 4.0"),
+]
+
+
+def test_hangul_suffixed_capacity_and_generation_are_tokenized():
+    assert "cap:2048gb" in tokenize("870 EVO 2TB정품")
+    assert "gen4" in tokenize("Gen4지원")
+    assert "cap:1024gb" in tokenize("1TB")
+
+
+def test_hangul_suffixed_queries():
+    index = TokenIndex(PRODUCTS)
+    assert [p.name for p in index.search("2TB만")] == [PRODUCTS[0].name, PRODUCTS[2].name]
+    assert [p.name for p in index.search("Gen4만")] == [PRODUCTS[1].name, PRODUCTS[2].name]
+    assert query_terms("2TB만") == [["cap:2048gb"]]
+
+
+def test_capacity_normalization():
+    index = TokenIndex(PRODUCTS)
+    assert index.search("2048GB") == index.search("2 TB")
+    assert index.search("삼성") == [PRODUCTS[0]]
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""관심 상품(watchlist) 주기 갱신 및 가격 하락/재입고 감지.
+
+watchlist 항목(검색어, 제조사 코드, 용량)마다 search_products를 주기적으로 다시 실행하고,
+직전 스냅샷과 비교해 가격 하락·재입고 이벤트를 로컬 싱크(파일, 웹훅, SQLite 큐)로 보냅니다.
+요청은 갱신 주기 전체에 고르게 분산되며, 스냅샷이 아직 신선한 항목은 건너뜁니다.
+
+예시:
+    python watchlist.py watchlist.txt --events events.jsonl --interval 3600
+"""
+import json
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from compuzone import SORT_SALES, CompuzoneParser, Product, parse_price
+from price_history import SnapshotKey, snapshot_key
+
+PRICE_DROP = "price_drop"
+BACK_IN_STOCK = "back_in_stock"
+
+
+@dataclass
+class WatchlistEntry:
+    keyword: str
+    maker_codes: List[str] = field(default_factory=list)
+    capacity: str = ""
+
+    @property
+    def query(self) -> str:
+        """용량 필터는 검색어에 포함되어야 search_products가 옵션을 걸러냅니다."""
+        return f"{self.keyword} {self.capacity}".strip()
+
+    @property
+    def key(self) -> Tuple[str, Tuple[str, ...]]:
+        return self.query, tuple(sorted(self.maker_codes))
+
+
+@dataclass
+class PriceEvent:
+    kind: str
+    keyword: str
+    product_name: str
+    product_link: str
+    old_price: Optional[int]
+    new_price: Optional[int]
+    detected_at: float
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class JsonlEventSink:
+    """이벤트를 JSON Lines 파일에 추가합니다."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, event: PriceEvent) -> None:
+        line = json.dumps(event.to_dict(), ensure_ascii=False)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+
+
+class WebhookEventSink:
+    """이벤트를 웹훅 URL로 POST 합니다 (실패 시 출력만 하고 계속 진행)."""
+
+    def __init__(self, url: str, timeout: float = 5):
+        self.url = url
+        self.timeout = timeout
+
+    def emit(self, event: PriceEvent) -> None:
+        import requests
+
+        try:
+            requests.post(self.url, json=event.to_dict(), timeout=self.timeout)
+        except Exception as e:
+            print(f"웹훅 전송 실패: {e}")
+
+
+class SQLiteQueueSink:
+    """이벤트를 SQLite 큐 테이블에 쌓고, 소비자가 pop()으로 꺼내 갑니다."""
+
+    def __init__(self, path: str = "watchlist_events.db"):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS event_queue ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, "
+            "payload TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def emit(self, event: PriceEvent) -> None:
+        payload = json.dumps(event.to_dict(), ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO event_queue (kind, payload, created_at) VALUES (?, ?, ?)",
+                (event.kind, payload, event.detected_at)
+            )
+
+    def pop(self, limit: int = 100) -> List[PriceEvent]:
+        """가장 오래된 이벤트부터 꺼내고 큐에서 삭제합니다."""
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT id, payload FROM event_queue ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+            if rows:
+                self._conn.executemany("DELETE FROM event_queue WHERE id = ?",
+                                       [(row[0],) for row in rows])
+        return [PriceEvent(**json.loads(row[1])) for row in rows]
+
+
+DEFAULT_INTERVAL = 3600  # 갱신 주기 (초)
+# 스냅샷이 갱신 주기의 이 비율보다 최근이면 건너뛴다.
+# 주기와 같게 두면 검색 시간만큼 밀린 항목이 다음 주기에 신선한 것으로 보여 두 주기에 한 번만 갱신된다
+FRESHNESS_RATIO = 0.5
+
+
+class WatchlistRefresher:
+    """watchlist를 주기적으로 다시 검색하고 가격 변화 이벤트를 싱크로 보냅니다.
+
+    store(price_history.PriceHistoryStore, 기본: parser.price_history)가 있으면 직전 가격/재고 상태와
+    항목별 마지막 갱신 시각을 저장소에서 읽고 쓰므로, 재시작한 뒤에도 신선한 항목은 건너뛰고
+    첫 주기부터 변화 이벤트를 감지합니다. 저장소가 없으면 메모리에만 유지합니다.
+    max_age(초)를 주지 않으면 interval × FRESHNESS_RATIO 입니다.
+    """
+
+    def __init__(self, parser: CompuzoneParser, entries: List[WatchlistEntry],
+                 interval: float = DEFAULT_INTERVAL, sinks: Optional[list] = None,
+                 max_age: Optional[float] = None, limit: int = 50, store=None):
+        self.parser = parser
+        self.entries = list(entries)
+        self.interval = interval
+        self.sinks = sinks or []
+        # 스냅샷이 이 시간(초)보다 최근이면 다시 검색하지 않는다
+        self.max_age = interval * FRESHNESS_RATIO if max_age is None else max_age
+        self.limit = limit
+        self.store = store if store is not None else parser.price_history
+        # 저장소가 없을 때의 상태: {entry.key: (검색 시각, {snapshot_key: (가격, 재고 여부)})}
+        self._snapshots: Dict[tuple, Tuple[float, Dict[SnapshotKey, Tuple[Optional[int], bool]]]] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _mark_name(entry: WatchlistEntry) -> str:
+        return "watchlist:" + json.dumps(entry.key, ensure_ascii=False)
+
+    def last_refreshed(self, entry: WatchlistEntry) -> Optional[float]:
+        if self.store is not None:
+            return self.store.last_refreshed(self._mark_name(entry))
+        snapshot = self._snapshots.get(entry.key)
+        return snapshot[0] if snapshot else None
+
+    def is_fresh(self, entry: WatchlistEntry, now: Optional[float] = None) -> bool:
+        refreshed_at = self.last_refreshed(entry)
+        if refreshed_at is None:
+            return False
+        now = time.time() if now is None else now
+        return now - refreshed_at < self.max_age
+
+    def _previous_state(self, entry: WatchlistEntry, key: SnapshotKey) -> Optional[Tuple[Optional[int], bool]]:
+        if self.store is not None:
+            return self.store.latest_state(key)
+        snapshot = self._snapshots.get(entry.key)
+        return snapshot[1].get(key) if snapshot else None
+
+    def refresh_entry(self, entry: WatchlistEntry) -> List[PriceEvent]:
+        """항목 하나를 다시 검색하고 감지된 이벤트를 싱크로 보낸 뒤 반환합니다."""
+        products = []
+        changes = []
+        # 파서의 가격 이력 기록은 검색이 끝난 뒤에 일어나므로, 제품을 받는 동안 직전 상태를 읽어 둔다
+        for product in self.parser.iter_products(entry.query, SORT_SALES, entry.maker_codes, limit=self.limit):
+            key = snapshot_key(product)
+            price = parse_price(product.price)
+            products.append(product)
+            changes.append((product, self._previous_state(entry, key), (price, price is not None)))
+        if not products:
+            # 검색 실패나 일시적인 빈 결과로 기존 스냅샷을 덮어쓰지 않는다
+            return []
+
+        now = time.time()
+        events = []
+        for product, old_state, new_state in changes:
+            if old_state is None:
+                continue
+            event = self._detect_change(entry, product, old_state, new_state, now)
+            if event:
+                events.append(event)
+
+        if self.store is not None:
+            if self.store is not self.parser.price_history:
+                self.store.record(products, entry.query, captured_at=now)
+            self.store.mark_refreshed(self._mark_name(entry), now)
+        else:
+            self._snapshots[entry.key] = (now, {snapshot_key(p): state for p, _, state in changes})
+
+        for event in events:
+            for sink in self.sinks:
+                try:
+                    sink.emit(event)
+                except Exception as e:
+                    print(f"이벤트 전송 실패: {e}")
+
+        return events
+
+    def _detect_change(self, entry: WatchlistEntry, product: Product,
+                       old_state: Tuple[Optional[int], bool], new_state: Tuple[Optional[int], bool],
+                       now: float) -> Optional[PriceEvent]:
+        old_price, old_in_stock = old_state
+        new_price, new_in_stock = new_state
+
+        if new_in_stock and not old_in_stock:
+            kind = BACK_IN_STOCK
+        elif old_price is not None and new_price is not None and new_price < old_price:
+            kind = PRICE_DROP
+        else:
+            return None
+
+        return PriceEvent(
+            kind=kind,
+            keyword=entry.query,
+            product_name=product.name,
+            product_link=product.product_link,
+            old_price=old_price,
+            new_price=new_price,
+            detected_at=now
+        )
+
+    def run_once(self) -> List[PriceEvent]:
+        """갱신 주기 한 번: 항목마다 주기를 고르게 나눈 자리에서, 신선하지 않은 항목만 검색합니다."""
+        events = []
+        if not self.entries:
+            return events
+
+        spacing = self.interval / len(self.entries)
+        for index, entry in enumerate(self.entries):
+            # 건너뛴 항목도 자기 자리만큼 기다려야 뒤 항목들이 주기 안에 고르게 유지된다
+            if index and self._stop_event.wait(spacing):
+                break
+            if self.is_fresh(entry):
+                continue
+            try:
+                events.extend(self.refresh_entry(entry))
+            except Exception as e:
+                print(f"watchlist 갱신 실패 ({entry.query}): {e}")
+
+        return events
+
+    def run_forever(self) -> None:
+        """stop()이 호출될 때까지 현재 스레드에서 주기마다 갱신합니다."""
+        while not self._stop_event.is_set():
+            started = time.time()
+            self.run_once()
+            # 검색 시간만큼 밀린 경우에도 다음 주기는 시작 시각 기준으로 맞춘다
+            remaining = self.interval - (time.time() - started)
+            self._stop_event.wait(max(remaining, 1))
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 갱신을 시작합니다."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="watchlist-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def load_watchlist(path: str) -> List[WatchlistEntry]:
+    """watchlist 파일을 읽습니다. 한 줄에 `검색어 | 제조사 코드(쉼표 구분) | 용량`, 뒤의 두 칸은 생략 가능"""
+    entries = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = [part.strip() for part in line.split('|')]
+            keyword = parts[0]
+            maker_codes = [code.strip() for code in parts[1].split(',') if code.strip()] if len(parts) > 1 else []
+            capacity = parts[2] if len(parts) > 2 else ""
+            if keyword:
+                entries.append(WatchlistEntry(keyword, maker_codes, capacity))
+    return entries
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    from price_history import PriceHistoryStore
+
+    arg_parser = argparse.ArgumentParser(description="관심 상품 가격 하락/재입고 감시")
+    arg_parser.add_argument("watchlist", help="watchlist 파일 (한 줄에 `검색어 | 제조사 코드 | 용량`)")
+    arg_parser.add_argument("--history", default="price_history.db", help="가격 이력/갱신 상태 SQLite 파일")
+    arg_parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="갱신 주기 (초)")
+    arg_parser.add_argument("--max-age", type=float,
+                            help=f"이 시간(초)보다 최근에 갱신한 항목은 건너뜀 (기본: 주기 × {FRESHNESS_RATIO})")
+    arg_parser.add_argument("--limit", type=int, default=50, help="항목당 비교할 최대 제품 수")
+    arg_parser.add_argument("--events", help="이벤트를 기록할 JSONL 파일")
+    arg_parser.add_argument("--webhook", help="이벤트를 POST할 웹훅 URL")
+    arg_parser.add_argument("--queue", help="이벤트를 쌓을 SQLite 큐 파일")
+    arg_parser.add_argument("--once", action="store_true", help="한 주기만 (간격 없이) 실행하고 종료")
+    args = arg_parser.parse_args(argv)
+
+    entries = load_watchlist(args.watchlist)
+    sinks = []
+    if args.events:
+        sinks.append(JsonlEventSink(args.events))
+    if args.webhook:
+        sinks.append(WebhookEventSink(args.webhook))
+    if args.queue:
+        sinks.append(SQLiteQueueSink(args.queue))
+
+    with PriceHistoryStore(args.history) as store:
+        parser = CompuzoneParser(price_history=store)
+        refresher = WatchlistRefresher(parser, entries, interval=args.interval, sinks=sinks,
+                                       max_age=args.max_age, limit=args.limit)
+        print(f"watchlist {len(entries)}개 항목, 주기 {refresher.interval:.0f}초, "
+              f"신선도 기준 {refresher.max_age:.0f}초")
+        if args.once:
+            refresher.interval = 0
+            events = refresher.run_once()
+        else:
+            try:
+                refresher.run_forever()
+            except KeyboardInterrupt:
+                pass
+            events = []
+        for event in events:
+            print(f"[{event.kind}] {event.product_name}: {event.old_price} → {event.new_price}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())